@@ -11,8 +11,10 @@ from checkov.common.output.record import Record
 from checkov.common.output.report import Report
 from checkov.common.bridgecrew.check_type import CheckType
 from checkov.common.parallelizer.parallel_runner import parallel_runner
-from checkov.common.runners.base_runner import BaseRunner, filter_ignored_paths
+from checkov.common.runners.base_runner import BaseRunner
+from checkov.common.runners.file_index import find_files
 from checkov.common.util.secrets import omit_secret_value_from_checks
+from checkov.common.util.profiler import profiled, PARSE
 from checkov.runner_filter import RunnerFilter
 from checkov.common.parsers.node import DictNode
 from checkov.arm.context_parser import ContextParser
@@ -50,13 +52,7 @@ class Runner(BaseRunner):
 
         if root_folder:
             filepath_fn = lambda f: f'/{os.path.relpath(f, os.path.commonprefix((root_folder, f)))}'
-            for root, d_names, f_names in os.walk(root_folder):
-                filter_ignored_paths(root, d_names, runner_filter.excluded_paths)
-                filter_ignored_paths(root, f_names, runner_filter.excluded_paths)
-                for file in f_names:
-                    file_ending = os.path.splitext(file)[1]
-                    if file_ending in ARM_POSSIBLE_ENDINGS:
-                        files_list.append(os.path.join(root, file))
+            files_list.extend(find_files(root_folder, runner_filter.excluded_paths, file_extensions=ARM_POSSIBLE_ENDINGS))
 
         definitions, definitions_raw = get_files_definitions(files_list, filepath_fn)
 
@@ -166,6 +162,7 @@ class Runner(BaseRunner):
         return report
 
 
+@profiled(PARSE)
 def get_files_definitions(files: List[str], filepath_fn=None) \
         -> Tuple[Dict[str, DictNode], Dict[str, List[Tuple[int, str]]]]:
     results = parallel_runner.run_function(lambda f: (f, parse(f)), files)
@@ -4,7 +4,7 @@ import logging
 from copy import deepcopy
 from enum import Enum
 from pathlib import Path
-from typing import Any, TYPE_CHECKING, overload
+from typing import Any, TYPE_CHECKING, Iterable, overload
 
 from pycep.transformer import BicepElement
 from pycep.typing import (
@@ -26,6 +26,7 @@ from checkov.common.graph.graph_builder.graph_components.edge import Edge
 from checkov.common.graph.graph_builder.local_graph import LocalGraph
 from checkov.common.graph.graph_builder.utils import filter_sub_keys
 from checkov.common.util.type_forcers import force_int
+from checkov.common.util.profiler import profiled, GRAPH_BUILD
 
 if TYPE_CHECKING:
     from checkov.common.graph.graph_builder.graph_components.blocks import Block
@@ -50,6 +51,7 @@ class BicepLocalGraph(LocalGraph[BicepBlock]):
         self.definitions = definitions
         self.vertices_by_name: dict[str, int] = {}
 
+    @profiled(GRAPH_BUILD)
     def build_graph(self, render_variables: bool) -> None:
         self._create_vertices()
         logging.info(f"[BicepLocalGraph] created {len(self.vertices)} vertices")
@@ -244,8 +246,9 @@ class BicepLocalGraph(LocalGraph[BicepBlock]):
             self.out_edges[origin_vertex_index].append(edge)
             self.in_edges[dest_vertex_index].append(edge)
 
-    def update_vertices_configs(self) -> None:
-        for vertex in self.vertices:
+    def update_vertices_configs(self, vertices_indexes: Iterable[int] | None = None) -> None:
+        vertices = self.vertices if vertices_indexes is None else [self.vertices[idx] for idx in vertices_indexes]
+        for vertex in vertices:
             changed_attributes = list(vertex.changed_attributes.keys())
             changed_attributes = filter_sub_keys(changed_attributes)
             self.update_vertex_config(vertex, changed_attributes)
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import logging
-import os
 from collections.abc import Collection
 from pathlib import Path
 from typing import Any
 
-from checkov.common.runners.base_runner import filter_ignored_paths
+from checkov.common.runners.file_index import find_files
+from checkov.common.util.profiler import profiled, PARSE
 from checkov.runner_filter import RunnerFilter
 from checkov.bicep.parser import Parser
 from pycep.typing import BicepJson
@@ -41,19 +41,14 @@ def get_folder_definitions(
     root_folder: str, excluded_paths: list[str] | None
 ) -> tuple[dict[Path, BicepJson], dict[Path, list[tuple[int, str]]], list[str]]:
     files_list: set[Path] = set()
-    for root, d_names, f_names in os.walk(root_folder):
-        filter_ignored_paths(root, d_names, excluded_paths)
-        filter_ignored_paths(root, f_names, excluded_paths)
-        for file in f_names:
-            file_ending = os.path.splitext(file)[1]
-            if file_ending in BICEP_POSSIBLE_ENDINGS:
-                full_path = os.path.join(root, file)
-                files_list.add(Path(full_path))
+    for full_path in find_files(root_folder, excluded_paths, file_extensions=BICEP_POSSIBLE_ENDINGS):
+        files_list.add(Path(full_path))
     parser = Parser()
 
     return parser.get_files_definitions(files_list)
 
 
+@profiled(PARSE)
 def create_definitions(
         root_folder: str,
         files: "Collection[Path] | None" = None,
@@ -10,7 +10,8 @@ from checkov.cloudformation.context_parser import ContextParser, ENDLINE, STARTL
 from checkov.cloudformation.parser import parse, TemplateSections
 from checkov.common.parallelizer.parallel_runner import parallel_runner
 from checkov.common.parsers.node import DictNode, ListNode, StrNode
-from checkov.common.runners.base_runner import filter_ignored_paths
+from checkov.common.runners.file_index import find_files
+from checkov.common.util.profiler import profiled, PARSE
 from checkov.runner_filter import RunnerFilter
 from checkov.common.models.consts import YAML_COMMENT_MARK
 
@@ -93,15 +94,7 @@ def get_entity_value_as_string(value: Any) -> str:
 def get_folder_definitions(
         root_folder: str, excluded_paths: Optional[List[str]], out_parsing_errors: Dict[str, str] = {}
 ) -> Tuple[Dict[str, DictNode], Dict[str, List[Tuple[int, str]]]]:
-    files_list = []
-    for root, d_names, f_names in os.walk(root_folder):
-        filter_ignored_paths(root, d_names, excluded_paths)
-        filter_ignored_paths(root, f_names, excluded_paths)
-        for file in f_names:
-            file_ending = os.path.splitext(file)[1]
-            if file_ending in CF_POSSIBLE_ENDINGS:
-                files_list.append(os.path.join(root, file))
-
+    files_list = find_files(root_folder, excluded_paths, file_extensions=CF_POSSIBLE_ENDINGS)
     definitions, definitions_raw = get_files_definitions(files_list, out_parsing_errors)
     return definitions, definitions_raw
 
@@ -164,6 +157,7 @@ def build_definitions_context(
     return definitions_context
 
 
+@profiled(PARSE)
 def create_definitions(
         root_folder: str,
         files: Optional[List[str]] = None,
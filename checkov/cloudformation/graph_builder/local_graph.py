@@ -13,6 +13,7 @@ from checkov.common.parsers.node import DictNode
 from checkov.common.graph.graph_builder import Edge
 from checkov.common.graph.graph_builder.local_graph import LocalGraph
 from checkov.common.util.data_structures_utils import search_deep_keys
+from checkov.common.util.profiler import profiled, GRAPH_BUILD
 from checkov.cloudformation.graph_builder.graph_components.generic_resource_encryption import ENCRYPTION_BY_RESOURCE_TYPE
 
 
@@ -36,6 +37,7 @@ class CloudformationLocalGraph(LocalGraph):
             IntrinsicFunctions.CONDITION: self._fetch_connection_target_id
         }
 
+    @profiled(GRAPH_BUILD)
     def build_graph(self, render_variables: bool) -> None:
         self._create_vertices()
         logging.info(f"[CloudformationLocalGraph] created {len(self.vertices)} vertices")
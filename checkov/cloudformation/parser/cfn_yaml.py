@@ -6,7 +6,7 @@ import logging
 import platform
 from enum import Enum
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 from yaml import MappingNode
 from yaml import ScalarNode
@@ -223,23 +223,30 @@ def loads(yaml_string, fname=None, content_type: ContentType = None):
     return template
 
 
-def load(filename: Path, content_type: ContentType) -> Tuple[DictNode, List[Tuple[int, str]]]:
+def read_file_content(filename: Union[str, Path]) -> str:
     """
-    Load the given YAML file
+    Reads the given file and detects its encoding, if it is not UTF-8
     """
     if platform.system() == "Windows":
         try:
-            content = str(from_path(filename).best())
+            return str(from_path(filename).best())
         except UnicodeDecodeError as e:
             LOGGER.error(f"Encoding for file {filename} could not be detected or read. Please try encoding the file as UTF-8.")
             raise e
-    else:
-        file_path = filename if isinstance(filename, Path) else Path(filename)
-        try:
-            content = file_path.read_text()
-        except UnicodeDecodeError:
-            LOGGER.info(f"Encoding for file {filename} is not UTF-8, trying to detect it")
-            content = str(from_path(filename).best())
+
+    file_path = filename if isinstance(filename, Path) else Path(filename)
+    try:
+        return file_path.read_text()
+    except UnicodeDecodeError:
+        LOGGER.info(f"Encoding for file {filename} is not UTF-8, trying to detect it")
+        return str(from_path(filename).best())
+
+
+def load(filename: Path, content_type: ContentType) -> Tuple[DictNode, List[Tuple[int, str]]]:
+    """
+    Load the given YAML file
+    """
+    content = read_file_content(filename)
 
     if content_type == ContentType.CFN and "Resources" not in content:
         return {}, []
@@ -20,6 +20,8 @@ class SuppressionsIntegration(BaseIntegrationFeature):
     def __init__(self, bc_integration):
         super().__init__(bc_integration, order=1)  # must be after the policy metadata
         self.suppressions = {}
+        # lookup tables of the suppressions, which apply to this repo, see _index_suppressions()
+        self.suppressions_index = None
         self.suppressions_url = f"{self.bc_integration.api_url}/api/v1/suppressions"
 
         # bcorgname_provider_timestamp (ex: companyxyz_aws_1234567891011)
@@ -55,6 +57,7 @@ class SuppressionsIntegration(BaseIntegrationFeature):
             # group and map by policy ID
             self.suppressions = {policy_id: list(sup) for policy_id, sup in
                                  groupby(suppressions, key=lambda s: s['checkovPolicyId'])}
+            self._index_suppressions()
             logging.debug(f'Found {len(self.suppressions)} valid suppressions from the platform.')
         except Exception:
             self.integration_feature_failures = True
@@ -64,27 +67,90 @@ class SuppressionsIntegration(BaseIntegrationFeature):
         self._apply_suppressions_to_report(scan_report)
 
     def _apply_suppressions_to_report(self, scan_report: Report) -> None:
+        if self.suppressions_index is None:
+            self._index_suppressions()
 
-        # holds the checks that are still not suppressed
-        still_failed_checks = []
-        still_passed_checks = []
+        suppressed_checks = []
         for check in scan_report.failed_checks + scan_report.passed_checks:
-            relevant_suppressions = self.suppressions.get(check.check_id)
+            if check.check_id not in self.suppressions:
+                continue
 
-            applied_suppression = self._check_suppressions(check, relevant_suppressions) if relevant_suppressions else None
+            applied_suppression = self._find_suppression(check)
             if applied_suppression:
                 check.check_result = {
                     'result': CheckResult.SKIPPED,
                     'suppress_comment': applied_suppression['comment']
                 }
-                scan_report.skipped_checks.append(check)
-            elif check.check_result['result'] == CheckResult.FAILED:
-                still_failed_checks.append(check)
-            else:
-                still_passed_checks.append(check)
-
-        scan_report.failed_checks = still_failed_checks
-        scan_report.passed_checks = still_passed_checks
+                suppressed_checks.append(check)
+
+        scan_report.move_records(suppressed_checks, CheckResult.SKIPPED)
+
+    def _index_suppressions(self):
+        """
+        Builds lookup tables of the suppressions, which apply to this repo, keyed by
+        - check ID for policy and account suppressions
+        - (check ID, resource ID) for resource suppressions
+        - (check ID, tag key, tag value) for tag suppressions
+
+        Each key maps to the position and the suppression, which comes first in the suppressions of the check,
+        because this is the one _check_suppressions() returns.
+        """
+
+        repo_matches = {}
+
+        def matches_repo(account_id):
+            if account_id not in repo_matches:
+                repo_matches[account_id] = self.bc_integration.repo_matches(account_id)
+            return repo_matches[account_id]
+
+        policy_index = {}
+        resource_index = {}
+        tag_index = {}
+        for check_id, suppressions in self.suppressions.items():
+            for position, suppression in enumerate(suppressions):
+                type = suppression['suppressionType']
+                if type == 'Policy' or (
+                        type == 'Accounts' and any(matches_repo(account) for account in suppression['accountIds'])):
+                    policy_index.setdefault(check_id, (position, suppression))
+                elif type == 'Resources':
+                    for resource in suppression['resources']:
+                        if matches_repo(resource['accountId']):
+                            resource_index.setdefault((check_id, resource['resourceId']), (position, suppression))
+                elif type == 'Tags':
+                    for tag in suppression['tags']:
+                        tag_index.setdefault((check_id, tag['key'], tag['value']), (position, suppression))
+
+        self.suppressions_index = {
+            'Policy': policy_index,
+            'Resources': resource_index,
+            'Tags': tag_index,
+        }
+
+    def _find_suppression(self, record):
+        """
+        Returns the first suppression, which applies to the specified record, or None if no suppression is applicable.
+        Same as _check_suppressions(), but with lookups in the suppressions index.
+        :param record:
+        :return:
+        """
+        check_id = record.check_id
+        candidates = [
+            self.suppressions_index['Policy'].get(check_id),
+            self.suppressions_index['Resources'].get((check_id, f'{record.repo_file_path}:{record.resource}')),
+        ]
+        tag_index = self.suppressions_index['Tags']
+        if record.entity_tags and tag_index:
+            for key, value in record.entity_tags.items():
+                try:
+                    candidates.append(tag_index.get((check_id, key, value)))
+                except TypeError:
+                    # not hashable tag values can't match a suppression
+                    continue
+
+        matches = [candidate for candidate in candidates if candidate]
+        if not matches:
+            return None
+        return min(matches, key=lambda match: match[0])[1]
 
     def _check_suppressions(self, record, suppressions):
         """
@@ -5,7 +5,9 @@ from abc import abstractmethod
 from collections.abc import Iterable
 from typing import List, Dict, Any, Callable, Optional
 
+from checkov.common.checks.check_timeout import check_timeouts, CheckTimeoutError
 from checkov.common.typing import _SkippedCheck, _CheckResult
+from checkov.common.util.profiler import profiler, PYTHON_CHECK
 from checkov.common.util.type_forcers import force_list
 from checkov.common.models.enums import CheckResult, CheckCategories
 from checkov.common.multi_signature import MultiSignatureMeta, multi_signature
@@ -73,13 +75,19 @@ class BaseCheck(metaclass=MultiSignatureMeta):
             try:
                 self.evaluated_keys = []
                 self.entity_path = f"{scanned_file}:{entity_type}:{entity_name}"
-                check_result["result"] = self.scan_entity_conf(entity_configuration, entity_type)
+                with check_timeouts.limit(self.id):
+                    check_result["result"] = self.scan_entity_conf(entity_configuration, entity_type)
                 check_result["evaluated_keys"] = self.get_evaluated_keys()
                 message = 'File {}, {}  "{}.{}" check "{}" Result: {} '.format(
                     scanned_file, self.block_type, entity_type, entity_name, self.name, check_result
                 )
                 self.logger.debug(message)
 
+            except CheckTimeoutError as e:
+                # the check is quarantined for this entity instead of stalling the whole scan
+                self.logger.warning(f"{e} for {entity_type}.{entity_name} at file: {scanned_file}")
+                profiler.add_timeout(PYTHON_CHECK, self.id)
+                check_result = {"result": CheckResult.SKIPPED, "suppress_comment": str(e)}
             except Exception:
                 self.logger.error(
                     f"Failed to run check: {self.name} for configuration: {entity_configuration} at file: {scanned_file}"
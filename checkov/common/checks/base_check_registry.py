@@ -10,12 +10,24 @@ from abc import abstractmethod
 from collections import defaultdict
 from itertools import chain
 from typing import Generator, Tuple, Dict, List, Optional, Any, TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
 from checkov.common.typing import _SkippedCheck, _CheckResult
+from checkov.common.util.profiler import profiler, PYTHON_CHECK
 from checkov.runner_filter import RunnerFilter
 
 if TYPE_CHECKING:
     from checkov.common.checks.base_check import BaseCheck
+    from typing_extensions import TypeAlias
+
+    # a check together with its metadata, which is used by the runner filter
+    _CheckState: TypeAlias = "Tuple[BaseCheck, Any, Optional[str]]"
+    # checks version, check dicts, number of wildcard patterns and the check lists of an entity type with their state
+    _CheckSourcesSnapshot: TypeAlias = (
+        "Tuple[int, Dict[str, List[BaseCheck]], Dict[str, List[BaseCheck]], int, List[Tuple[List[BaseCheck], List[_CheckState]]]]"
+    )
+    # decision generation of the runner filter and the checks to run by report and entity type
+    _ChecksToRun: TypeAlias = "Tuple[Tuple[int, int], Dict[Tuple[str, str], Tuple[_CheckSourcesSnapshot, List[BaseCheck]]]]"
 
 
 class BaseCheckRegistry:
@@ -25,6 +37,8 @@ class BaseCheckRegistry:
     __all_registered_checks: List[BaseCheck] = []
 
     def __init__(self, report_type: str) -> None:
+        # bumped, when checks are registered, see _are_check_sources_unchanged()
+        self._checks_version = 0
         self.logger = logging.getLogger(__name__)
         # IMPLEMENTATION NOTE: Checks is used to directly access checks based on an specific entity
         self.checks: Dict[str, List[BaseCheck]] = defaultdict(list)
@@ -34,7 +48,11 @@ class BaseCheckRegistry:
         self.wildcard_checks: Dict[str, List[BaseCheck]] = defaultdict(list)
         self.check_id_allowlist: Optional[List[str]] = None
         self.report_type = report_type
-
+        # IMPLEMENTATION NOTE: The checks of an entity type and the decision, if they should run, are the same for
+        #                      every entity of that type, therefore they are only computed once per runner filter.
+        #                      They are reset, when a check is registered or the decisions of the runner filter
+        #                      changed, and re-computed, when a check list changed.
+        self._checks_to_run: WeakKeyDictionary[RunnerFilter, _ChecksToRun] = WeakKeyDictionary()
 
     def register(self, check: BaseCheck) -> None:
         # IMPLEMENTATION NOTE: Checks are registered when the script is loaded
@@ -52,6 +70,8 @@ class BaseCheckRegistry:
             if not any(c.id == check.id for c in checks[entity]):
                 checks[entity].append(check)
 
+        self._checks_version += 1
+        self._checks_to_run = WeakKeyDictionary()
         BaseCheckRegistry.__all_registered_checks.append(check)
 
     @staticmethod
@@ -92,6 +112,69 @@ class BaseCheckRegistry:
                     res += checks
             return res
 
+    def get_checks_to_run(self, entity: str, runner_filter: RunnerFilter, report_type: str) -> List[BaseCheck]:
+        """Returns the checks of the entity type, which should run according to the runner filter"""
+
+        decision_generation = runner_filter.decision_generation
+        filter_checks_to_run = self._checks_to_run.get(runner_filter)
+        if filter_checks_to_run is None or filter_checks_to_run[0] != decision_generation:
+            # the decisions of the runner filter changed, therefore all cached checks are dropped
+            filter_checks_to_run = (decision_generation, {})
+            self._checks_to_run[runner_filter] = filter_checks_to_run
+        checks_to_run = filter_checks_to_run[1]
+
+        key = (report_type, entity)
+        cached = checks_to_run.get(key)
+        if cached and self._are_check_sources_unchanged(entity, cached[0]):
+            return cached[1]
+
+        sources = self._get_check_sources(entity)
+        checks = [
+            check
+            for source in sources
+            for check in source
+            if runner_filter.should_run_check(check, report_type=report_type)
+        ]
+        snapshot = (
+            self._checks_version,
+            self.checks,
+            self.wildcard_checks,
+            len(self.wildcard_checks),
+            [(source, [(check, check.severity, check.bc_id) for check in source]) for source in sources],
+        )
+        checks_to_run[key] = (snapshot, checks)
+        return checks
+
+    def _get_check_sources(self, entity: str) -> List[List[BaseCheck]]:
+        """Returns the check lists, which make up the checks of the entity type in the same order as get_checks()"""
+
+        sources = [self.checks[entity]] if entity in self.checks else []
+        for pattern, checks in self.wildcard_checks.items():
+            if fnmatch.fnmatchcase(entity, pattern):
+                sources.append(checks)
+        return sources
+
+    def _are_check_sources_unchanged(self, entity: str, snapshot: _CheckSourcesSnapshot) -> bool:
+        # checks are registered via register(), which bumps the version, but the check dicts can still be replaced
+        # and the check lists or the metadata of the checks, which is used by the runner filter, changed directly
+        checks_version, checks, wildcard_checks, wildcard_count, sources = snapshot
+        if (
+            checks_version != self._checks_version
+            or checks is not self.checks
+            or wildcard_checks is not self.wildcard_checks
+            or wildcard_count != len(self.wildcard_checks)
+        ):
+            return False
+        if entity in checks and not (sources and sources[0][0] is checks[entity]):
+            return False
+        for source, check_states in sources:
+            if len(source) != len(check_states):
+                return False
+            for check, (cached_check, severity, bc_id) in zip(source, check_states):
+                if check is not cached_check or check.severity != severity or check.bc_id != bc_id:
+                    return False
+        return True
+
     def set_checks_allowlist(self, runner_filter: RunnerFilter) -> None:
         if runner_filter.checks:
             self.check_id_allowlist = runner_filter.checks
@@ -116,18 +199,23 @@ class BaseCheckRegistry:
         if not isinstance(entity_configuration, dict):
             return results
 
-        checks = self.get_checks(entity_type)
+        checks = self.get_checks_to_run(entity_type, runner_filter, report_type or self.report_type)
+        skip_infos = self._get_skip_infos(skipped_checks)
         for check in checks:
-            skip_info: _SkippedCheck = {}
-            if skipped_checks:
-                if check.id in [x["id"] for x in skipped_checks]:
-                    skip_info = [x for x in skipped_checks if x["id"] == check.id][0]
-
-            if runner_filter.should_run_check(check, report_type=report_type or self.report_type):
-                result = self.run_check(check, entity_configuration, entity_name, entity_type, scanned_file, skip_info)
-                results[check] = result
+            skip_info = skip_infos.get(check.id, {})
+            result = self.run_check(check, entity_configuration, entity_name, entity_type, scanned_file, skip_info)
+            results[check] = result
         return results
 
+    @staticmethod
+    def _get_skip_infos(skipped_checks: List[_SkippedCheck]) -> Dict[str, _SkippedCheck]:
+        """Returns the skip info by check ID, the first one wins, if a check is skipped multiple times"""
+
+        skip_infos: Dict[str, _SkippedCheck] = {}
+        for skipped_check in skipped_checks or []:
+            skip_infos.setdefault(skipped_check["id"], skipped_check)
+        return skip_infos
+
     def run_check(
         self,
         check: BaseCheck,
@@ -138,13 +226,14 @@ class BaseCheckRegistry:
         skip_info: _SkippedCheck,
     ) -> _CheckResult:
         self.logger.debug("Running check: {} on file {}".format(check.name, scanned_file))
-        result = check.run(
-            scanned_file=scanned_file,
-            entity_configuration=entity_configuration,
-            entity_name=entity_name,
-            entity_type=entity_type,
-            skip_info=skip_info,
-        )
+        with profiler.measure(PYTHON_CHECK, check.id, scanned_file, entity_name, entity_type):
+            result = check.run(
+                scanned_file=scanned_file,
+                entity_configuration=entity_configuration,
+                entity_name=entity_name,
+                entity_type=entity_type,
+                skip_info=skip_info,
+            )
         return result
 
     @staticmethod
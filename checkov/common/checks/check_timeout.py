@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import signal
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class CheckTimeoutError(BaseException):
+    """Derives from BaseException, so it isn't swallowed by an 'except Exception' within a check"""
+
+    def __init__(self, check_id: str, timeout: float) -> None:
+        super().__init__(f"Check {check_id} timed out after {timeout} seconds")
+        self.check_id = check_id
+        self.timeout = timeout
+
+
+class CheckTimeouts:
+    """
+    Time budgets of a single check run, either for all checks or for specific check IDs.
+
+    A check, which exceeds its budget, is interrupted via SIGALRM, therefore this only works in the main thread
+    of a process on platforms supporting it. The runners run in forked processes, where this is the case.
+    """
+
+    def __init__(self) -> None:
+        self.default_timeout: Optional[float] = None
+        self.timeouts: Dict[str, float] = {}
+        self._active = False
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.default_timeout or self.timeouts)
+
+    def configure(self, values: List[str]) -> None:
+        """
+        Sets the budgets in seconds, each value is either a number for all checks or `<check ID>=<number>`
+
+        :raises ValueError: if a value has a different format or the number isn't positive
+        """
+
+        for value in values:
+            check_id, _, timeout_value = value.rpartition("=")
+            timeout = float(timeout_value)
+            if timeout <= 0:
+                raise ValueError(f"The check timeout has to be positive, got {value}")
+            if check_id:
+                self.timeouts[check_id.strip()] = timeout
+            else:
+                self.default_timeout = timeout
+
+    def get_timeout(self, check_id: str) -> Optional[float]:
+        return self.timeouts.get(check_id, self.default_timeout)
+
+    @staticmethod
+    def can_interrupt() -> bool:
+        return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+    @contextmanager
+    def limit(self, check_id: str) -> Iterator[None]:
+        """
+        Raises a CheckTimeoutError, if the enclosed code runs longer than the budget of the given check.
+        Without a budget, outside of the main thread or within another limited block the code just runs.
+        """
+
+        timeout = self.get_timeout(check_id) if self.enabled else None
+        if not timeout or self._active or not self.can_interrupt():
+            yield
+            return
+
+        budget = timeout
+        timed_out = False
+
+        def raise_timeout(signum: int, frame: Any) -> None:
+            nonlocal timed_out
+            timed_out = True
+            raise CheckTimeoutError(check_id, budget)
+
+        previous_handler = signal.signal(signal.SIGALRM, raise_timeout)
+        self._active = True
+        signal.setitimer(signal.ITIMER_REAL, budget)
+        try:
+            yield
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+            self._active = False
+
+        if timed_out:
+            # the check caught the error itself, but still exceeded its budget
+            raise CheckTimeoutError(check_id, budget)
+
+
+check_timeouts = CheckTimeouts()
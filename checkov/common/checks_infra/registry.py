@@ -9,6 +9,7 @@ from typing import Any, TYPE_CHECKING
 import yaml
 
 from checkov.common.checks_infra.checks_parser import NXGraphCheckParser
+from checkov.common.checks_infra.solvers.attribute_solvers.base_attribute_solver import SUPPORTED_BLOCK_TYPES
 from checkov.common.graph.checks_infra.base_parser import BaseGraphCheckParser
 from checkov.common.graph.checks_infra.registry import BaseRegistry
 from checkov.runner_filter import RunnerFilter
@@ -21,6 +22,8 @@ CHECKS_POSSIBLE_ENDING = [".yaml", ".yml"]
 
 
 class Registry(BaseRegistry):
+    timeout_block_types = SUPPORTED_BLOCK_TYPES  # noqa: CCE003  # a static attribute
+
     def __init__(self, checks_dir: str, parser: BaseGraphCheckParser | None = None) -> None:
         parser = parser or BaseGraphCheckParser()
 
@@ -1,22 +1,30 @@
-import concurrent.futures
+from __future__ import annotations
+
+import logging
 import re
 from typing import List, Tuple, Dict, Any, Optional, Pattern
 
 from networkx import DiGraph
+from jsonpath_ng import JSONPath
 from jsonpath_ng.ext import parse
 
 from checkov.common.graph.checks_infra.enums import SolverType
 from checkov.common.graph.checks_infra.solvers.base_solver import BaseSolver
-
-from concurrent.futures import ThreadPoolExecutor
-
-from checkov.common.graph.graph_builder import CustomAttributes
+from checkov.common.graph.checks_infra.solvers.vertex_keys_index import (
+    WILDCARD,
+    get_vertex_keys_index,
+    invalidate_vertex_keys_index,
+)
+from checkov.common.graph.checks_infra.solvers.vertices_evaluator import vertices_evaluator
+from checkov.common.graph.db_connectors.networkx.networkx_graph_index import NetworkxGraphIndex, get_graph_index
 from checkov.common.graph.graph_builder.graph_components.block_types import BlockType
 from checkov.common.util.var_utils import is_terraform_variable_dependent, is_cloudformation_variable_dependent
 from checkov.terraform.graph_builder.graph_components.block_types import BlockType as TerraformBlockType
 
 SUPPORTED_BLOCK_TYPES = {BlockType.RESOURCE, TerraformBlockType.DATA}
 WILDCARD_PATTERN = re.compile(r"(\S+[.][*][.]*)+")
+# attribute parts, which are matched literally by the attribute patterns
+PLAIN_ATTRIBUTE_PART_PATTERN = re.compile(r"[\w\-]+")
 
 OPERATION_TO_FUNC = {
     'all': all,
@@ -35,22 +43,26 @@ class BaseAttributeSolver(BaseSolver):
         self.value = value
         self.is_jsonpath_check = is_jsonpath_check
 
+        # everything, which only depends on the attribute, is prepared once and not for every vertex
+        self.is_wildcard_attribute = isinstance(attribute, str) and re.match(WILDCARD_PATTERN, attribute) is not None
+        self.jsonpath_expression = self._parse_jsonpath(attribute) if is_jsonpath_check else None
+        self.attribute_patterns = self.get_attribute_patterns(attribute) if isinstance(attribute, str) else None
+        self.normalized_attributes = self.get_normalized_attributes(attribute) if isinstance(attribute, str) else None
+
     def run(self, graph_connector: DiGraph) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
-        executer = ThreadPoolExecutor()
-        jobs = []
-        passed_vertices: List[Dict[str, Any]] = []
-        failed_vertices: List[Dict[str, Any]] = []
-        for _, data in graph_connector.nodes(data=True):
-            if (not self.resource_types or data.get(CustomAttributes.RESOURCE_TYPE) in self.resource_types) \
-                    and data.get(CustomAttributes.BLOCK_TYPE) in SUPPORTED_BLOCK_TYPES:
-                jobs.append(executer.submit(self._process_node, data, passed_vertices, failed_vertices))
-
-        concurrent.futures.wait(jobs)
-        return passed_vertices, failed_vertices
-
-    def get_operation(self, vertex: Dict[str, Any]) -> bool:  # type:ignore[override]
-        if self.attribute and (self.is_jsonpath_check or re.match(WILDCARD_PATTERN, self.attribute)):
-            attribute_matches = self.get_attribute_matches(vertex)
+        graph_index = get_graph_index(graph_connector)
+        vertices = graph_index.get_vertices(self.resource_types, SUPPORTED_BLOCK_TYPES)
+        return vertices_evaluator.evaluate(lambda vertex: self._process_node(vertex, graph_index), vertices)
+
+    def get_operation(  # type:ignore[override]
+        self, vertex: Dict[str, Any], graph_index: NetworkxGraphIndex | None = None
+    ) -> bool:
+        """
+        :param graph_index: index of the graph of the vertex, which keeps the vertex keys index for all checks
+        """
+
+        if self.attribute and (self.is_jsonpath_check or self.is_wildcard_attribute):
+            attribute_matches = self.get_attribute_matches(vertex, graph_index)
 
             operator = OPERATION_TO_FUNC['all'] if self.is_jsonpath_check else OPERATION_TO_FUNC['any']
             if attribute_matches:
@@ -65,31 +77,30 @@ class BaseAttributeSolver(BaseSolver):
     def _get_operation(self, vertex: Dict[str, Any], attribute: Optional[str]) -> bool:  # type:ignore[override]
         raise NotImplementedError
 
-    def _process_node(
-        self, data: Dict[str, Any], passed_vartices: List[Dict[str, Any]], failed_vertices: List[Dict[str, Any]]
-    ) -> None:
+    def _process_node(self, data: Dict[str, Any], graph_index: NetworkxGraphIndex | None = None) -> Optional[bool]:
         if not self.resource_type_pred(data, self.resource_types):
-            return
-        if self.get_operation(vertex=data):
-            passed_vartices.append(data)
-        else:
-            failed_vertices.append(data)
+            return None
+        return self.get_operation(vertex=data, graph_index=graph_index)
 
-    def get_attribute_matches(self, vertex: Dict[str, Any]) -> List[str]:
+    def get_attribute_matches(self, vertex: Dict[str, Any], graph_index: NetworkxGraphIndex | None = None) -> List[str]:
         attribute_matches: List[str] = []
         if self.is_jsonpath_check:
-            parsed_attr = parse(self.attribute)
+            parsed_attr = self.jsonpath_expression or parse(self.attribute)
             for match in parsed_attr.find(vertex):
                 full_path = str(match.full_path)
                 if full_path not in vertex:
                     vertex[full_path] = match.value
+                    invalidate_vertex_keys_index(vertex)
 
                 attribute_matches.append(full_path)
 
         elif isinstance(self.attribute, str):
-            attribute_patterns = self.get_attribute_patterns(self.attribute)
+            if self.normalized_attributes:
+                return get_vertex_keys_index(vertex, graph_index).get_keys(self.normalized_attributes)
+
+            attribute_patterns = self.attribute_patterns or self.get_attribute_patterns(self.attribute)
             for attr in vertex:
-                if any(re.match(re.compile(attribute_pattern), attr) for attribute_pattern in attribute_patterns):
+                if any(attribute_pattern.match(attr) for attribute_pattern in attribute_patterns):
                     attribute_matches.append(attr)
 
         return attribute_matches
@@ -117,6 +128,35 @@ class BaseAttributeSolver(BaseSolver):
 
         return pattern_with_index, pattern_without_index
 
+    @staticmethod
+    def get_normalized_attributes(attribute: str) -> Optional[Tuple[str, str]]:
+        """
+        Returns the wildcard-normalized forms of the keys matched by the attribute patterns,
+        if the attribute parts are plain names and the matching keys can be looked up in the vertex keys index
+        """
+
+        attribute_parts = attribute.split(".")
+        if not all(
+            part == WILDCARD or (PLAIN_ATTRIBUTE_PART_PATTERN.fullmatch(part) and not part.isdecimal())
+            for part in attribute_parts
+        ):
+            return None
+
+        attribute_without_index = ".".join(part for part in attribute_parts if part != WILDCARD)
+        return attribute, attribute_without_index
+
+    @staticmethod
+    def _parse_jsonpath(attribute: Optional[str]) -> Optional[JSONPath]:
+        if not attribute:
+            return None
+
+        try:
+            return parse(attribute)
+        except Exception:
+            # the error will be raised again, when the check is evaluated
+            logging.debug(f"Failed to parse JSONPath attribute {attribute}", exc_info=True)
+            return None
+
     @staticmethod
     def _is_variable_dependant(value: Any, source: str) -> bool:
         if source == 'Terraform' and is_terraform_variable_dependent(value):
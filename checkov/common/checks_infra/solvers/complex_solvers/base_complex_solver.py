@@ -4,6 +4,8 @@ from networkx import DiGraph
 
 from checkov.common.graph.checks_infra.enums import SolverType
 from checkov.common.graph.checks_infra.solvers.base_solver import BaseSolver
+from checkov.common.graph.checks_infra.solvers.vertices_evaluator import vertices_evaluator
+from checkov.common.graph.db_connectors.networkx.networkx_graph_index import get_graph_index
 
 
 class BaseComplexSolver(BaseSolver):
@@ -23,9 +25,8 @@ class BaseComplexSolver(BaseSolver):
         return not self._get_operation(args)
 
     def run(self, graph_connector: DiGraph) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
-        all_vertices_resource_types = [
-            data for _, data in graph_connector.nodes(data=True) if self.resource_type_pred(data, self.resource_types)
-        ]
-        passed_vertices = [data for data in all_vertices_resource_types if self.get_operation(data)]
-        failed_vertices = [resource for resource in all_vertices_resource_types if resource not in passed_vertices]
-        return passed_vertices, failed_vertices
+        graph_index = get_graph_index(graph_connector)
+        all_vertices_resource_types = graph_index.get_vertices(self.resource_types)
+        return vertices_evaluator.evaluate(
+            lambda vertex: bool(self.get_operation(vertex, graph_index=graph_index)), all_vertices_resource_types
+        )
@@ -1,10 +1,15 @@
-from typing import List, Any, Dict
+from __future__ import annotations
+
+from typing import List, Any, Dict, TYPE_CHECKING
 
 from checkov.common.graph.checks_infra.enums import Operators
 from checkov.common.graph.checks_infra.solvers.base_solver import BaseSolver
 from checkov.common.checks_infra.solvers.complex_solvers.base_complex_solver import BaseComplexSolver
 from functools import reduce
 
+if TYPE_CHECKING:
+    from checkov.common.graph.db_connectors.networkx.networkx_graph_index import NetworkxGraphIndex
+
 
 class NotSolver(BaseComplexSolver):
     operator = Operators.NOT  # noqa: CCE003  # a static attribute
@@ -19,5 +24,7 @@ class NotSolver(BaseComplexSolver):
             raise Exception('The "not" operator must have exactly one child')
         return not args[0]
 
-    def get_operation(self, vertex: Dict[str, Any]) -> bool:  # type:ignore[override]
-        return not self.solvers[0].get_operation(vertex)
+    def get_operation(  # type:ignore[override]
+        self, vertex: Dict[str, Any], graph_index: NetworkxGraphIndex | None = None
+    ) -> bool:
+        return not self.solvers[0].get_operation(vertex, graph_index=graph_index)
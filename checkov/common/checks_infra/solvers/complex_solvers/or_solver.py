@@ -1,4 +1,6 @@
-from typing import List, Any, Dict
+from __future__ import annotations
+
+from typing import List, Any, Dict, TYPE_CHECKING
 
 from checkov.common.graph.checks_infra.enums import Operators
 from checkov.common.graph.checks_infra.solvers.base_solver import BaseSolver
@@ -6,6 +8,9 @@ from checkov.common.checks_infra.solvers.complex_solvers.base_complex_solver imp
 from functools import reduce
 from operator import or_
 
+if TYPE_CHECKING:
+    from checkov.common.graph.db_connectors.networkx.networkx_graph_index import NetworkxGraphIndex
+
 
 class OrSolver(BaseComplexSolver):
     operator = Operators.OR  # noqa: CCE003  # a static attribute
@@ -16,8 +21,10 @@ class OrSolver(BaseComplexSolver):
     def _get_operation(self, *args: Any, **kwargs: Any) -> Any:
         return reduce(or_, args)
 
-    def get_operation(self, vertex: Dict[str, Any]) -> bool:  # type:ignore[override]
+    def get_operation(  # type:ignore[override]
+        self, vertex: Dict[str, Any], graph_index: NetworkxGraphIndex | None = None
+    ) -> bool:
         for solver in self.solvers:
-            if solver.get_operation(vertex):
+            if solver.get_operation(vertex, graph_index=graph_index):
                 return True
         return False
@@ -1,11 +1,11 @@
 import itertools
-from typing import Any, List, Dict, Optional, Tuple
+from typing import Any, List, Dict, Optional, Tuple, Set
 
 from networkx import DiGraph
 
 from checkov.common.graph.checks_infra.enums import SolverType
 from checkov.common.graph.checks_infra.solvers.base_solver import BaseSolver
-from checkov.common.graph.graph_builder import CustomAttributes
+from checkov.common.graph.db_connectors.networkx.networkx_graph_index import get_graph_index
 from checkov.terraform.graph_builder.graph_components.block_types import BlockType
 
 
@@ -44,12 +44,9 @@ class BaseConnectionSolver(BaseSolver):
         return vertex_type in itertools.chain(self.resource_types, self.connected_resources_types)
 
     def set_vertices(self, graph_connector: DiGraph, exclude_vertices: List[Dict[str, Any]]) -> None:
-        self.vertices_under_resource_types = [
-            v for _, v in graph_connector.nodes(data=True) if self.resource_type_pred(v, self.resource_types)
-        ]
-        self.vertices_under_connected_resources_types = [
-            v for _, v in graph_connector.nodes(data=True) if self.resource_type_pred(v, self.connected_resources_types)
-        ]
+        graph_index = get_graph_index(graph_connector)
+        self.vertices_under_resource_types = graph_index.get_vertices(self.resource_types)
+        self.vertices_under_connected_resources_types = graph_index.get_vertices(self.connected_resources_types)
         self.excluded_vertices = [
             v
             for v in itertools.chain(self.vertices_under_resource_types, self.vertices_under_connected_resources_types)
@@ -61,18 +58,13 @@ class BaseConnectionSolver(BaseSolver):
         if not self.vertices_under_resource_types:
             return graph_connector
 
-        resource_nodes = {
-            node
-            for node, resource_type in graph_connector.nodes(data=CustomAttributes.RESOURCE_TYPE)
-            if resource_type in self.targeted_resources_types
-        }
+        graph_index = get_graph_index(graph_connector)
+        resource_nodes: Set[str] = set()
+        if self.targeted_resources_types:
+            resource_nodes.update(graph_index.get_nodes(resource_types=self.targeted_resources_types))
 
         # tuple needs to be adjusted, if more connection block types are supported
-        connection_nodes = {
-            node
-            for node, block_type in graph_connector.nodes(data=CustomAttributes.BLOCK_TYPE)
-            if block_type in BaseConnectionSolver.SUPPORTED_CONNECTION_BLOCK_TYPES
-        }
+        connection_nodes = graph_index.get_nodes(block_types=BaseConnectionSolver.SUPPORTED_CONNECTION_BLOCK_TYPES)
         resource_nodes.update(connection_nodes)
 
         return graph_connector.subgraph(resource_nodes)
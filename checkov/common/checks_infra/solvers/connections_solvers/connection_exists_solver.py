@@ -2,6 +2,7 @@ import itertools
 from typing import List, Optional, Dict, Any, Tuple
 
 from checkov.common.graph.checks_infra.enums import Operators
+from checkov.common.graph.checks_infra.solvers.vertex_keys_index import invalidate_vertex_keys_index
 from checkov.common.checks_infra.solvers.connections_solvers.base_connection_solver import BaseConnectionSolver
 from networkx import edge_dfs, DiGraph
 from checkov.common.graph.graph_builder import CustomAttributes
@@ -44,7 +45,10 @@ class ConnectionExistsSolver(BaseConnectionSolver):
                     failed.extend([origin_attributes, destination_attributes])
                 else:
                     passed.extend([origin_attributes, destination_attributes])
+                is_new_key = 'connected_node' not in destination_attributes
                 destination_attributes['connected_node'] = origin_attributes
+                if is_new_key:
+                    invalidate_vertex_keys_index(destination_attributes)
                 continue
 
             destination_block_type = destination_attributes.get(CustomAttributes.BLOCK_TYPE)
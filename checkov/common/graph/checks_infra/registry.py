@@ -6,8 +6,13 @@ import logging
 from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from networkx import DiGraph
 
+from checkov.common.checks.check_timeout import check_timeouts, CheckTimeoutError
 from checkov.common.graph.checks_infra.base_parser import BaseGraphCheckParser
+from checkov.common.graph.checks_infra.solvers.vertices_evaluator import vertices_evaluator, PROCESS_BACKEND
+from checkov.common.graph.db_connectors.networkx.networkx_graph_index import get_graph_index
+from checkov.common.graph.graph_builder.graph_components.block_types import BlockType
 from checkov.common.models.enums import CheckResult
+from checkov.common.util.profiler import profiler, GRAPH_CHECK
 from checkov.runner_filter import RunnerFilter
 
 if TYPE_CHECKING:
@@ -16,6 +21,9 @@ if TYPE_CHECKING:
 
 
 class BaseRegistry:
+    # block types of the entities, which get a skipped result, when a check times out
+    timeout_block_types = {BlockType.RESOURCE}  # noqa: CCE003  # a static attribute
+
     def __init__(self, parser: BaseGraphCheckParser) -> None:
         self.checks: List[BaseGraphCheck] = []
         self.parser = parser
@@ -30,23 +38,56 @@ class BaseRegistry:
         check_results: Dict[BaseGraphCheck, List[Dict[str, Any]]] = {}
         checks_to_run = [c for c in self.checks if runner_filter.should_run_check(c, report_type=report_type)]
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            concurrent.futures.wait(
-                [executor.submit(self.run_check_parallel, check, check_results, graph_connector)
-                 for check in checks_to_run]
-            )
+        sequential_checks: List[BaseGraphCheck] = []
+        if vertices_evaluator.backend == PROCESS_BACKEND:
+            # the vertices of each check are evaluated in forked workers, which is only safe without other threads
+            sequential_checks, checks_to_run = checks_to_run, []
+        elif check_timeouts.enabled and check_timeouts.can_interrupt():
+            # checks can only be interrupted in the main thread, therefore the ones with a budget run there
+            # after the other ones, so the threads don't slow them down
+            sequential_checks = [c for c in checks_to_run if check_timeouts.get_timeout(c.id)]
+            checks_to_run = [c for c in checks_to_run if not check_timeouts.get_timeout(c.id)]
+
+        if checks_to_run:
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                concurrent.futures.wait(
+                    [executor.submit(self.run_check_parallel, check, check_results, graph_connector)
+                     for check in checks_to_run]
+                )
+        for check in sequential_checks:
+            self.run_check_parallel(check, check_results, graph_connector)
         return check_results
 
     def run_check_parallel(
         self, check: BaseGraphCheck, check_results: dict[BaseGraphCheck, list[dict[str, Any]]], graph_connector: DiGraph
     ) -> None:
         logging.debug(f'Running graph check: {check.id}')
-        passed, failed = check.run(graph_connector)
+        try:
+            with profiler.measure(GRAPH_CHECK, check.id), check_timeouts.limit(check.id):
+                passed, failed = check.run(graph_connector)
+        except CheckTimeoutError as e:
+            # like a timed out Python check, the entities of the check get a skipped result
+            logging.warning(f"{e}, it is skipped")
+            profiler.add_timeout(GRAPH_CHECK, check.id)
+            check_results[check] = self._get_timeout_results(check, graph_connector, str(e))
+            return
         evaluated_keys = check.get_evaluated_keys()
         check_result = self._process_check_result(passed, [], CheckResult.PASSED, evaluated_keys)
         check_result = self._process_check_result(failed, check_result, CheckResult.FAILED, evaluated_keys)
         check_results[check] = check_result
 
+    def _get_timeout_results(
+        self, check: BaseGraphCheck, graph_connector: DiGraph, suppress_comment: str
+    ) -> list[dict[str, Any]]:
+        if not check.resource_types:
+            return []
+
+        vertices = get_graph_index(graph_connector).get_vertices(check.resource_types, self.timeout_block_types)
+        return [
+            {"result": CheckResult.SKIPPED, "entity": vertex, "evaluated_keys": [], "suppress_comment": suppress_comment}
+            for vertex in vertices
+        ]
+
     @staticmethod
     def _process_check_result(
         results: list[dict[str, Any]],
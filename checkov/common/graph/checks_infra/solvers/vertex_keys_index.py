@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Tuple, TYPE_CHECKING
+
+from checkov.common.graph.db_connectors.networkx.networkx_graph_index import get_graph_indexes
+
+if TYPE_CHECKING:
+    from checkov.common.graph.db_connectors.networkx.networkx_graph_index import NetworkxGraphIndex
+
+WILDCARD = "*"
+
+
+def normalize_key(key: str) -> str:
+    """
+    Replaces the list indexes of a flattened attribute key with a wildcard, ex. 'ingress.0.cidr_blocks' -> 'ingress.*.cidr_blocks'
+    """
+
+    return ".".join(WILDCARD if part.isdecimal() else part for part in key.split("."))
+
+
+class VertexKeysIndex:
+    """
+    Index of the flattened attribute keys of a vertex by their wildcard-normalized form
+    """
+
+    def __init__(self, vertex: Dict[str, Any]) -> None:
+        self.keys_by_normalized_key: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+
+        for position, key in enumerate(vertex):
+            if not isinstance(key, str) or WILDCARD in key.split("."):
+                # keys with a literal wildcard part can't be distinguished from a normalized key
+                continue
+            self.keys_by_normalized_key[normalize_key(key)].append((position, key))
+
+    def get_keys(self, normalized_keys: Iterable[str]) -> List[str]:
+        """
+        :return: the keys matching any of the given normalized keys, in the order of the vertex keys
+        """
+
+        matches: List[Tuple[int, str]] = []
+        for normalized_key in set(normalized_keys):
+            matches.extend(self.keys_by_normalized_key.get(normalized_key, []))
+
+        return [key for _, key in sorted(matches)]
+
+
+_vertex_keys_indexes_lock = threading.Lock()
+
+
+def get_vertex_keys_index(vertex: Dict[str, Any], graph_index: NetworkxGraphIndex | None = None) -> VertexKeysIndex:
+    """
+    Returns the keys index of the given vertex, it is shared by all checks and lives as long as the given graph index,
+    after adding or removing keys of a graph vertex `invalidate_vertex_keys_index` has to be called
+    """
+
+    if graph_index is None or not graph_index.contains_vertex(vertex):
+        # the vertex isn't part of an indexed graph, therefore the index can't be shared
+        return VertexKeysIndex(vertex)
+
+    with _vertex_keys_indexes_lock:
+        vertex_keys_index = graph_index.vertex_keys_indexes.get(id(vertex))
+    if vertex_keys_index is None:
+        vertex_keys_index = VertexKeysIndex(vertex)
+        with _vertex_keys_indexes_lock:
+            graph_index.vertex_keys_indexes[id(vertex)] = vertex_keys_index
+    return vertex_keys_index
+
+
+def invalidate_vertex_keys_index(vertex: Dict[str, Any]) -> None:
+    # the vertex data is shared by a graph and its subgraph views, therefore it is dropped from all of them.
+    # The id can't belong to another vertex of an index, because the vertex is alive.
+    graph_indexes = get_graph_indexes()
+    with _vertex_keys_indexes_lock:
+        for graph_index in graph_indexes:
+            graph_index.vertex_keys_indexes.pop(id(vertex), None)
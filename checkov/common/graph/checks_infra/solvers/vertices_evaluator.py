@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from checkov.common.parallelizer.parallel_runner import parallel_runner
+from checkov.common.util.type_forcers import force_int
+
+SERIAL_BACKEND = "serial"
+PROCESS_BACKEND = "process"
+
+CHECKOV_GRAPH_SOLVER_BACKEND = os.getenv("CHECKOV_GRAPH_SOLVER_BACKEND", SERIAL_BACKEND).lower()
+CHECKOV_GRAPH_SOLVER_BATCH_SIZE = force_int(os.getenv("CHECKOV_GRAPH_SOLVER_BATCH_SIZE")) or 1000
+# forking only pays off, if there is enough work to spread across the workers
+CHECKOV_GRAPH_SOLVER_PROCESS_MIN_VERTICES = force_int(os.getenv("CHECKOV_GRAPH_SOLVER_PROCESS_MIN_VERTICES")) or 10000
+
+# returns the result of a vertex or None, if the vertex should not be part of the results
+VertexPredicate = Callable[[Dict[str, Any]], Optional[bool]]
+
+
+class VerticesEvaluator:
+    """
+    Evaluates a predicate over a list of vertices and splits them into passed and failed vertices.
+
+    By default the vertices are evaluated in the calling thread, because the graph checks already run in parallel.
+    The process backend splits the vertices into batches and evaluates them in forked workers,
+    only the results are sent back, therefore the returned vertices are still the original graph vertices.
+    Forking a process with other live threads can deadlock the child on a lock held by one of them,
+    therefore the process backend is only used from the main thread without any other threads,
+    otherwise, like in the thread pool of the graph checks, the vertices are evaluated serially.
+    """
+
+    def __init__(
+        self, backend: str | None = None, batch_size: int | None = None, process_min_vertices: int | None = None
+    ) -> None:
+        self.backend = backend or CHECKOV_GRAPH_SOLVER_BACKEND
+        self.batch_size = batch_size or CHECKOV_GRAPH_SOLVER_BATCH_SIZE
+        self.process_min_vertices = process_min_vertices or CHECKOV_GRAPH_SOLVER_PROCESS_MIN_VERTICES
+
+        if self.backend not in (SERIAL_BACKEND, PROCESS_BACKEND):
+            logging.warning(f"Unsupported graph solver backend {self.backend}, falling back to {SERIAL_BACKEND}")
+            self.backend = SERIAL_BACKEND
+
+    def evaluate(
+        self, predicate: VertexPredicate, vertices: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        passed_vertices: List[Dict[str, Any]] = []
+        failed_vertices: List[Dict[str, Any]] = []
+        if not vertices:
+            return passed_vertices, failed_vertices
+
+        if self.backend == PROCESS_BACKEND and len(vertices) >= self.process_min_vertices and self._can_fork():
+            results = self._evaluate_multiprocess(predicate, vertices)
+        else:
+            results = self._evaluate_batch(predicate, vertices)
+
+        for vertex, result in zip(vertices, results):
+            if result is None:
+                continue
+            if result:
+                passed_vertices.append(vertex)
+            else:
+                failed_vertices.append(vertex)
+
+        return passed_vertices, failed_vertices
+
+    @staticmethod
+    def _can_fork() -> bool:
+        return threading.current_thread() is threading.main_thread() and threading.active_count() == 1
+
+    @staticmethod
+    def _evaluate_batch(predicate: VertexPredicate, vertices: List[Dict[str, Any]]) -> List[Optional[bool]]:
+        return [predicate(vertex) for vertex in vertices]
+
+    def _evaluate_multiprocess(
+        self, predicate: VertexPredicate, vertices: List[Dict[str, Any]]
+    ) -> List[Optional[bool]]:
+        batches = [vertices[i: i + self.batch_size] for i in range(0, len(vertices), self.batch_size)]
+        results = parallel_runner.run_function(
+            func=lambda batch: self._evaluate_batch(predicate, batch),
+            items=batches,
+        )
+        return list(itertools.chain.from_iterable(results))
+
+
+vertices_evaluator = VerticesEvaluator()
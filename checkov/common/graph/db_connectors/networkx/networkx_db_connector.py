@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, TypeVar
 import networkx as nx
 
 from checkov.common.graph.db_connectors.db_connector import DBConnector
+from checkov.common.graph.db_connectors.networkx.networkx_graph_index import get_graph_index, invalidate_graph_index
 from checkov.common.graph.graph_builder import CustomAttributes
 
 if TYPE_CHECKING:
@@ -25,6 +26,8 @@ class NetworkxConnector(DBConnector[nx.DiGraph]):
         return self.graph
 
     def get_writer_endpoint(self) -> nx.DiGraph:
+        # the graph is changed by the caller, therefore the index is re-created on the next access
+        invalidate_graph_index(self.graph)
         return self.graph
 
     def networkx_from_local_graph(self, local_graph: LocalGraph[_Block]) -> nx.DiGraph:
@@ -42,5 +45,7 @@ class NetworkxConnector(DBConnector[nx.DiGraph]):
 
         self.graph.add_nodes_from(vertices_to_add)
         self.graph.add_edges_from(edges_to_add)
+        # precompute the resource type and block type index used by the graph checks
+        get_graph_index(self.graph)
 
         return self.graph
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from collections.abc import Collection, Hashable
+from typing import Any, Dict, List, Tuple, TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+import networkx as nx
+
+from checkov.common.graph.graph_builder import CustomAttributes
+
+if TYPE_CHECKING:
+    from checkov.common.graph.checks_infra.solvers.vertex_keys_index import VertexKeysIndex
+
+# position of the node in the graph, the node key and its data
+_IndexedVertex = Tuple[int, Any, Dict[str, Any]]
+
+
+class NetworkxGraphIndex:
+    """
+    Index of the vertices of a networkx graph by their resource type and block type.
+    The vertices are always returned in the same order as they are iterated in the graph.
+    """
+
+    def __init__(self, graph: nx.DiGraph) -> None:
+        self.vertices: List[_IndexedVertex] = []
+        self.vertices_by_resource_type: Dict[Any, List[_IndexedVertex]] = defaultdict(list)
+        self.vertices_by_block_type: Dict[Any, List[_IndexedVertex]] = defaultdict(list)
+        # vertices with a resource type, which can't be indexed
+        self.unhashable_resource_type_vertices: List[_IndexedVertex] = []
+        # the ids of the vertex data can't be reused, while the index holds the data
+        self.positions_by_vertex_id: Dict[int, int] = {}
+        # keys indexes of the vertices, which are created by the attribute solvers on demand
+        self.vertex_keys_indexes: Dict[int, VertexKeysIndex] = {}
+
+        for position, (node, data) in enumerate(graph.nodes(data=True)):
+            vertex = (position, node, data)
+            self.vertices.append(vertex)
+            self.positions_by_vertex_id[id(data)] = position
+
+            block_type = data.get(CustomAttributes.BLOCK_TYPE)
+            if isinstance(block_type, Hashable):
+                self.vertices_by_block_type[block_type].append(vertex)
+
+            if CustomAttributes.RESOURCE_TYPE in data:
+                resource_type = data[CustomAttributes.RESOURCE_TYPE]
+                if isinstance(resource_type, Hashable):
+                    self.vertices_by_resource_type[resource_type].append(vertex)
+                else:
+                    self.unhashable_resource_type_vertices.append(vertex)
+
+    def get_vertices(
+        self, resource_types: Collection[Any] | None = None, block_types: Collection[Any] | None = None
+    ) -> List[Dict[str, Any]]:
+        """
+        :param resource_types: resource types to filter by, an empty value matches all vertices
+        :param block_types: block types to filter by, an empty value matches all vertices
+        :return: the data of the matching vertices
+        """
+        return [data for _, _, data in self._get_indexed_vertices(resource_types, block_types)]
+
+    def get_nodes(
+        self, resource_types: Collection[Any] | None = None, block_types: Collection[Any] | None = None
+    ) -> List[Any]:
+        """
+        Same as `get_vertices`, but returns the node keys
+        """
+        return [node for _, node, _ in self._get_indexed_vertices(resource_types, block_types)]
+
+    def _get_indexed_vertices(
+        self, resource_types: Collection[Any] | None, block_types: Collection[Any] | None
+    ) -> List[_IndexedVertex]:
+        if resource_types:
+            vertices = self._get_from_buckets(self.vertices_by_resource_type, resource_types)
+            vertices.extend(
+                vertex
+                for vertex in self.unhashable_resource_type_vertices
+                if vertex[2][CustomAttributes.RESOURCE_TYPE] in resource_types
+            )
+            if block_types:
+                vertices = [vertex for vertex in vertices if vertex[2].get(CustomAttributes.BLOCK_TYPE) in block_types]
+        elif block_types:
+            vertices = self._get_from_buckets(self.vertices_by_block_type, block_types)
+        else:
+            return self.vertices
+
+        vertices.sort(key=lambda vertex: vertex[0])
+        return vertices
+
+    def contains_vertex(self, vertex: Dict[str, Any]) -> bool:
+        return id(vertex) in self.positions_by_vertex_id
+
+    @staticmethod
+    def _get_from_buckets(buckets: Dict[Any, List[_IndexedVertex]], keys: Collection[Any]) -> List[_IndexedVertex]:
+        vertices: List[_IndexedVertex] = []
+        for key in set(key for key in keys if isinstance(key, Hashable)):
+            vertices.extend(buckets.get(key, []))
+        return vertices
+
+
+_graph_indexes: WeakKeyDictionary[nx.DiGraph, NetworkxGraphIndex] = WeakKeyDictionary()
+_graph_indexes_lock = threading.Lock()
+
+
+def get_graph_index(graph: nx.DiGraph) -> NetworkxGraphIndex:
+    """
+    Returns the index of the given graph, it is created on first access and kept until it is invalidated
+    """
+    with _graph_indexes_lock:
+        graph_index = _graph_indexes.get(graph)
+        if graph_index is None:
+            graph_index = NetworkxGraphIndex(graph)
+            _graph_indexes[graph] = graph_index
+        return graph_index
+
+
+def get_graph_indexes() -> List[NetworkxGraphIndex]:
+    """
+    Returns the existing indexes of all graphs, subgraph views share the vertex data with their graph
+    """
+    with _graph_indexes_lock:
+        return list(_graph_indexes.values())
+
+
+def invalidate_graph_index(graph: nx.DiGraph) -> None:
+    """
+    Drops the index of the given graph, it has to be called after the nodes or their data were changed
+    """
+    with _graph_indexes_lock:
+        _graph_indexes.pop(graph, None)
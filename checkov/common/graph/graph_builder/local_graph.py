@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from collections import defaultdict
-from typing import List, Dict, Callable, Union, Any, Set, Iterable, TypeVar, Generic, TYPE_CHECKING
+from typing import List, Dict, Union, Any, Set, Iterable, TypeVar, Generic, TYPE_CHECKING, Optional
 
 from checkov.common.graph.graph_builder.graph_components.block_types import BlockType
 from checkov.common.graph.graph_builder.graph_resources_encription_manager import GraphResourcesEncryptionManager
@@ -30,42 +30,8 @@ class LocalGraph(Generic[_Block]):
     def build_graph(self, render_variables: bool) -> None:
         pass
 
-    def get_vertices_with_degrees_conditions(
-        self, out_degree_cond: Callable[[int], bool], in_degree_cond: Callable[[int], bool]
-    ) -> Set[int]:
-        vertices_with_out_degree = {
-            vertex_index for vertex_index, vertex_value in self.out_edges.items() if out_degree_cond(len(vertex_value))
-        }
-        vertices_with_in_degree = {
-            vertex_index for vertex_index, vertex_value in self.in_edges.items() if in_degree_cond(len(vertex_value))
-        }
-
-        return vertices_with_in_degree.intersection(vertices_with_out_degree)
-
-    def get_in_edges(self, end_vertices: Iterable[int]) -> List[Edge]:
-        res = []
-        for vertex in end_vertices:
-            res.extend(self.in_edges.get(vertex, []))
-        return self.sort_edged_by_dest_out_degree(res)
-
-    def get_in_edges_deduped(self, end_vertices: Iterable[int]) -> Set[Edge]:
-        res = set()
-        for vertex in end_vertices:
-            res.update(self.in_edges.get(vertex, []))
-        return res
-
-    def sort_edged_by_dest_out_degree(self, edges: Iterable[Edge]) -> List[Edge]:
-        edged_by_out_degree: Dict[int, List[Edge]] = {}
-        for edge in edges:
-            dest_out_degree = len(self.out_edges[edge.dest])
-            edged_by_out_degree.setdefault(dest_out_degree, []).append(edge)
-        sorted_edges = []
-        for degree in sorted(edged_by_out_degree.keys()):
-            sorted_edges.extend(edged_by_out_degree[degree])
-        return sorted_edges
-
     @abstractmethod
-    def update_vertices_configs(self) -> None:
+    def update_vertices_configs(self, vertices_indexes: Optional[Iterable[int]] = None) -> None:
         pass
 
     @staticmethod
@@ -96,9 +62,13 @@ class LocalGraph(Generic[_Block]):
             attribute_key, attribute_value, change_origin_id, previous_breadcrumbs, attribute_at_dest, transform_step
         )
 
-    def calculate_encryption_attribute(self, encription_by_resource_type: Dict[str, Any]) -> None:
+    def calculate_encryption_attribute(
+        self, encription_by_resource_type: Dict[str, Any], vertices_indexes: Optional[Set[int]] = None
+    ) -> None:
         self._graph_resource_encryption_manager.set_encription_by_resource_type(encription_by_resource_type)
         for vertex_index in self.vertices_by_block_type.get(BlockType.RESOURCE, []):
+            if vertices_indexes is not None and vertex_index not in vertices_indexes:
+                continue
             vertex = self.vertices[vertex_index]
             encryption_result = self._graph_resource_encryption_manager.get_encryption_result(vertex)
             if not encryption_result:
@@ -3,10 +3,14 @@ from __future__ import annotations
 import logging
 import os
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, List, Dict, Any, Iterable, TypeVar
+from copy import deepcopy
+from typing import TYPE_CHECKING, List, Dict, Any, Iterable, TypeVar, Set, Optional, Tuple
+
+import networkx as nx
 
 from checkov.common.graph.graph_builder import Edge
 from checkov.common.graph.graph_builder.utils import run_function_multithreaded
+from checkov.common.util.profiler import profiled, VARIABLE_RENDERING
 
 if TYPE_CHECKING:
     from checkov.common.graph.graph_builder.graph_components.blocks import Block  # noqa
@@ -18,80 +22,144 @@ _Block = TypeVar("_Block", bound="Block")
 class VariableRenderer(ABC):
     MAX_NUMBER_OF_LOOPS = 50
 
-    def __init__(self, local_graph: LocalGraph[_Block]) -> None:
+    def __init__(self, local_graph: LocalGraph[_Block], vertices_to_render: Optional[Set[int]] = None) -> None:
+        """
+        :param vertices_to_render: indexes of the vertices to render, all other vertices are treated as already
+                                   rendered. If not set, all vertices are rendered.
+        """
         self.local_graph = local_graph
+        self.vertices_to_render = vertices_to_render
         self.run_async = True if os.getenv("RENDER_VARIABLES_ASYNC") == "True" else False
         self.max_workers = int(os.getenv("RENDER_ASYNC_MAX_WORKERS", 50))
-        self.duplicate_percent = int(os.getenv("RENDER_EDGES_DUPLICATE_PERCENT", 90))
-        self.duplicate_iter_count = int(os.getenv("RENDER_EDGES_DUPLICATE_ITER_COUNT", 4))
-        self.done_edges_by_origin_vertex: Dict[int, List[Edge]] = {}
         self.replace_cache: List[Dict[str, Any]] = [{}] * len(local_graph.vertices)
 
+    @profiled(VARIABLE_RENDERING)
     def render_variables_from_local_graph(self) -> None:
         self._render_variables_from_edges()
         self._render_variables_from_vertices()
 
     def _render_variables_from_edges(self) -> None:
-        # find vertices with out-degree = 0 and in-degree > 0
-        end_vertices_indexes = self.local_graph.get_vertices_with_degrees_conditions(
-            out_degree_cond=lambda degree: degree == 0, in_degree_cond=lambda degree: degree > 0
-        )
-
-        # all the edges entering `end_vertices`
-        edges_to_render = self.local_graph.get_in_edges(end_vertices_indexes)
-        end_vertices_indexes = set()
-        loops = 0
-        evaluated_edges_cache: list[list[Edge]] = [[], []]
-        duplicates_count = 0
-        while edges_to_render:
-            evaluated_edges_two_iter_ago = evaluated_edges_cache[-2]
-            intersection_edges = set(edges_to_render).intersection(evaluated_edges_two_iter_ago)
-            match_percent = int((len(intersection_edges) / len(edges_to_render)) * 100)
-            if match_percent > self.duplicate_percent:
-                duplicates_count += 1
-            if duplicates_count > self.duplicate_iter_count:
-                logging.info(f"Reached too many edge duplications of {self.duplicate_percent}% for {self.duplicate_iter_count} iterations. breaking.")
-                break
-            evaluated_edges_cache.append(edges_to_render)
-
-            logging.info(f"evaluating {len(edges_to_render)} edges")
-            # group edges that have the same origin and label together
-            edges_groups = self.group_edges_by_origin_and_label(edges_to_render)
-            if self.run_async:
-                run_function_multithreaded(
-                    func=self._edge_evaluation_task,
-                    data=edges_groups,
-                    max_group_size=1,
-                    num_of_workers=self.max_workers,
-                )
-            else:
-                for edge_group in edges_groups:
-                    self._edge_evaluation_task([edge_group])
-            for edge in edges_to_render:
-                origin = edge.origin
-                self.done_edges_by_origin_vertex.setdefault(origin, []).append(edge)
-
-            for edge in edges_to_render:
-                origin_vertex_index = edge.origin
-                out_edges = set(self.local_graph.out_edges.get(origin_vertex_index, []))
-                done_edges_for_origin = self.done_edges_by_origin_vertex.get(origin_vertex_index, [])
-                if out_edges.issubset(done_edges_for_origin):
-                    end_vertices_indexes.add(origin_vertex_index)
-            new_edges_to_render = self.local_graph.get_in_edges_deduped(end_vertices_indexes)
-            edges_to_render = self.local_graph.sort_edged_by_dest_out_degree(
-                new_edges_to_render - set(edges_to_render)
-            )
-
-            loops += 1
-            if loops >= self.MAX_NUMBER_OF_LOOPS:
-                logging.warning("Reached 50 graph edge iterations, breaking.")
-                break
-
-        self.local_graph.update_vertices_configs()
+        """
+        Renders the vertices in the order of their references, a vertex is evaluated only after all the vertices
+        it references are final. Vertices, which reference each other, are evaluated together until they don't change.
+        """
+        for components in self.get_components_by_level():
+            acyclic_vertices_indexes = []
+            cyclic_components = []
+            for vertices_indexes in components:
+                if len(vertices_indexes) == 1 and not self._has_self_reference(vertices_indexes[0]):
+                    acyclic_vertices_indexes.append(vertices_indexes[0])
+                else:
+                    cyclic_components.append(vertices_indexes)
+
+            # vertices of the same level don't reference each other, therefore they can be evaluated in any order
+            edges_to_render = [
+                edge for vertex_index in sorted(acyclic_vertices_indexes) for edge in self._get_out_edges(vertex_index)
+            ]
+            logging.debug(f"evaluating {len(edges_to_render)} edges")
+            self._evaluate_edges(edges_to_render)
+
+            for vertices_indexes in cyclic_components:
+                self._render_variables_in_cycle(vertices_indexes)
+
+        self.local_graph.update_vertices_configs(self.vertices_to_render)
         logging.info("done evaluating edges")
         self.evaluate_non_rendered_values()
         logging.info("done evaluate_non_rendered_values")
 
+    def get_components_by_level(self) -> List[List[List[int]]]:
+        """
+        Computes the strongly connected components of the references graph and groups them by their level,
+        where the first level contains the components without any references and every other level only
+        references components of the previous levels.
+
+        :return: the vertices indexes of the components of each level
+        """
+        references_graph = nx.DiGraph()
+        references_graph.add_edges_from((edge.origin, edge.dest) for edge in self.local_graph.edges)
+        condensed_graph = nx.condensation(references_graph)
+
+        components_levels: Dict[int, int] = {}
+        levels: List[List[List[int]]] = []
+        # the reversed topological order makes sure all referenced components already have a level
+        for component in reversed(list(nx.topological_sort(condensed_graph))):
+            level = max((components_levels[dest] + 1 for dest in condensed_graph.successors(component)), default=0)
+            components_levels[component] = level
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(sorted(condensed_graph.nodes[component]["members"]))
+
+        for components in levels:
+            components.sort()
+        return levels
+
+    def _render_variables_in_cycle(self, vertices_indexes: List[int]) -> None:
+        """
+        References to vertices outside the cycle are final and evaluated once,
+        the references inside the cycle are evaluated until a fixed point or the max number of loops is reached
+        """
+        cycle_vertices = set(vertices_indexes)
+        out_edges = [edge for vertex_index in vertices_indexes for edge in self._get_out_edges(vertex_index)]
+        self._evaluate_edges([edge for edge in out_edges if edge.dest not in cycle_vertices])
+
+        cycle_edges = self.filter_edges_to_render([edge for edge in out_edges if edge.dest in cycle_vertices])
+        if not cycle_edges:
+            return
+
+        max_loops = min(len(vertices_indexes) + 1, self.MAX_NUMBER_OF_LOOPS)
+        values = self._get_edges_origin_values(cycle_edges)
+        for _ in range(max_loops):
+            self._evaluate_edges(cycle_edges)
+            new_values = self._get_edges_origin_values(cycle_edges)
+            if new_values == values:
+                return
+            values = new_values
+
+        logging.info(f"Reached {max_loops} iterations for the cyclic references of vertices {vertices_indexes}")
+
+    def _evaluate_edges(self, edges: List[Edge]) -> None:
+        # group edges that have the same origin and label together
+        edges_groups = self.group_edges_by_origin_and_label(self.filter_edges_to_render(edges))
+        if self.run_async:
+            run_function_multithreaded(
+                func=self._edge_evaluation_task,
+                data=edges_groups,
+                max_group_size=1,
+                num_of_workers=self.max_workers,
+            )
+        else:
+            for edge_group in edges_groups:
+                self._edge_evaluation_task([edge_group])
+
+    def _get_out_edges(self, vertex_index: int) -> List[Edge]:
+        # the edges to vertices with fewer references are evaluated first
+        return sorted(
+            self.local_graph.out_edges.get(vertex_index, []),
+            key=lambda edge: (len(self.local_graph.out_edges.get(edge.dest, [])), edge.dest),
+        )
+
+    def _has_self_reference(self, vertex_index: int) -> bool:
+        return any(edge.dest == vertex_index for edge in self.local_graph.out_edges.get(vertex_index, []))
+
+    def _get_edges_origin_values(self, edges: List[Edge]) -> Dict[Tuple[int, str], Any]:
+        return {
+            (edge.origin, edge.label): deepcopy(self.local_graph.vertices[edge.origin].attributes.get(edge.label))
+            for edge in edges
+        }
+
+    def filter_edges_to_render(self, edges: List[Edge]) -> List[Edge]:
+        """
+        Edges of vertices, which are not rendered, are skipped, because their origin already has its final value
+        """
+        if self.vertices_to_render is None:
+            return edges
+        return [edge for edge in edges if edge.origin in self.vertices_to_render]
+
+    def get_vertices_to_render(self) -> Iterable[Block]:
+        if self.vertices_to_render is None:
+            return self.local_graph.vertices
+        return (self.local_graph.vertices[index] for index in sorted(self.vertices_to_render))
+
     @abstractmethod
     def _render_variables_from_vertices(self) -> None:
         pass
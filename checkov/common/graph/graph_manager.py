@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Type, Any, TYPE_CHECKING, TypeVar, Generic
 
 from checkov.common.graph.db_connectors.db_connector import DBConnector
+from checkov.common.util.profiler import profiled, GRAPH_BUILD
 
 if TYPE_CHECKING:
     import networkx as nx
@@ -38,6 +39,7 @@ class GraphManager(Generic[_LocalGraph]):
     ) -> _LocalGraph:
         pass
 
+    @profiled(GRAPH_BUILD)
     def save_graph(self, graph: _LocalGraph) -> nx.DiGraph:
         return self.db_connector.save_graph(graph)
 
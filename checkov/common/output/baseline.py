@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import bisect
+import gzip
 import json
 from collections import defaultdict
 from operator import itemgetter
@@ -12,6 +14,9 @@ if TYPE_CHECKING:
     from checkov.common.output.report import Report
     from checkov.common.typing import _BaselineFinding, _BaselineFailedChecks
 
+# the compact baseline format is gzip compressed JSON, which is detected by the magic number of gzip
+GZIP_MAGIC_NUMBER = b"\x1f\x8b"
+
 
 class Baseline:
     def __init__(self, output_skipped: bool = False) -> None:
@@ -19,18 +24,20 @@ class Baseline:
         self.path_failed_checks_map: dict[str, list[_BaselineFinding]] = defaultdict(list)
         self.failed_checks: list[_BaselineFailedChecks] = []
         self.output_skipped = output_skipped
+        # (resource, check ID) of all failed checks, a check matches the baseline independent of its file
+        self.findings_index: set[tuple[str, str]] = set()
+        # (file, resource) -> finding of the findings added from reports
+        self._path_findings_index: dict[tuple[str, str], _BaselineFinding] = {}
 
     def add_findings_from_report(self, report: Report) -> None:
         for check in report.failed_checks:
-            try:
-                existing = next(
-                    x for x in self.path_failed_checks_map[check.file_path] if x["resource"] == check.resource
-                )
-            except StopIteration:
+            existing = self._path_findings_index.get((check.file_path, check.resource))
+            if existing is None:
                 existing = {"resource": check.resource, "check_ids": []}
                 self.path_failed_checks_map[check.file_path].append(existing)
-            existing["check_ids"].append(check.check_id)
-            existing["check_ids"].sort()  # Sort the check IDs to be nicer to the eye
+                self._path_findings_index[(check.file_path, check.resource)] = existing
+            # Sort the check IDs to be nicer to the eye
+            bisect.insort(existing["check_ids"], check.check_id)
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -71,27 +78,49 @@ class Baseline:
             scan_report.skipped_checks = [
                 check for check in scan_report.skipped_checks if self._is_check_in_baseline(check)
             ]
-            if self.output_skipped:
-                for check in scan_report.failed_checks:
-                    if self._is_check_in_baseline(check):
-                        check.check_result["suppress_comment"] = "baseline-skipped"
-                        check.check_result["result"] = CheckResult.SKIPPED
-                        scan_report.skipped_checks.append(check)
-            scan_report.failed_checks = [
-                check for check in scan_report.failed_checks if not self._is_check_in_baseline(check)
+            baseline_failed_checks = [
+                check for check in scan_report.failed_checks if self._is_check_in_baseline(check)
             ]
+            if self.output_skipped:
+                for check in baseline_failed_checks:
+                    check.check_result["suppress_comment"] = "baseline-skipped"
+                scan_report.move_records(baseline_failed_checks, CheckResult.SKIPPED)
+            else:
+                scan_report.remove_records(baseline_failed_checks)
 
     def _is_check_in_baseline(self, check: Record) -> bool:
-        failed_check_id = check.check_id
-        failed_check_resource = check.resource
-        for baseline_failed_check in self.failed_checks:
-            for finding in baseline_failed_check["findings"]:
-                if finding["resource"] == failed_check_resource and failed_check_id in finding["check_ids"]:
-                    return True
-        return False
+        return (check.resource, check.check_id) in self.findings_index
+
+    def _build_findings_index(self) -> None:
+        self.findings_index = {
+            (finding["resource"], check_id)
+            for baseline_failed_check in self.failed_checks
+            for finding in baseline_failed_check["findings"]
+            for check_id in finding["check_ids"]
+        }
 
     def from_json(self, file_path: str) -> None:
+        """Loads a baseline file, either in the JSON or in the compact format"""
+
         self.path = file_path
-        with open(file_path, "r") as f:
-            baseline_raw = json.load(f)
-            self.failed_checks = baseline_raw.get("failed_checks", {})
+        with open(file_path, "rb") as f:
+            content = f.read()
+        if content.startswith(GZIP_MAGIC_NUMBER):
+            content = gzip.decompress(content)
+        baseline_raw = json.loads(content)
+        self.failed_checks = baseline_raw.get("failed_checks", [])
+        self._build_findings_index()
+
+    def write(self, file_path: str, compact: bool = False) -> None:
+        """
+        Writes the baseline file, either as indented JSON or in the compact format,
+        which is gzip compressed JSON without indentation and is a lot smaller for big baselines
+        """
+
+        if compact:
+            content = json.dumps(self.to_dict(), separators=(",", ":")).encode("utf-8")
+            with open(file_path, "wb") as f:
+                f.write(gzip.compress(content))
+        else:
+            with open(file_path, "w") as f:
+                json.dump(self.to_dict(), f, indent=4)
@@ -4,11 +4,12 @@ import argparse
 import json
 import logging
 import os
-from collections.abc import Iterable
+import sys
+from collections.abc import Iterable, Iterator
 
-from typing import List, Dict, Union, Any, Optional, Set, TYPE_CHECKING, cast
+from typing import List, Dict, Union, Any, Optional, Set, TYPE_CHECKING, Callable, TextIO, cast
 from colorama import init
-from junit_xml import TestCase, TestSuite, to_xml_report_string  # type:ignore[import]
+from junit_xml import TestCase, TestSuite, to_xml_report_string, to_xml_report_file  # type:ignore[import]
 from tabulate import tabulate
 from termcolor import colored
 
@@ -19,7 +20,7 @@ from checkov.common.models.enums import CheckResult
 from checkov.common.typing import _ExitCodeThresholds
 from checkov.common.output.record import Record, SCA_PACKAGE_SCAN_CHECK_NAME
 from checkov.common.util.consts import PARSE_ERROR_FAIL_FLAG
-from checkov.common.util.json_utils import CustomJSONEncoder
+from checkov.common.util.json_utils import CustomJSONEncoder, stream_json
 from checkov.common.util.type_forcers import convert_csv_string_arg_to_list
 from checkov.runner_filter import RunnerFilter
 from checkov.version import version
@@ -68,6 +69,27 @@ class Report:
         if record.check_result["result"] == CheckResult.SKIPPED:
             self.skipped_checks.append(record)
 
+    def remove_records(self, records: Iterable[Record]) -> None:
+        """Removes the given records from the passed, failed and skipped checks with a single pass over each of them"""
+
+        record_ids = {id(record) for record in records}
+        if not record_ids:
+            return
+
+        self.passed_checks = [record for record in self.passed_checks if id(record) not in record_ids]
+        self.failed_checks = [record for record in self.failed_checks if id(record) not in record_ids]
+        self.skipped_checks = [record for record in self.skipped_checks if id(record) not in record_ids]
+
+    def move_records(self, records: Iterable[Record], result: CheckResult) -> None:
+        """Changes the result of the given records and moves them to the checks of the new result"""
+
+        # each record is moved once, even if it is given multiple times
+        records_by_id = {id(record): record for record in records}
+        self.remove_records(records_by_id.values())
+        for record in records_by_id.values():
+            record.check_result["result"] = result
+            self.add_record(record)
+
     def get_summary(self) -> Dict[str, Union[int, str]]:
         return {
             "passed": len(self.passed_checks),
@@ -85,13 +107,31 @@ class Report:
         return self.failed_checks + self.passed_checks + self.skipped_checks
 
     def get_dict(self, is_quiet: bool = False, url: str | None = None) -> dict[str, Any]:
+        return self._get_dict(
+            is_quiet=is_quiet, url=url, get_records=lambda records: [record.__dict__ for record in records]
+        )
+
+    def get_streamable_dict(
+        self, is_quiet: bool = False, url: str | None = None, strip_code_blocks: bool = False
+    ) -> dict[str, Any]:
+        """Same as get_dict(), but the records are generated while the dict is written via stream_json()"""
+
+        return self._get_dict(
+            is_quiet=is_quiet,
+            url=url,
+            get_records=lambda records: self._iter_record_dicts(records, strip_code_blocks=strip_code_blocks),
+        )
+
+    def _get_dict(
+        self, is_quiet: bool, url: str | None, get_records: Callable[[List[Record]], Iterable[Dict[str, Any]]]
+    ) -> dict[str, Any]:
         if not url:
             url = "Add an api key '--bc-api-key <api-key>' to see more detailed insights via https://bridgecrew.cloud"
         if is_quiet:
             return {
                 "check_type": self.check_type,
                 "results": {
-                    "failed_checks": [check.__dict__ for check in self.failed_checks]
+                    "failed_checks": get_records(self.failed_checks)
                 },
                 "summary": self.get_summary(),
             }
@@ -99,15 +139,30 @@ class Report:
             return {
                 "check_type": self.check_type,
                 "results": {
-                    "passed_checks": [check.__dict__ for check in self.passed_checks],
-                    "failed_checks": [check.__dict__ for check in self.failed_checks],
-                    "skipped_checks": [check.__dict__ for check in self.skipped_checks],
+                    "passed_checks": get_records(self.passed_checks),
+                    "failed_checks": get_records(self.failed_checks),
+                    "skipped_checks": get_records(self.skipped_checks),
                     "parsing_errors": list(self.parsing_errors),
                 },
                 "summary": self.get_summary(),
                 "url": url,
             }
 
+    @staticmethod
+    def _iter_record_dicts(records: List[Record], strip_code_blocks: bool = False) -> Iterator[Dict[str, Any]]:
+        for record in records:
+            if strip_code_blocks:
+                yield {
+                    key: value
+                    for key, value in record.__dict__.items()
+                    if key not in ("code_block", "connected_node")
+                }
+            else:
+                yield record.__dict__
+
+    def write_json(self, f: TextIO, is_quiet: bool = False, url: str | None = None, indent: int | None = 4) -> None:
+        stream_json(self.get_streamable_dict(is_quiet=is_quiet, url=url), f, indent=indent)
+
     def get_exit_code(self, exit_code_thresholds: _ExitCodeThresholds) -> int:
         """
         Returns the appropriate exit code depending on the flags that are passed in.
@@ -223,18 +278,30 @@ class Report:
         print(colored(f"Error parsing file {file}", "red"))
 
     def get_sarif_json(self, tool: str) -> Dict[str, Any]:
-        runs = []
-        rules = []
-        results = []
-        ruleset = set()
-        idx = 0
-        level = "warning"
+        sarif_report = self.get_streamable_sarif_json(tool)
+        for run in sarif_report["runs"]:
+            run["results"] = list(run["results"])
+        return sarif_report
+
+    def get_streamable_sarif_json(self, tool: str) -> Dict[str, Any]:
+        """Same as get_sarif_json(), but the results are generated while the report is written via stream_json()"""
+
         tool = tool if tool else "Bridgecrew"
         information_uri = "https://docs.bridgecrew.io" if tool.lower() == "bridgecrew" else "https://checkov.io"
 
-        for record in self.failed_checks + self.skipped_checks:
-            if self.check_type == CheckType.SCA_PACKAGE and record.check_name != SCA_PACKAGE_SCAN_CHECK_NAME: continue
-            rule = {
+        records = [
+            record
+            for record in self.failed_checks + self.skipped_checks
+            if self.check_type != CheckType.SCA_PACKAGE or record.check_name == SCA_PACKAGE_SCAN_CHECK_NAME
+        ]
+
+        rules: List[Dict[str, Any]] = []
+        rule_indexes: Dict[str, int] = {}
+        for record in records:
+            if record.check_id in rule_indexes:
+                continue
+            rule_indexes[record.check_id] = len(rules)
+            rules.append({
                 "id": record.check_id,
                 "name": record.check_name,
                 "shortDescription": {
@@ -247,21 +314,37 @@ class Report:
                     "text": f'"{record.check_name}\nResource: {record.resource}\nGuideline: {record.guideline}"',
                 },
                 "defaultConfiguration": {"level": "error"},
-            }
-            if record.check_id not in ruleset:
-                ruleset.add(record.check_id)
-                rules.append(rule)
-                idx = rules.index(rule)
-            else:
-                for r in rules:
-                    if r['id'] == rule['id']:
-                        idx = rules.index(r)
-                        break
+            })
+
+        runs = [{
+            "tool": {
+                "driver": {
+                    "name": tool,
+                    "version": version,
+                    "informationUri": information_uri,
+                    "rules": rules,
+                    "organization": "bridgecrew",
+                }
+            },
+            "results": self._iter_sarif_results(records, rule_indexes),
+        }]
+        sarif_template_report = {
+            "$schema": "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/master/Schemata/sarif-schema-2.1.0.json",
+            "version": "2.1.0",
+            "runs": runs,
+        }
+        return sarif_template_report
+
+    @staticmethod
+    def _iter_sarif_results(records: List[Record], rule_indexes: Dict[str, int]) -> Iterator[Dict[str, Any]]:
+        level = "warning"
+        for record in records:
             if record.file_line_range[0] == 0:
                 record.file_line_range[0] = 1
             if record.file_line_range[1] == 0:
                 record.file_line_range[1] = 1
 
+            # a record without severity keeps the level of the previous one
             if record.severity:
                 level = SEVERITY_TO_SARIF_LEVEL.get(record.severity.name.lower(), "none")
             elif record.check_result.get("result") == CheckResult.FAILED:
@@ -269,7 +352,7 @@ class Report:
 
             result = {
                 "ruleId": record.check_id,
-                "ruleIndex": idx,
+                "ruleIndex": rule_indexes[record.check_id],
                 "level": level,
                 "attachments": [{'description': detail} for detail in record.details],
                 "message": {
@@ -303,31 +386,15 @@ class Report:
                     }
                 ]
 
-            results.append(result)
+            yield result
 
-        runs.append({
-            "tool": {
-                "driver": {
-                    "name": tool,
-                    "version": version,
-                    "informationUri": information_uri,
-                    "rules": rules,
-                    "organization": "bridgecrew",
-                }
-            },
-            "results": results,
-        })
-        sarif_template_report = {
-            "$schema": "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/master/Schemata/sarif-schema-2.1.0.json",
-            "version": "2.1.0",
-            "runs": runs,
-        }
-        return sarif_template_report
+    def write_sarif(self, f: TextIO, tool: str, indent: int | None = None) -> None:
+        stream_json(self.get_streamable_sarif_json(tool), f, indent=indent)
 
     def write_sarif_output(self, tool: str) -> None:
         try:
             with open("results.sarif", "w") as f:
-                f.write(json.dumps(self.get_sarif_json(tool)))
+                self.write_sarif(f, tool)
                 print("\nWrote output in SARIF format to the file 'results.sarif'")
         except EnvironmentError as e:
             print("\nAn error occurred while writing SARIF results to file: results.sarif")
@@ -337,6 +404,10 @@ class Report:
     def get_junit_xml_string(ts: List[TestSuite]) -> str:
         return cast(str, to_xml_report_string(ts))
 
+    @staticmethod
+    def write_junit_xml(f: TextIO, ts: List[TestSuite]) -> None:
+        to_xml_report_file(f, ts)
+
     def print_failed_github_md(self, use_bc_ids: bool = False) -> str:
         result = []
         for record in self.failed_checks:
@@ -494,7 +565,8 @@ class Report:
         return "\n".join(failure_output)
 
     def print_json(self) -> None:
-        print(self.get_json())
+        self.write_json(sys.stdout)
+        print()
 
     @staticmethod
     def enrich_plan_report(
@@ -520,12 +592,10 @@ class Report:
             )
             for skip in resource_skips:
                 if record.check_id in skip["id"]:
-                    # Mark for removal and add it as a skipped record. It is not safe to remove
-                    # the record from failed_checks immediately because we're iterating over it
+                    # Mark it to be moved to the skipped records. It is not safe to move
+                    # the record immediately because we're iterating over the failed_checks
                     skip_records.append(record)
-                    record.check_result["result"] = CheckResult.SKIPPED
                     record.check_result["suppress_comment"] = skip["suppress_comment"]
-                    report.add_record(record)
 
             if record.resource_address and record.resource_address.startswith("module."):
                 module_path = record.resource_address[0:record.resource_address.index('.', len("module.") + 1)]
@@ -533,13 +603,9 @@ class Report:
                 for module_skip in module_enrichments.get("skipped_checks", []):
                     if record.check_id in module_skip["id"]:
                         skip_records.append(record)
-                        record.check_result["result"] = CheckResult.SKIPPED
                         record.check_result["suppress_comment"] = module_skip["suppress_comment"]
-                        report.add_record(record)
 
-        for record in skip_records:
-            if record in report.failed_checks:
-                report.failed_checks.remove(record)
+        report.move_records(skip_records, CheckResult.SKIPPED)
         return report
 
 
@@ -552,13 +618,13 @@ def merge_reports(base_report: Report, report_to_merge: Report) -> None:
 
 def remove_duplicate_results(report: Report) -> Report:
     def dedupe_records(origin_records: list[Record]) -> list[Record]:
-        record_cache = []
+        record_cache: set[str] = set()
         new_records = []
         for record in origin_records:
             record_hash = record.get_unique_string()
             if record_hash not in record_cache:
                 new_records.append(record)
-                record_cache.append(record_hash)
+                record_cache.add(record_hash)
         return new_records
 
     report.passed_checks = dedupe_records(report.passed_checks)
@@ -1,20 +1,39 @@
 from __future__ import annotations
 
 import concurrent.futures
+import logging
 import multiprocessing
 import os
 import platform
-from typing import Any, List, Generator, Iterator, Callable, Optional, TypeVar, TYPE_CHECKING
+import traceback
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from typing import Any, List, Generator, Iterator, Callable, Optional, TypeVar, TYPE_CHECKING, cast
+
+from checkov.common.util.profiler import profiler, ProfileData
+from checkov.common.util.type_forcers import force_int
 
 if TYPE_CHECKING:
     from multiprocessing.connection import Connection
 
 _T = TypeVar("_T")
 
+CHECKOV_PARALLEL_RESULTS_BATCH_SIZE = force_int(os.getenv("CHECKOV_PARALLEL_RESULTS_BATCH_SIZE")) or 50
+
+
+@dataclass
+class WorkerFailure:
+    """
+    The traceback of an item, which failed in a worker process, the remaining items of its group are skipped
+    """
+
+    traceback: str
+
 
 class ParallelRunner:
-    def __init__(self, workers_number: int | None = None) -> None:
+    def __init__(self, workers_number: int | None = None, results_batch_size: int | None = None) -> None:
         self.workers_number = (workers_number if workers_number else os.cpu_count()) or 1
+        self.results_batch_size = results_batch_size or CHECKOV_PARALLEL_RESULTS_BATCH_SIZE
         self.os = platform.system()
 
     def run_function(self, func: Callable[[Any], _T], items: List[Any], group_size: Optional[int] = None, run_multiprocess: Optional[bool] = False) -> Iterator[_T]:
@@ -28,30 +47,100 @@ class ParallelRunner:
 
     def _run_function_multiprocess(self, func: Callable[[Any], Any], items: List[Any], group_size: Optional[int]) \
             -> Generator[Any, None, None]:
+        if not items:
+            return
         if not group_size:
             group_size = int(len(items) / self.workers_number) + 1
         groups_of_items = [items[i: i + group_size] for i in range(0, len(items), group_size)]
+        results_batch_size = self.results_batch_size
 
         def func_wrapper(original_func: Callable[[Any], Any], items_group: List[Any], connection: Connection) -> None:
-            for item in items_group:
-                result = original_func(item)
-                connection.send(result)
+            # the profile of the parent is already recorded there, only the one of this worker is sent back
+            profiler.reset()
+            # results are sent in batches to reduce the number of pickling and pipe round trips
+            batch = []
+            try:
+                for item in items_group:
+                    batch.append(original_func(item))
+                    if len(batch) >= results_batch_size:
+                        connection.send(batch)
+                        batch = []
+            except Exception:
+                # the finished results are still sent, if an item fails, like it was without batching
+                if batch:
+                    connection.send(batch)
+                    batch = []
+                connection.send(WorkerFailure(traceback=traceback.format_exc()))
+            if batch:
+                connection.send(batch)
+            if profiler.enabled:
+                connection.send(profiler.collect())
             connection.close()
 
-        processes = []
-        for group_of_items in groups_of_items:
-            parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
-            process = multiprocessing.get_context("fork").Process(target=func_wrapper,
-                                                                  args=(func, group_of_items, child_conn))
-            processes.append((process, parent_conn, len(group_of_items)))
+        # the callables are mostly closures over runner state, which can't be pickled to a pre-forked pool,
+        # therefore the workers are forked per group, but never more than the configured number of workers at once.
+        # The results of all workers are read, as soon as they are sent, and the next group is started,
+        # when any worker finished. Results of later groups are buffered, so they are yielded in the order of the groups.
+        context = multiprocessing.get_context("fork")
+        pending_groups = iter(enumerate(groups_of_items))
+        # the running workers by the read end of their pipe
+        workers: dict[Connection, tuple[int, multiprocessing.process.BaseProcess]] = {}
+        results_by_group: dict[int, list[Any]] = {}
+        finished_groups: set[int] = set()
+        next_group_index = 0
+
+        def start_next_group() -> None:
+            group_index, group_of_items = next(pending_groups, (-1, None))
+            if group_of_items is None:
+                return
+            parent_conn, child_conn = context.Pipe(duplex=False)
+            process = context.Process(target=func_wrapper, args=(func, group_of_items, child_conn))
             process.start()
+            # close the parent copy of the write end, so a crashed worker results in an EOFError and not a hang
+            child_conn.close()
+            workers[parent_conn] = (group_index, process)
+            results_by_group[group_index] = []
+
+        try:
+            for _ in range(self.workers_number):
+                start_next_group()
+
+            while workers:
+                for ready_conn in wait(list(workers)):
+                    # wait() returns the given connections
+                    parent_conn = cast("Connection", ready_conn)
+                    group_index, process = workers[parent_conn]
+                    try:
+                        batch = parent_conn.recv()
+                    except EOFError:
+                        del workers[parent_conn]
+                        parent_conn.close()
+                        process.join()
+                        finished_groups.add(group_index)
+                        start_next_group()
+                        continue
+                    if isinstance(batch, ProfileData):
+                        profiler.merge(batch)
+                    elif isinstance(batch, WorkerFailure):
+                        logging.error(f"Failed to run an item in a worker process, the rest of its group is skipped\n{batch.traceback}")
+                    else:
+                        results_by_group[group_index].extend(batch)
 
-        for _, parent_conn, group_len in processes:
-            for _ in range(group_len):
-                try:
-                    yield parent_conn.recv()
-                except EOFError:
-                    pass
+                # the results of the current group are yielded right away, the ones of later groups when it's their turn
+                while next_group_index in results_by_group:
+                    group_results = results_by_group[next_group_index]
+                    results_by_group[next_group_index] = []
+                    yield from group_results
+                    if next_group_index not in finished_groups:
+                        break
+                    del results_by_group[next_group_index]
+                    next_group_index += 1
+        finally:
+            # workers are only left, if the consumer stopped early or failed, there is no one to read their results
+            for worker_conn, (_, worker) in workers.items():
+                worker_conn.close()
+                worker.terminate()
+                worker.join()
 
     def _run_function_multithreaded(self, func: Callable[[Any], _T], items: List[Any]) -> Iterator[_T]:
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers_number) as executor:
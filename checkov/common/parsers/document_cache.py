@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle  # nosec  # only documents written by the same scan are loaded
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, TypeVar
+
+from checkov.common.util.type_forcers import convert_str_to_bool
+
+_T = TypeVar("_T")
+
+CHECKOV_DOCUMENT_CACHE = convert_str_to_bool(os.getenv("CHECKOV_DOCUMENT_CACHE", "True"))
+
+# the runners of a scan run in forked processes, therefore the documents are shared via a temporary directory
+_cache_dir: str | None = None
+
+
+class _CachedError:
+    """Wraps the error of a document, which couldn't be loaded, so it is raised again instead of loading it again"""
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+@contextmanager
+def shared_document_cache() -> Iterator[str | None]:
+    """Lets load_document() share the loaded documents with all runners until the context is left"""
+
+    global _cache_dir
+
+    if not CHECKOV_DOCUMENT_CACHE or _cache_dir:
+        yield _cache_dir
+        return
+
+    with tempfile.TemporaryDirectory(prefix="checkov_documents_") as cache_dir:
+        _cache_dir = cache_dir
+        try:
+            yield cache_dir
+        finally:
+            _cache_dir = None
+
+
+def load_document(loader_name: str, filename: str, load: Callable[[str], _T]) -> _T:
+    """
+    Returns the document of the given file loaded by the given function. The result is cached for the file
+    in its current version, if there is a shared document cache, and each call returns a new copy of it.
+
+    :param loader_name: identifies the loader, because documents loaded by different loaders are not the same
+    """
+
+    if not _cache_dir:
+        return load(filename)
+
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return load(filename)
+
+    key = f"{loader_name}:{os.path.abspath(filename)}:{stat.st_mtime_ns}:{stat.st_size}"
+    cache_path = os.path.join(_cache_dir, hashlib.sha256(key.encode("utf-8")).hexdigest())
+
+    cached = _read_cache_file(cache_path)
+    if cached is not None:
+        if isinstance(cached, _CachedError):
+            raise cached.error
+        return cached  # type:ignore[no-any-return]  # it was written for the same loader
+
+    try:
+        document = load(filename)
+    except Exception as e:
+        _write_cache_file(cache_path, _CachedError(e))
+        raise
+
+    _write_cache_file(cache_path, document)
+    return document
+
+
+def _read_cache_file(cache_path: str) -> Any:
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)  # nosec  # only documents written by the same scan are loaded
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logging.debug(f"Failed to read the cached document {cache_path}", exc_info=True)
+        return None
+
+
+def _write_cache_file(cache_path: str, document: Any) -> None:
+    # the document is written to a temporary file first, so other processes never read a partial one
+    temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}"
+    try:
+        with open(temp_path, "wb") as f:
+            pickle.dump(document, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except Exception:
+        logging.debug(f"Failed to cache the document {cache_path}", exc_info=True)
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
@@ -10,7 +10,7 @@ from typing import Any, Dict
 
 from charset_normalizer import from_path
 
-from checkov.common.parsers.json.decoder import Decoder
+from checkov.common.parsers.json.decoder import decode
 from checkov.common.parsers.json.errors import DecodeError
 
 LOGGER = logging.getLogger(__name__)
@@ -30,7 +30,7 @@ def load(filename: str, allow_nulls: bool = True) -> tuple[dict[str, Any], list[
 
     file_lines = [(idx + 1, line) for idx, line in enumerate(content.splitlines(keepends=True))]
 
-    return (json.loads(content, cls=Decoder, allow_nulls=allow_nulls), file_lines)
+    return (decode(content, allow_nulls=allow_nulls), file_lines)
 
 
 def parse(
@@ -1,15 +1,25 @@
 from __future__ import annotations
 
+import json
 import logging
+import os
+import re
 from collections.abc import Sequence
 from json import JSONDecoder
 from json.decoder import WHITESPACE, WHITESPACE_STR, BACKSLASH, STRINGCHUNK, JSONArray  # type:ignore[attr-defined]  # they are not explicitly exported
-from typing import Any, Callable, Pattern, Match
+from typing import Any, Callable, Iterator, List, Pattern, Match, Tuple
 
 from json.scanner import NUMBER_RE  # type:ignore[import]  # is not explicitly exported
 
-from checkov.common.parsers.node import StrNode, DictNode, ListNode
+from checkov.common.parsers.node import StrNode, DictNode, ListNode, LineIndex
 from checkov.common.parsers.json.errors import NullError, DuplicateError, DecodeError
+from checkov.common.util.type_forcers import convert_str_to_bool
+
+CHECKOV_FAST_JSON_DECODER = convert_str_to_bool(os.getenv("CHECKOV_FAST_JSON_DECODER", "True"))
+
+# strings and the brackets of objects and arrays, these are the only tokens, which get a mark
+TOKEN_PATTERN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]')
+NEWLINE_PATTERN = re.compile("\n")
 
 
 class Mark:
@@ -164,7 +174,8 @@ def py_make_scanner(context: Decoder) -> Callable[[str, int], tuple[Any, int]]:
 
 def find_indexes(s: str, ch: str = "\n") -> list[int]:
     """Finds all instances of given char and returns list of indexes """
-    return [i for i, ltr in enumerate(s) if ltr == ch]
+    pattern = NEWLINE_PATTERN if ch == "\n" else re.compile(re.escape(ch))
+    return [match.start() for match in pattern.finditer(s)]
 
 
 def count_occurrences(arr: Sequence[int], key: int) -> int:
@@ -192,16 +203,32 @@ def largest_less_than(indexes: list[int], line_num: int, pos: int) -> int:
 
 def get_beg_end_mark(s: str, start: int, end: int, indexes: list[int]) -> tuple[Mark, Mark]:
     """Get the Start and End Mark """
+    return get_beg_mark(start, indexes), get_end_mark(end, indexes)
+
+
+def get_beg_mark(start: int, indexes: list[int]) -> Mark:
     beg_lineno = count_occurrences(indexes, start)
     beg_colno = start - largest_less_than(indexes, beg_lineno, start)
-    beg_mark = Mark(beg_lineno, beg_colno)
+    return Mark(beg_lineno, beg_colno)
+
 
+def get_end_mark(end: int, indexes: list[int]) -> Mark:
     offset = 1 if len(indexes) > 1 else 0
     end_lineno = count_occurrences(indexes, end) - offset
     end_colno = end - largest_less_than(indexes, end_lineno, end)
-    end_mark = Mark(end_lineno, end_colno)
+    return Mark(end_lineno, end_colno)
 
-    return beg_mark, end_mark
+
+class DecoderLineIndex(LineIndex):
+    """Line index, which creates the same marks as get_beg_end_mark()"""
+
+    __slots__ = ()
+
+    def get_start_mark(self, offset: int) -> Mark:
+        return get_beg_mark(offset, self.newline_indexes)
+
+    def get_end_mark(self, offset: int) -> Mark:
+        return get_end_mark(offset, self.newline_indexes)
 
 
 class Decoder(JSONDecoder):
@@ -220,10 +247,12 @@ class Decoder(JSONDecoder):
         setattr(self, "object_pairs_hook", self.check_duplicates)
         self.scan_once = py_make_scanner(self)
         self.newline_indexes: list[int] = []
+        self.line_index = DecoderLineIndex(self.newline_indexes)
 
     def decode(self, s: str, _w: Callable[..., Any] | None = None) -> Any:
         """Overridden to retrieve indexes """
         self.newline_indexes = find_indexes(s)
+        self.line_index = DecoderLineIndex(self.newline_indexes)
         obj = super().decode(s)
         return obj
 
@@ -232,17 +261,16 @@ class Decoder(JSONDecoder):
     ) -> tuple[ListNode, int]:
         """ Convert JSON array to be a list_node object """
         values, end = JSONArray(s_and_end, scan_once, **kwargs)
-        s, start = s_and_end
-        beg_mark, end_mark = get_beg_end_mark(s, start, end, self.newline_indexes)
-        return ListNode(values, beg_mark, end_mark), end
+        _, start = s_and_end
+        return ListNode(values, start, end, self.line_index), end
 
     def json_object(
         self,
         s_and_end: tuple[str, int],
         strict: bool,
         scan_once: Callable[[str, int], tuple[Any, int]],
-        object_hook: Callable[[dict[str, Any], Mark, Mark], Any],
-        object_pairs_hook: Callable[[list[tuple[str, Any]], Mark, Mark], Any],
+        object_hook: Callable[[dict[str, Any], int, int], Any],
+        object_pairs_hook: Callable[[list[tuple[str, Any]], int, int], Any],
         memo: dict[str, str] | None = None,
         _w: Callable[[str | Pattern[str], int], Match[str]] = WHITESPACE.match,
         _ws: str = WHITESPACE_STR,
@@ -268,8 +296,7 @@ class Decoder(JSONDecoder):
             if nextchar == '}':
                 if object_pairs_hook is not None:
                     try:
-                        beg_mark, end_mark = get_beg_end_mark(s, orginal_end, end + 1, self.newline_indexes)
-                        result = object_pairs_hook(pairs, beg_mark, end_mark)
+                        result = object_pairs_hook(pairs, orginal_end, end + 1)
                         return result, end + 1
                     except DuplicateError as err:
                         raise DecodeError('Duplicate found {}'.format(err), s, end)
@@ -277,8 +304,7 @@ class Decoder(JSONDecoder):
                         raise DecodeError('Null Error {}'.format(err), s, end)
                 pairs = {}
                 if object_hook is not None:
-                    beg_mark, end_mark = get_beg_end_mark(s, orginal_end, end + 1, self.newline_indexes)
-                    pairs = object_hook(pairs, beg_mark, end_mark)
+                    pairs = object_hook(pairs, orginal_end, end + 1)
                 return pairs, end + 1
 
             if nextchar != '"':
@@ -306,13 +332,12 @@ class Decoder(JSONDecoder):
             except IndexError:
                 pass
 
-            beg_mark, end_mark = get_beg_end_mark(s, begin, begin + len(key), self.newline_indexes)
             try:
                 value, end = scan_once(s, end)
             except StopIteration:
                 logging.debug("Failed to scan string", exc_info=True)
-                raise DecodeError('Expecting value', s, end_mark.line)
-            key_str = StrNode(key, beg_mark, end_mark)
+                raise DecodeError('Expecting value', s, self.line_index.get_end_mark(begin + len(key)).line)
+            key_str = StrNode(key, begin, begin + len(key), self.line_index)
             pairs_append((key_str, value))
             try:
                 nextchar = s[end]
@@ -335,8 +360,7 @@ class Decoder(JSONDecoder):
                     'Expecting property name enclosed in double quotes', s, end - 1)
         if object_pairs_hook is not None:
             try:
-                beg_mark, end_mark = get_beg_end_mark(s, orginal_end, end, self.newline_indexes)
-                result = object_pairs_hook(pairs, beg_mark, end_mark)
+                result = object_pairs_hook(pairs, orginal_end, end)
             except DuplicateError as err:
                 raise DecodeError('Duplicate found {}'.format(err), s, begin, key)
             except NullError as err:
@@ -345,17 +369,16 @@ class Decoder(JSONDecoder):
 
         pairs = dict(pairs)
         if object_hook is not None:
-            beg_mark, end_mark = get_beg_end_mark(s, orginal_end, end, self.newline_indexes)
-            pairs = object_hook(pairs, beg_mark, end_mark)
+            pairs = object_hook(pairs, orginal_end, end)
         return pairs, end
 
-    def check_duplicates(self, ordered_pairs: list[tuple[str, Any]], beg_mark: Mark, end_mark: Mark) -> DictNode:
+    def check_duplicates(self, ordered_pairs: list[tuple[str, Any]], beg: int, end: int) -> DictNode:
         """
             Check for duplicate keys on the current level, this is not desirable
             because a dict does not support this. It overwrites it with the last
             occurance, which can give unexpected results
         """
-        mapping = DictNode({}, beg_mark, end_mark)
+        mapping = DictNode({}, beg, end, self.line_index)
         for key, value in ordered_pairs:
             if not self.allow_nulls and value is None:
                 raise NullError('"{}"'.format(key))
@@ -363,3 +386,107 @@ class Decoder(JSONDecoder):
                 raise DuplicateError('"{}"'.format(key))
             mapping[key] = value
         return mapping
+
+
+class Pairs(List[Tuple[str, Any]]):
+    """Keeps all key value pairs of an object, so they can be aligned with the tokens of the document"""
+
+
+class NodeBuilder:
+    """
+    Converts a value, which was decoded with the `Pairs` object hook, to nodes, which keep the offsets of their tokens
+    found by the `TOKEN_PATTERN` and share the given line index of the document to create their marks.
+    """
+
+    def __init__(self, line_index: LineIndex) -> None:
+        self.line_index = line_index
+
+    def to_node(self, value: Any, tokens: Iterator[Match[str]]) -> Any:
+        # the values are visited in the same order as their tokens appear in the document
+        if isinstance(value, Pairs):
+            start = self.get_start(next(tokens))
+            pairs = []
+            for key, item in value:
+                key_node = self.create_key(key, next(tokens))
+                pairs.append((key_node, self.to_node(item, tokens) if isinstance(item, (list, str)) else item))
+            return self.create_dict(value, pairs, start, next(tokens).end())
+        if isinstance(value, list):
+            start = self.get_start(next(tokens))
+            items = [self.to_node(item, tokens) if isinstance(item, (list, str)) else item for item in value]
+            return ListNode(items, start, next(tokens).end(), self.line_index)
+        if isinstance(value, str):
+            return self.create_str(value, next(tokens))
+        return value
+
+    def get_start(self, token: Match[str]) -> int:
+        """Returns the start offset of an object or array by its opening bracket"""
+
+        return token.start()
+
+    def create_key(self, key: str, token: Match[str]) -> StrNode:
+        return StrNode(key, token.start(), token.end(), self.line_index)
+
+    def create_str(self, value: str, token: Match[str]) -> Any:
+        return StrNode(value, token.start(), token.end(), self.line_index)
+
+    def create_dict(self, value: Pairs, pairs: list[tuple[StrNode, Any]], start: int, end: int) -> DictNode:
+        return DictNode(dict(pairs), start, end, self.line_index)
+
+
+class _NotReproducibleError(Exception):
+    """The document has to be decoded by the Decoder to get the same result or error"""
+
+
+class FastDecoder(NodeBuilder):
+    """
+    Decodes with the C based JSON scanner and converts the result afterwards to the same nodes the Decoder creates.
+    The nodes keep the position of their tokens and share the line index of the document to create their marks.
+    """
+
+    def __init__(self, allow_nulls: bool = True) -> None:
+        super().__init__(DecoderLineIndex([]))
+        self.allow_nulls = allow_nulls
+
+    def decode(self, s: str) -> Any:
+        """
+        :raises ValueError: if the document is invalid or has duplicate keys or disallowed nulls,
+                            the Decoder should be used to get the matching error
+        """
+
+        obj = json.loads(s, object_pairs_hook=Pairs)
+        self.line_index = DecoderLineIndex(find_indexes(s))
+        try:
+            return self.to_node(obj, TOKEN_PATTERN.finditer(s))
+        except _NotReproducibleError as e:
+            raise ValueError("The document can't be decoded by the fast decoder") from e
+
+    def get_start(self, token: Match[str]) -> int:
+        # the marks of the Decoder start after the opening bracket
+        return token.end()
+
+    def create_key(self, key: str, token: Match[str]) -> StrNode:
+        begin = token.start()
+        return StrNode(key, begin, begin + len(key), self.line_index)
+
+    def create_str(self, value: str, token: Match[str]) -> Any:
+        # string values are plain strings like the ones of the Decoder
+        return value
+
+    def create_dict(self, value: Pairs, pairs: list[tuple[StrNode, Any]], start: int, end: int) -> DictNode:
+        mapping = super().create_dict(value, pairs, start, end)
+        if len(mapping) != len(value) or (not self.allow_nulls and None in mapping.values()):
+            # duplicate keys or nulls result in an error of the Decoder
+            raise _NotReproducibleError()
+        return mapping
+
+
+def decode(s: str, allow_nulls: bool = True) -> Any:
+    """Decodes the JSON document with marks, by default via the FastDecoder and the Decoder as fallback"""
+
+    if CHECKOV_FAST_JSON_DECODER:
+        try:
+            return FastDecoder(allow_nulls=allow_nulls).decode(s)
+        except (ValueError, RecursionError):
+            logging.debug("Failed to decode the document with the fast decoder, falling back to the Decoder", exc_info=True)
+
+    return json.loads(s, cls=Decoder, allow_nulls=allow_nulls)
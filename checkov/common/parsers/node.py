@@ -15,26 +15,88 @@ class TemplateAttributeError(AttributeError):
     """ Custom error to capture Attribute Errors in the Template """
 
 
-class StrNode(str):
+class LineIndex:
+    """
+    Offsets of the newlines of a document, which is shared by all of its nodes.
+    This way a node only keeps the offsets of its marks and the mark objects are created, when they are accessed.
+    """
+
+    __slots__ = ("newline_indexes",)
+
+    def __init__(self, newline_indexes: list[int]) -> None:
+        self.newline_indexes = newline_indexes
+
+    def get_start_mark(self, offset: int) -> Mark:
+        raise NotImplementedError()
+
+    def get_end_mark(self, offset: int) -> Mark:
+        raise NotImplementedError()
+
+
+class MarkedNode:
+    """Provides the marks of a node, which are either kept as mark objects or as offsets into a line index"""
+
+    # the slots are defined by the subclasses, because only one base class can have an instance layout
+    __slots__ = ()
+
+    _start_mark: Mark | int
+    _end_mark: Mark | int
+    _line_index: LineIndex | None
+
+    def _set_marks(self, start_mark: Mark | int, end_mark: Mark | int, line_index: LineIndex | None) -> None:
+        self._start_mark = start_mark  # type:ignore[misc]  # the slots are defined by the subclasses
+        self._end_mark = end_mark  # type:ignore[misc]  # the slots are defined by the subclasses
+        self._line_index = line_index  # type:ignore[misc]  # the slots are defined by the subclasses
+
+    @property
+    def start_mark(self) -> Mark:
+        start_mark = self._start_mark
+        if isinstance(start_mark, int) and self._line_index is not None:
+            return self._line_index.get_start_mark(start_mark)
+        return start_mark  # type:ignore[return-value]  # only an offset, if there is a line index
+
+    @start_mark.setter
+    def start_mark(self, start_mark: Mark) -> None:
+        self._start_mark = start_mark  # type:ignore[misc]  # the slots are defined by the subclasses
+
+    @property
+    def end_mark(self) -> Mark:
+        end_mark = self._end_mark
+        if isinstance(end_mark, int) and self._line_index is not None:
+            return self._line_index.get_end_mark(end_mark)
+        return end_mark  # type:ignore[return-value]  # only an offset, if there is a line index
+
+    @end_mark.setter
+    def end_mark(self, end_mark: Mark) -> None:
+        self._end_mark = end_mark  # type:ignore[misc]  # the slots are defined by the subclasses
+
+
+class StrNode(MarkedNode, str):
     """Node class created based on the input class"""
 
-    def __init__(self, x: str, start_mark: Mark, end_mark: Mark) -> None:
-        try:
-            super().__init__(x)  # type:ignore[call-arg]
-        except TypeError:
-            super().__init__()
-        self.start_mark = start_mark
-        self.end_mark = end_mark
+    # str subclasses can't have slots, therefore the marks are kept in the instance dict
+
+    def __init__(
+        self, x: str, start_mark: Mark | int, end_mark: Mark | int, line_index: LineIndex | None = None
+    ) -> None:
+        # the value itself is already set by __new__
+        self._set_marks(start_mark, end_mark, line_index)
 
     # pylint: disable=bad-classmethod-argument, unused-argument
-    def __new__(cls, x: str, start_mark: Mark | None = None, end_mark: Mark | None = None) -> StrNode:
+    def __new__(
+        cls,
+        x: str,
+        start_mark: Mark | int | None = None,
+        end_mark: Mark | int | None = None,
+        line_index: LineIndex | None = None,
+    ) -> StrNode:
         return str.__new__(cls, x)
 
     def __getattr__(self, name: str) -> Any:
         raise TemplateAttributeError(f'{name} is invalid')
 
     def __deepcopy__(self, memo: dict[int, Any]) -> StrNode:
-        result = StrNode(self, self.start_mark, self.end_mark)
+        result = StrNode(self, self._start_mark, self._end_mark, self._line_index)
         memo[id(self)] = result
         return result
 
@@ -42,20 +104,24 @@ class StrNode(str):
         return self
 
 
-class DictNode(dict):  # type:ignore[type-arg]  # either typing works or runtime, but not both
+class DictNode(MarkedNode, dict):  # type:ignore[type-arg]  # either typing works or runtime, but not both
     """Node class created based on the input class"""
 
-    def __init__(self, x: dict[str, Any], start_mark: Mark, end_mark: Mark):
+    __slots__ = ("_start_mark", "_end_mark", "_line_index")
+
+    condition_functions = ['Fn::If']
+
+    def __init__(
+        self, x: dict[str, Any], start_mark: Mark | int, end_mark: Mark | int, line_index: LineIndex | None = None
+    ) -> None:
         try:
             super().__init__(x)
         except TypeError:
             super().__init__()
-        self.start_mark = start_mark
-        self.end_mark = end_mark
-        self.condition_functions = ['Fn::If']
+        self._set_marks(start_mark, end_mark, line_index)
 
     def __deepcopy__(self, memo: dict[int, Any]) -> DictNode:
-        result = DictNode(self, self.start_mark, self.end_mark)
+        result = DictNode(self, self._start_mark, self._end_mark, self._line_index)
         memo[id(self)] = result
         for k, v in self.items():
             result[deepcopy(k)] = deepcopy(v, memo)
@@ -91,7 +157,7 @@ class DictNode(dict):  # type:ignore[type-arg]  # either typing works or runtime
     def get(self, key: str, default: Any = None) -> Any:
         """ Override the default get """
         if isinstance(default, dict):
-            default = DictNode(default, self.start_mark, self.end_mark)
+            default = DictNode(default, self._start_mark, self._end_mark, self._line_index)
         return super().get(key, default)
 
     def get_safe(
@@ -147,20 +213,24 @@ class DictNode(dict):  # type:ignore[type-arg]  # either typing works or runtime
         raise TemplateAttributeError(f'{name} is invalid')
 
 
-class ListNode(list):  # type:ignore[type-arg]  # either typing works or runtime, but not both
+class ListNode(MarkedNode, list):  # type:ignore[type-arg]  # either typing works or runtime, but not both
     """Node class created based on the input class"""
 
-    def __init__(self, x: list[Any], start_mark: Mark, end_mark: Mark) -> None:
+    __slots__ = ("_start_mark", "_end_mark", "_line_index")
+
+    condition_functions = ['Fn::If']
+
+    def __init__(
+        self, x: list[Any], start_mark: Mark | int, end_mark: Mark | int, line_index: LineIndex | None = None
+    ) -> None:
         try:
             super().__init__(x)
         except TypeError:
             super().__init__()
-        self.start_mark = start_mark
-        self.end_mark = end_mark
-        self.condition_functions = ['Fn::If']
+        self._set_marks(start_mark, end_mark, line_index)
 
     def __deepcopy__(self, memo: dict[int, Any]) -> ListNode:
-        result = ListNode([], self.start_mark, self.end_mark)
+        result = ListNode([], self._start_mark, self._end_mark, self._line_index)
         memo[id(self)] = result
         for v in self:
             result.append(deepcopy(v, memo))
@@ -6,6 +6,7 @@ from typing import Any
 from yaml import YAMLError
 
 import checkov.common.parsers.yaml.loader as loader
+from checkov.common.parsers.document_cache import load_document
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +18,11 @@ def parse(
     template_lines = None
     try:
         if filename.endswith(".yaml") or filename.endswith(".yml"):
-            (template, template_lines) = loader.load(filename, file_content)
+            if file_content:
+                (template, template_lines) = loader.load(filename, file_content)
+            else:
+                # the same files are parsed by most of the YAML based runners
+                (template, template_lines) = load_document("yaml", filename, loader.load)
 
         if template and template_lines:
             if isinstance(template, list):
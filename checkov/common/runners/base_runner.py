@@ -161,6 +161,22 @@ def filter_ignored_paths(
                 safe_remove(names, entry)
 
 
+def is_path_ignored(root_dir: str, file_path: str, excluded_paths: list[str] | None) -> bool:
+    """
+    Returns whether filter_ignored_paths() removes any directory or the file name of the path under the root folder,
+    like a walk of the root folder would do. Used for files, which are only kept in memory.
+    """
+
+    current_dir = root_dir
+    for name in os.path.relpath(file_path, root_dir).split(os.sep):
+        names = [name]
+        filter_ignored_paths(current_dir, names, excluded_paths)
+        if not names:
+            return True
+        current_dir = os.path.join(current_dir, name)
+    return False
+
+
 def safe_remove(names: list[Any], path: Any) -> None:
     if path in names:
         names.remove(path)
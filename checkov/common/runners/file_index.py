@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import os
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Tuple, List, Dict, FrozenSet
+
+from checkov.common.runners.base_runner import filter_ignored_paths, IGNORE_HIDDEN_DIRECTORY_ENV
+from checkov.common.util.type_forcers import convert_str_to_bool
+from checkov.common.util.profiler import profiled, FILE_DISCOVERY
+
+CHECKOV_SHARED_FILE_INDEX = convert_str_to_bool(os.getenv("CHECKOV_SHARED_FILE_INDEX", "True"))
+
+# a file of the index with its position in the walk order, the directory and the file name
+_IndexedFile = Tuple[int, str, str]
+
+
+class FileIndex:
+    """
+    Result of a single walk of a folder, which is shared by all runners of a scan instead of each of them walking it again.
+
+    The ignored directories and the excluded paths are already applied while walking. Hidden directories and files,
+    which any of the runners includes, are kept and therefore filtered again with the included paths of each runner.
+    """
+
+    def __init__(
+        self, root_folder: str, excluded_paths: list[str] | None = None, included_paths: Iterable[str] | None = None
+    ) -> None:
+        self.root_folder = root_folder
+        self.excluded_paths = excluded_paths or []
+        self.included_paths = frozenset(included_paths or [])
+
+        # directory -> sub directory and file names, in the order of os.walk()
+        self.directories: Dict[str, Tuple[List[str], List[str]]] = {}
+        # hidden directory names on the path of each directory, which have to be included by a runner to see it
+        self._hidden_parts: Dict[str, FrozenSet[str]] = {}
+        self._files: List[_IndexedFile] = []
+        self._files_by_extension: Dict[str, List[_IndexedFile]] = defaultdict(list)
+        self._files_by_name: Dict[str, List[_IndexedFile]] = defaultdict(list)
+
+        self._walk()
+
+    @profiled(FILE_DISCOVERY)
+    def _walk(self) -> None:
+        self._hidden_parts[self.root_folder] = frozenset()
+        for root, d_names, f_names in os.walk(self.root_folder):
+            filter_ignored_paths(root, d_names, self.excluded_paths, self.included_paths)
+            filter_ignored_paths(root, f_names, self.excluded_paths, self.included_paths)
+            self.directories[root] = (list(d_names), list(f_names))
+
+            hidden_parts = self._hidden_parts[root]
+            for d_name in d_names:
+                if IGNORE_HIDDEN_DIRECTORY_ENV and d_name.startswith("."):
+                    self._hidden_parts[os.path.join(root, d_name)] = hidden_parts | {d_name}
+                else:
+                    self._hidden_parts[os.path.join(root, d_name)] = hidden_parts
+
+            for f_name in f_names:
+                indexed_file = (len(self._files), root, f_name)
+                self._files.append(indexed_file)
+                self._files_by_extension[os.path.splitext(f_name)[1]].append(indexed_file)
+                self._files_by_name[f_name].append(indexed_file)
+
+    def matches(self, root_folder: str, excluded_paths: list[str] | None, included_paths: Iterable[str] | None) -> bool:
+        """Checks, if the index can replace a walk of the given folder with the given paths"""
+
+        return (
+            root_folder == self.root_folder
+            and set(self.excluded_paths).issubset(excluded_paths or [])
+            and self.included_paths.issuperset(included_paths or [])
+        )
+
+    def walk(
+        self, excluded_paths: list[str] | None = None, included_paths: Iterable[str] | None = None
+    ) -> Iterator[Tuple[str, List[str], List[str]]]:
+        """
+        Same as os.walk() with filter_ignored_paths() applied to the directory and file names,
+        the directory names can be modified in-place to prune the walk
+        """
+
+        extra_excluded_paths = [path for path in excluded_paths or [] if path not in self.excluded_paths]
+        included_paths = list(included_paths or [])
+
+        roots = [self.root_folder]
+        while roots:
+            root = roots.pop()
+            if root not in self.directories:
+                # symlinked or not accessible directories are listed, but not walked by os.walk()
+                continue
+            d_names, f_names = self.directories[root]
+            d_names = list(d_names)
+            f_names = list(f_names)
+            filter_ignored_paths(root, d_names, extra_excluded_paths, included_paths)
+            filter_ignored_paths(root, f_names, extra_excluded_paths, included_paths)
+
+            yield root, d_names, f_names
+
+            roots.extend(os.path.join(root, d_name) for d_name in reversed(d_names))
+
+    def find_files(
+        self,
+        file_extensions: Iterable[str] | None = None,
+        file_names: Iterable[str] | None = None,
+        excluded_paths: list[str] | None = None,
+        included_paths: Iterable[str] | None = None,
+    ) -> List[str]:
+        """
+        Returns the paths of the files with any of the given extensions or names in the walk order,
+        or all files, if neither is given
+        """
+
+        file_extensions = set(file_extensions or [])
+        file_names = set(file_names or [])
+
+        if any(path not in self.excluded_paths for path in excluded_paths or []):
+            # the additional excluded paths can prune whole directories, therefore the walk has to be replayed
+            return [
+                os.path.join(root, f_name)
+                for root, _, f_names in self.walk(excluded_paths, included_paths)
+                for f_name in f_names
+                if (not file_extensions and not file_names)
+                or f_name in file_names
+                or os.path.splitext(f_name)[1] in file_extensions
+            ]
+
+        if file_extensions or file_names:
+            candidates = {
+                indexed_file
+                for key, files_by_key in ((file_extensions, self._files_by_extension), (file_names, self._files_by_name))
+                for value in key
+                for indexed_file in files_by_key.get(value, [])
+            }
+            indexed_files: Iterable[_IndexedFile] = sorted(candidates)
+        else:
+            indexed_files = self._files
+
+        included_paths = frozenset(included_paths or [])
+        return [
+            os.path.join(root, f_name)
+            for _, root, f_name in indexed_files
+            if self._is_visible(root, f_name, included_paths)
+        ]
+
+    def _is_visible(self, root: str, f_name: str, included_paths: FrozenSet[str]) -> bool:
+        if not self._hidden_parts[root].issubset(included_paths):
+            return False
+        return not (IGNORE_HIDDEN_DIRECTORY_ENV and f_name.startswith(".") and f_name not in included_paths)
+
+
+_shared_file_index: FileIndex | None = None
+
+
+@contextmanager
+def shared_file_index(
+    root_folder: str | None, excluded_paths: list[str] | None, included_paths: Iterable[str] | None = None
+) -> Iterator[FileIndex | None]:
+    """Walks the root folder once and lets walk_directory() and find_files() use the result until the context is left"""
+
+    global _shared_file_index
+
+    if not root_folder or not CHECKOV_SHARED_FILE_INDEX:
+        yield None
+        return
+
+    previous_file_index = _shared_file_index
+    _shared_file_index = FileIndex(root_folder, excluded_paths, included_paths)
+    try:
+        yield _shared_file_index
+    finally:
+        _shared_file_index = previous_file_index
+
+
+def _get_shared_file_index(
+    root_folder: str, excluded_paths: list[str] | None, included_paths: Iterable[str] | None
+) -> FileIndex | None:
+    if _shared_file_index and _shared_file_index.matches(root_folder, excluded_paths, included_paths):
+        return _shared_file_index
+    return None
+
+
+def walk_directory(
+    root_folder: str, excluded_paths: list[str] | None, included_paths: Iterable[str] | None = None
+) -> Iterator[Tuple[str, List[str], List[str]]]:
+    """
+    Same as os.walk() with filter_ignored_paths() applied to the directory and file names,
+    but replays the shared file index instead of walking the folder again, if there is a matching one
+    """
+
+    file_index = _get_shared_file_index(root_folder, excluded_paths, included_paths)
+    if file_index:
+        yield from file_index.walk(excluded_paths, included_paths)
+        return
+
+    for root, d_names, f_names in os.walk(root_folder):
+        filter_ignored_paths(root, d_names, excluded_paths, included_paths)
+        filter_ignored_paths(root, f_names, excluded_paths, included_paths)
+        yield root, d_names, f_names
+
+
+@profiled(FILE_DISCOVERY)
+def find_files(
+    root_folder: str,
+    excluded_paths: list[str] | None,
+    file_extensions: Iterable[str] | None = None,
+    file_names: Iterable[str] | None = None,
+    included_paths: Iterable[str] | None = None,
+) -> List[str]:
+    """
+    Returns the paths of the files under the root folder with any of the given extensions or names in the walk order,
+    or all files, if neither is given. The files are looked up in the shared file index, if there is a matching one.
+    """
+
+    file_index = _get_shared_file_index(root_folder, excluded_paths, included_paths)
+    if file_index:
+        return file_index.find_files(file_extensions, file_names, excluded_paths, included_paths)
+
+    file_extensions = set(file_extensions or [])
+    file_names = set(file_names or [])
+    return [
+        os.path.join(root, f_name)
+        for root, _, f_names in walk_directory(root_folder, excluded_paths, included_paths)
+        for f_name in f_names
+        if (not file_extensions and not file_names)
+        or f_name in file_names
+        or os.path.splitext(f_name)[1] in file_extensions
+    ]
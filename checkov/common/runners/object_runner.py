@@ -13,8 +13,10 @@ from checkov.common.output.github_actions_record import GithubActionsRecord
 from checkov.common.output.record import Record
 from checkov.common.output.report import Report, CheckType
 from checkov.common.parallelizer.parallel_runner import parallel_runner
-from checkov.common.runners.base_runner import BaseRunner, filter_ignored_paths
+from checkov.common.runners.base_runner import BaseRunner
+from checkov.common.runners.file_index import find_files
 from checkov.common.util.consts import START_LINE, END_LINE
+from checkov.common.util.profiler import profiled, PARSE
 from checkov.runner_filter import RunnerFilter
 from checkov.common.util.suppression import collect_suppressions_for_context
 
@@ -33,6 +35,7 @@ class Runner(BaseRunner[None]):  # if a graph is added, Any needs to replaced
         super().__init__()
         self.map_file_path_to_gha_metadata_dict: dict[str, GhaMetadata] = {}
 
+    @profiled(PARSE)
     def _load_files(
             self,
             files_to_load: list[str],
@@ -93,10 +96,8 @@ class Runner(BaseRunner[None]):  # if a graph is added, Any needs to replaced
             self._load_files(files, definitions, definitions_raw)
 
         if root_folder:
-            for root, d_names, f_names in os.walk(root_folder):
-                filter_ignored_paths(root, d_names, runner_filter.excluded_paths, self.included_paths())
-                filter_ignored_paths(root, f_names, runner_filter.excluded_paths, self.included_paths())
-                self._load_files(f_names, definitions, definitions_raw, lambda f: os.path.join(root, f))
+            files_to_load = find_files(root_folder, runner_filter.excluded_paths, included_paths=self.included_paths())
+            self._load_files(files_to_load, definitions, definitions_raw)
 
         self.pbar.initiate(len(definitions))
         for file_path in definitions.keys():
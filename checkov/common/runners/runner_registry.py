@@ -2,16 +2,15 @@ from __future__ import annotations
 
 import argparse
 import itertools
-import json
 import logging
 import os
 import re
+import sys
 
 from collections import defaultdict
 from collections.abc import Iterable
-from json import dumps
 from pathlib import Path
-from typing import List, Dict, Any, Optional, cast, TYPE_CHECKING, TypeVar, Tuple
+from typing import List, Dict, Any, Optional, cast, TYPE_CHECKING, TypeVar, Tuple, Callable, TextIO
 
 from typing_extensions import Literal
 
@@ -27,10 +26,13 @@ from checkov.common.output.csv import CSVSBOM
 from checkov.common.output.cyclonedx import CycloneDX
 from checkov.common.output.report import Report
 from checkov.common.parallelizer.parallel_runner import parallel_runner
+from checkov.common.parsers.document_cache import shared_document_cache
+from checkov.common.runners.file_index import shared_file_index
 from checkov.common.typing import _ExitCodeThresholds
 from checkov.common.util import data_structures_utils
 from checkov.common.util.banner import tool as tool_name
-from checkov.common.util.json_utils import CustomJSONEncoder
+from checkov.common.util.json_utils import stream_json
+from checkov.common.util.profiler import profiled, profiler, REPORT
 from checkov.common.util.type_forcers import convert_csv_string_arg_to_list
 from checkov.sca_image.runner import Runner as image_runner
 from checkov.terraform.context_parsers.registry import parser_registry
@@ -73,12 +75,17 @@ class RunnerRegistry:
     ) -> List[Report]:
         integration_feature_registry.run_pre_runner()
         if len(self.runners) == 1:
-            reports: Iterable[Report] = [
-                self.runners[0].run(root_folder, external_checks_dir=external_checks_dir, files=files,
-                                    runner_filter=self.runner_filter,
-                                    collect_skip_comments=collect_skip_comments)]
-        else:
-            def _parallel_run(runner: _BaseRunner) -> Report:
+            with profiler.runner_scope(self.runners[0].check_type):
+                reports: Iterable[Report] = [
+                    self.runners[0].run(root_folder, external_checks_dir=external_checks_dir, files=files,
+                                        runner_filter=self.runner_filter,
+                                        collect_skip_comments=collect_skip_comments)]
+            for scan_report in reports:
+                self._handle_report(scan_report, repo_root_for_plan_enrichment)
+            return self.scan_reports
+
+        def _parallel_run(runner: _BaseRunner) -> Report:
+            with profiler.runner_scope(runner.check_type):
                 return runner.run(
                     root_folder=root_folder,
                     external_checks_dir=external_checks_dir,
@@ -87,12 +94,24 @@ class RunnerRegistry:
                     collect_skip_comments=collect_skip_comments,
                 )
 
+        # the root folder is walked and each document is loaded once for all runners,
+        # the forked runner processes inherit the file index and the document cache
+        with shared_file_index(root_folder, self.runner_filter.excluded_paths, self._get_included_paths()), \
+                shared_document_cache():
             reports = parallel_runner.run_function(func=_parallel_run, items=self.runners, group_size=1)
-
-        for scan_report in reports:
-            self._handle_report(scan_report, repo_root_for_plan_enrichment)
+            for scan_report in reports:
+                self._handle_report(scan_report, repo_root_for_plan_enrichment)
         return self.scan_reports
 
+    def _get_included_paths(self) -> set[str]:
+        """Collects the hidden paths, which any of the runners includes in its walk"""
+
+        included_paths: set[str] = set()
+        for runner in self.runners:
+            if hasattr(runner, "included_paths"):
+                included_paths.update(runner.included_paths())
+        return included_paths
+
     def _handle_report(self, scan_report: Report, repo_root_for_plan_enrichment: list[str | Path] | None) -> None:
         integration_feature_registry.run_post_runner(scan_report)
         if metadata_integration.check_metadata:
@@ -104,9 +123,12 @@ class RunnerRegistry:
         self.scan_reports.append(scan_report)
 
     def save_output_to_file(self, file_name: str, data: str, data_format: str) -> None:
+        self.write_output_to_file(file_name=file_name, write_data=lambda f: f.write(data), data_format=data_format)
+
+    def write_output_to_file(self, file_name: str, write_data: Callable[[TextIO], Any], data_format: str) -> None:
         try:
             with open(file_name, 'w') as f:
-                f.write(data)
+                write_data(f)
             logging.info(f"\nWrote output in {data_format} format to the file '{file_name}')")
         except EnvironmentError:
             logging.error(f"\nAn error occurred while writing {data_format} results to file: {file_name}",
@@ -175,6 +197,7 @@ class RunnerRegistry:
             'hard_fail_threshold': hard_fail_threshold
         }
 
+    @profiled(REPORT)
     def print_reports(
             self,
             scan_reports: List[Report],
@@ -189,17 +212,19 @@ class RunnerRegistry:
             print(f"{self.banner}\n")
         exit_codes = []
         cli_reports = []
-        report_jsons = []
+        json_reports = []
         sarif_reports = []
         junit_reports = []
         cyclonedx_reports = []
         csv_sbom_report = CSVSBOM()
 
         data_outputs: dict[str, str] = defaultdict(str)
+        # outputs, which are written directly to the output file instead of keeping them in memory
+        data_writers: dict[str, Callable[[TextIO], None]] = {}
         for report in scan_reports:
             if not report.is_empty():
                 if "json" in config.output:
-                    report_jsons.append(report.get_dict(is_quiet=config.quiet, url=url))
+                    json_reports.append(report)
                 if "junitxml" in config.output:
                     junit_reports.append(report)
                 if "github_failed_only" in config.output:
@@ -230,6 +255,8 @@ class RunnerRegistry:
                     baseline=baseline,
                     use_bc_ids=config.output_bc_ids,
                 )
+            if 'slow_checks' in config and config.slow_checks:
+                cli_output += profiler.get_slowest_checks_output(config.slow_checks)
             print(cli_output)
             # Remove colors from the cli output
             ansi_escape = re.compile(r'(?:\x1B[@-_]|[\x80-\x9F])[0-?]*[ -/]*[@-~]')
@@ -255,22 +282,19 @@ class RunnerRegistry:
             if url:
                 print("More details: {}".format(url))
             master_report.write_sarif_output(self.tool)
-            data_outputs['sarif'] = json.dumps(master_report.get_sarif_json(self.tool), cls=CustomJSONEncoder)
+            data_writers['sarif'] = lambda f: master_report.write_sarif(f, self.tool)
             output_formats.remove("sarif")
             if output_formats:
                 print(OUTPUT_DELIMITER)
         if "json" in config.output:
-            if config.compact and report_jsons:
-                self.strip_code_blocks_from_json(report_jsons)
-            if not report_jsons:
-                print(dumps(Report("").get_summary(), indent=4, cls=CustomJSONEncoder))
-                data_outputs['json'] = json.dumps(Report("").get_summary(), cls=CustomJSONEncoder)
-            elif len(report_jsons) == 1:
-                print(dumps(report_jsons[0], indent=4, cls=CustomJSONEncoder))
-                data_outputs['json'] = json.dumps(report_jsons[0], cls=CustomJSONEncoder)
-            else:
-                print(dumps(report_jsons, indent=4, cls=CustomJSONEncoder))
-                data_outputs['json'] = json.dumps(report_jsons, cls=CustomJSONEncoder)
+            def write_json(f: TextIO, indent: int | None = None) -> None:
+                self.write_json_reports(
+                    f=f, reports=json_reports, config=config, url=url, indent=indent
+                )
+
+            write_json(sys.stdout, indent=None if config.compact_json else 4)
+            print()
+            data_writers['json'] = write_json
             output_formats.remove("json")
             if output_formats:
                 print(OUTPUT_DELIMITER)
@@ -285,8 +309,9 @@ class RunnerRegistry:
             else:
                 test_suites = [Report("").get_test_suite(properties=properties)]
 
-            data_outputs['junitxml'] = Report.get_junit_xml_string(test_suites)
-            print(data_outputs['junitxml'])
+            Report.write_junit_xml(sys.stdout, test_suites)
+            print()
+            data_writers['junitxml'] = lambda f: Report.write_junit_xml(f, test_suites)
 
             output_formats.remove("junitxml")
             if output_formats:
@@ -315,7 +340,11 @@ class RunnerRegistry:
                       'cyclonedx': 'results_cyclonedx.xml'}
         if config.output_file_path:
             for output in config.output:
-                if output in file_names:
+                if output in data_writers:
+                    self.write_output_to_file(file_name=f'{config.output_file_path}/{file_names[output]}',
+                                              write_data=data_writers[output],
+                                              data_format=output)
+                elif output in file_names:
                     self.save_output_to_file(file_name=f'{config.output_file_path}/{file_names[output]}',
                                              data=data_outputs[output],
                                              data_format=output)
@@ -431,10 +460,18 @@ class RunnerRegistry:
         return image_referencing_runners
 
     @staticmethod
-    def strip_code_blocks_from_json(report_jsons: List[Dict[str, Any]]) -> None:
-        for report in report_jsons:
-            results = report.get('results', {})
-            for key, result in results.items():
-                for result_dict in result:
-                    result_dict.pop('code_block', None)
-                    result_dict.pop('connected_node', None)
+    def write_json_reports(
+        f: TextIO, reports: List[Report], config: argparse.Namespace, url: Optional[str] = None,
+        indent: Optional[int] = None
+    ) -> None:
+        """Writes the JSON output of the given reports record by record"""
+
+        if not reports:
+            stream_json(Report("").get_summary(), f, indent=indent)
+            return
+
+        report_jsons = [
+            report.get_streamable_dict(is_quiet=config.quiet, url=url, strip_code_blocks=config.compact)
+            for report in reports
+        ]
+        stream_json(report_jsons[0] if len(report_jsons) == 1 else report_jsons, f, indent=indent)
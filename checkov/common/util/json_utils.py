@@ -1,6 +1,9 @@
+from __future__ import annotations
+
 import datetime
 import json
-from typing import Any
+from collections.abc import Iterable, Iterator
+from typing import Any, TextIO
 
 from lark import Tree
 from packaging.version import LegacyVersion, Version
@@ -27,3 +30,55 @@ class CustomJSONEncoder(json.JSONEncoder):
             return o.__dict__
         else:
             return json.JSONEncoder.default(self, o)
+
+
+def stream_json(obj: Any, fp: TextIO, indent: int | None = None) -> None:
+    """
+    Writes the object to the file handle in the same format as json.dump(), but without building the whole string.
+
+    Dicts and lists are written item by item and iterators are consumed lazily and written as JSON arrays,
+    therefore records can be generated while they are written. The items of an iterator are serialized
+    as a whole, they should be reasonably small, ex. a single record.
+    """
+
+    _stream_json(obj, fp, indent, 0, False)
+
+
+def _stream_json(obj: Any, fp: TextIO, indent: int | None, level: int, is_leaf: bool) -> None:
+    if is_leaf or not isinstance(obj, (dict, list, tuple, Iterator)):
+        data = json.dumps(obj, indent=indent, cls=CustomJSONEncoder)
+        if indent is not None and level:
+            # JSON strings can't contain a raw line break, so all of them belong to the nested indentation
+            data = data.replace("\n", "\n" + " " * indent * level)
+        fp.write(data)
+        return
+
+    is_dict = isinstance(obj, dict)
+    if isinstance(obj, dict):
+        items: Iterable[tuple[Any, Any]] = obj.items()
+        start, end = "{", "}"
+    else:
+        items = ((None, item) for item in obj)
+        start, end = "[", "]"
+
+    if indent is not None:
+        item_separator = ",\n" + " " * indent * (level + 1)
+        first_separator = "\n" + " " * indent * (level + 1)
+        end = "\n" + " " * indent * level + end
+    else:
+        item_separator = ", "
+        first_separator = ""
+
+    is_empty = True
+    for key, value in items:
+        if is_empty:
+            fp.write(start + first_separator)
+            is_empty = False
+        else:
+            fp.write(item_separator)
+        if is_dict:
+            # non-string keys are converted the same way as the json module does it
+            fp.write(json.dumps(key if isinstance(key, str) else json.dumps(key)) + ": ")
+        _stream_json(value, fp, indent, level + 1, isinstance(obj, Iterator))
+
+    fp.write(start + end.lstrip() if is_empty else end)
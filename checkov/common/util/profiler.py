@@ -0,0 +1,460 @@
+from __future__ import annotations
+
+import functools
+import heapq
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple, TypeVar, cast
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+PROFILE_FORMATS = ("json", "chrome")
+PROFILE_VERSION = 1
+
+# categories of the recorded phases
+FILE_DISCOVERY = "file discovery"
+PARSE = "parse"
+GRAPH_BUILD = "graph build"
+VARIABLE_RENDERING = "variable rendering"
+REPORT = "report"
+RUNNER = "runner"
+
+# categories of the aggregated measurements
+PYTHON_CHECK = "python check"
+GRAPH_CHECK = "graph check"
+SECRETS_SCAN = "secrets scan"
+
+# runner, category and key of an aggregated measurement -> count, total time, max time, allocated bytes, timeouts
+_StatKey = Tuple[str, str, str]
+# runner and directory of the measured files -> count, total time
+_DirectoryKey = Tuple[str, str]
+# time, runner, category, key, file and entity of a single measurement
+_EntityMeasurement = Tuple[int, str, str, str, str, str]
+
+
+class ProfileData(Dict[str, Any]):
+    """Profile recorded by a forked process, which is sent to the parent process together with the results"""
+
+
+class _Measurement:
+    __slots__ = ("profiler", "category", "key", "file_path", "entity", "entity_type", "start_ns", "start_memory")
+
+    def __init__(
+        self,
+        profiler: Profiler,
+        category: str,
+        key: str,
+        file_path: str | None,
+        entity: str | None,
+        entity_type: str | None,
+    ) -> None:
+        self.profiler = profiler
+        self.category = category
+        self.key = key
+        self.file_path = file_path
+        self.entity = entity
+        self.entity_type = entity_type
+        self.start_ns = 0
+        self.start_memory = 0
+
+    def __enter__(self) -> None:
+        self.start_memory = self.profiler._traced_memory()
+        self.start_ns = time.perf_counter_ns()
+
+    def __exit__(self, *_: object) -> None:
+        duration_ns = time.perf_counter_ns() - self.start_ns
+        allocated = self.profiler._traced_memory() - self.start_memory
+        self.profiler._add_measurement(
+            self.category, self.key, self.file_path, self.entity, self.entity_type, duration_ns, allocated
+        )
+
+
+class Profiler:
+    """
+    Records the wall time and optionally the allocated memory of the phases of a scan as events
+    and aggregates the ones of hot paths, like running a check, per key and per directory of the scanned file.
+
+    It is disabled by default, then the instrumented code only pays for checking the enabled flag.
+    The runner, which is currently running, is kept per process, because the runners run in forked processes.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.track_memory = False
+        self.slowest_entities = 0
+        self.runner = ""
+        self._start_ns = 0
+        self._lock = threading.Lock()
+        self._events: List[Dict[str, Any]] = []
+        self._stats: Dict[_StatKey, List[int]] = {}
+        self._directories: Dict[_DirectoryKey, List[int]] = {}
+        # min heap of the slowest single measurements of an entity
+        self._slowest_entities: List[_EntityMeasurement] = []
+
+    def enable(self, track_memory: bool = False, slowest_entities: int = 0) -> None:
+        """
+        :param track_memory: records the allocated memory via tracemalloc, which slows down the scan noticeably
+        :param slowest_entities: number of the slowest single measurements of an entity, which are kept
+        """
+
+        self.reset()
+        self.enabled = True
+        self.track_memory = track_memory
+        self.slowest_entities = slowest_entities
+        self._start_ns = time.perf_counter_ns()
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def disable(self) -> None:
+        if self.track_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.enabled = False
+        self.track_memory = False
+        self.slowest_entities = 0
+
+    def reset(self) -> None:
+        """Drops everything recorded so far, a forked process does this to not report the records of its parent again"""
+
+        with self._lock:
+            self._events = []
+            self._stats = {}
+            self._directories = {}
+            self._slowest_entities = []
+
+    @contextmanager
+    def phase(self, name: str, category: str, **args: Any) -> Iterator[None]:
+        """Records the enclosed code as an event with the given name and category"""
+
+        if not self.enabled:
+            yield
+            return
+
+        start_memory = self._traced_memory()
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            duration_ns = time.perf_counter_ns() - start_ns
+            event = {
+                "name": name,
+                "category": category,
+                "runner": self.runner,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "start_ns": start_ns - self._start_ns,
+                "duration_ns": duration_ns,
+                "allocated_bytes": self._traced_memory() - start_memory if self.track_memory else None,
+                "args": args,
+            }
+            with self._lock:
+                self._events.append(event)
+
+    @contextmanager
+    def runner_scope(self, runner: str) -> Iterator[None]:
+        """Attributes everything recorded in the enclosed code to the given runner"""
+
+        previous_runner = self.runner
+        self.runner = runner
+        try:
+            with self.phase(runner, RUNNER):
+                yield
+        finally:
+            self.runner = previous_runner
+
+    def measure(
+        self,
+        category: str,
+        key: str,
+        file_path: str | None = None,
+        entity: str | None = None,
+        entity_type: str | None = None,
+    ) -> ContextManager[None]:
+        """
+        Aggregates the enclosed code with the other measurements of the same key instead of recording an event,
+        because it is run too often, and additionally per directory of the given file.
+        The measurement of the given entity is kept, if it is one of the slowest ones.
+        """
+
+        if not self.enabled:
+            return nullcontext()
+        return _Measurement(self, category, key, file_path, entity, entity_type)
+
+    def add_timeout(self, category: str, key: str) -> None:
+        """Counts a measurement of the given key, which exceeded its time budget"""
+
+        if not self.enabled:
+            return
+
+        with self._lock:
+            stat = self._stats.setdefault((self.runner, category, key), [0, 0, 0, 0, 0])
+            stat[4] += 1
+
+    def _traced_memory(self) -> int:
+        if self.track_memory:
+            return tracemalloc.get_traced_memory()[0]
+        return 0
+
+    def _add_measurement(
+        self,
+        category: str,
+        key: str,
+        file_path: str | None,
+        entity: str | None,
+        entity_type: str | None,
+        duration_ns: int,
+        allocated: int,
+    ) -> None:
+        with self._lock:
+            stat = self._stats.get((self.runner, category, key))
+            if stat is None:
+                self._stats[(self.runner, category, key)] = [1, duration_ns, duration_ns, allocated, 0]
+            else:
+                stat[0] += 1
+                stat[1] += duration_ns
+                stat[2] = max(stat[2], duration_ns)
+                stat[3] += allocated
+
+            if file_path:
+                directory_key = (self.runner, os.path.dirname(file_path))
+                directory = self._directories.get(directory_key)
+                if directory is None:
+                    self._directories[directory_key] = [1, duration_ns]
+                else:
+                    directory[0] += 1
+                    directory[1] += duration_ns
+
+            if entity is not None and self.slowest_entities:
+                # the name of an entity is often only unique together with its type
+                entity_name = f"{entity_type}.{entity}" if entity_type and entity_type != entity else str(entity)
+                self._add_slowest_entity((duration_ns, self.runner, category, key, file_path or "", entity_name))
+
+    def _add_slowest_entity(self, measurement: _EntityMeasurement) -> None:
+        if len(self._slowest_entities) < self.slowest_entities:
+            heapq.heappush(self._slowest_entities, measurement)
+        elif measurement > self._slowest_entities[0]:
+            heapq.heapreplace(self._slowest_entities, measurement)
+
+    def collect(self) -> ProfileData:
+        """Returns everything recorded so far, so a forked process can send it to its parent"""
+
+        with self._lock:
+            return ProfileData(
+                events=self._events,
+                stats=self._stats,
+                directories=self._directories,
+                slowest_entities=self._slowest_entities,
+            )
+
+    def merge(self, data: ProfileData) -> None:
+        """Adds the records of a forked process"""
+
+        with self._lock:
+            self._events.extend(data["events"])
+            for stat_key, (count, total_ns, max_ns, allocated, timeouts) in data["stats"].items():
+                stat = self._stats.get(stat_key)
+                if stat is None:
+                    self._stats[stat_key] = [count, total_ns, max_ns, allocated, timeouts]
+                else:
+                    stat[0] += count
+                    stat[1] += total_ns
+                    stat[2] = max(stat[2], max_ns)
+                    stat[3] += allocated
+                    stat[4] += timeouts
+            for directory_key, (count, total_ns) in data["directories"].items():
+                directory = self._directories.get(directory_key)
+                if directory is None:
+                    self._directories[directory_key] = [count, total_ns]
+                else:
+                    directory[0] += count
+                    directory[1] += total_ns
+            for measurement in data["slowest_entities"]:
+                self._add_slowest_entity(measurement)
+
+    def _get_checks(self) -> List[Dict[str, Any]]:
+        checks = [
+            {
+                "runner": runner,
+                "category": category,
+                "id": key,
+                "count": count,
+                "total_ms": _to_ms(total_ns),
+                "mean_ms": _to_ms(total_ns / count) if count else 0,
+                "max_ms": _to_ms(max_ns),
+                "allocated_bytes": allocated if self.track_memory else None,
+                "timeouts": timeouts,
+            }
+            for (runner, category, key), (count, total_ns, max_ns, allocated, timeouts) in self._stats.items()
+        ]
+        return sorted(checks, key=lambda check: check["total_ms"], reverse=True)
+
+    def _get_slowest_entities(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "runner": runner,
+                "category": category,
+                "id": key,
+                "file": file_path,
+                "entity": entity,
+                "duration_ms": _to_ms(duration_ns),
+            }
+            for duration_ns, runner, category, key, file_path, entity in sorted(self._slowest_entities, reverse=True)
+        ]
+
+    def _get_directories(self) -> List[Dict[str, Any]]:
+        directories = [
+            {
+                "runner": runner,
+                "directory": directory,
+                "count": count,
+                "total_ms": _to_ms(total_ns),
+            }
+            for (runner, directory), (count, total_ns) in self._directories.items()
+        ]
+        return sorted(directories, key=lambda directory: directory["total_ms"], reverse=True)
+
+    def _get_summary(self) -> Dict[str, Dict[str, float]]:
+        """Total time per runner and category of the phases and measurements"""
+
+        summary_ns: Dict[str, Dict[str, float]] = {}
+        for event in self._events:
+            runner_summary = summary_ns.setdefault(event["runner"], {})
+            runner_summary[event["category"]] = runner_summary.get(event["category"], 0) + event["duration_ns"]
+        for (runner, category, _), stat in self._stats.items():
+            runner_summary = summary_ns.setdefault(runner, {})
+            runner_summary[category] = runner_summary.get(category, 0) + stat[1]
+
+        return {
+            runner: {category: _to_ms(total_ns) for category, total_ns in runner_summary.items()}
+            for runner, runner_summary in summary_ns.items()
+        }
+
+    def to_json(self) -> Dict[str, Any]:
+        phases = [
+            {
+                "name": event["name"],
+                "category": event["category"],
+                "runner": event["runner"],
+                "pid": event["pid"],
+                "tid": event["tid"],
+                "start_ms": _to_ms(event["start_ns"]),
+                "duration_ms": _to_ms(event["duration_ns"]),
+                "allocated_bytes": event["allocated_bytes"],
+                **({"args": event["args"]} if event["args"] else {}),
+            }
+            for event in sorted(self._events, key=lambda event: event["start_ns"])
+        ]
+
+        return {
+            "version": PROFILE_VERSION,
+            "memory_tracked": self.track_memory,
+            "summary": self._get_summary(),
+            "phases": phases,
+            "checks": self._get_checks(),
+            "directories": self._get_directories(),
+            "slowest_entities": self._get_slowest_entities(),
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Creates the Trace Event Format, which can be opened with chrome://tracing or Perfetto"""
+
+        trace_events: List[Dict[str, Any]] = []
+        process_names: Dict[int, str] = {}
+        for event in sorted(self._events, key=lambda event: event["start_ns"]):
+            args = {"runner": event["runner"], **event["args"]}
+            if event["allocated_bytes"] is not None:
+                args["allocated_bytes"] = event["allocated_bytes"]
+            trace_events.append(
+                {
+                    "name": event["name"],
+                    "cat": event["category"],
+                    "ph": "X",
+                    "ts": event["start_ns"] / 1000,
+                    "dur": event["duration_ns"] / 1000,
+                    "pid": event["pid"],
+                    "tid": event["tid"],
+                    "args": args,
+                }
+            )
+            if event["category"] == RUNNER:
+                process_names.setdefault(event["pid"], event["runner"])
+
+        for pid, runner in process_names.items():
+            trace_events.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": runner}})
+
+        return {
+            "traceEvents": trace_events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "version": PROFILE_VERSION,
+                "summary": self._get_summary(),
+                "checks": self._get_checks(),
+                "directories": self._get_directories(),
+                "slowest_entities": self._get_slowest_entities(),
+            },
+        }
+
+    def get_slowest_checks_output(self, limit: int) -> str:
+        """Creates the CLI output section of the given number of the slowest checks and entities"""
+
+        checks = [check for check in self._get_checks() if check["category"] in (PYTHON_CHECK, GRAPH_CHECK)][:limit]
+        if not checks:
+            return ""
+
+        lines = [f"Slowest checks (top {limit}):"]
+        for check in checks:
+            line = (
+                f"\t{check['id']} ({check['runner']} {check['category']}): {check['total_ms']} ms total, "
+                f"{check['count']} runs, {check['max_ms']} ms max"
+            )
+            if check["timeouts"]:
+                line += f", {check['timeouts']} timed out"
+            lines.append(line)
+
+        entities = self._get_slowest_entities()[:limit]
+        if entities:
+            lines.append(f"Slowest checks per entity (top {limit}):")
+            lines.extend(
+                f"\t{entity['id']} on {entity['entity']} in {entity['file']} ({entity['runner']}): {entity['duration_ms']} ms"
+                for entity in entities
+            )
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, file_path: str, profile_format: str = "json") -> None:
+        profile = self.to_chrome_trace() if profile_format == "chrome" else self.to_json()
+        try:
+            with open(file_path, "w") as f:
+                json.dump(profile, f)
+            logging.info(f"Wrote the profile in {profile_format} format to the file '{file_path}'")
+        except EnvironmentError:
+            logging.error(f"An error occurred while writing the profile to the file '{file_path}'", exc_info=True)
+
+
+def _to_ms(duration_ns: float) -> float:
+    return round(duration_ns / 1_000_000, 3)
+
+
+profiler = Profiler()
+
+
+def profiled(category: str, name: Optional[str] = None) -> Callable[[_F], _F]:
+    """Records each call of the decorated function as a phase of the given category named after the function"""
+
+    def decorator(func: _F) -> _F:
+        phase_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            with profiler.phase(phase_name, category):
+                return func(*args, **kwargs)
+
+        return cast(_F, wrapper)
+
+    return decorator
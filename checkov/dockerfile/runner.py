@@ -8,9 +8,11 @@ from checkov.common.output.record import Record
 from checkov.common.output.report import Report
 from checkov.common.bridgecrew.check_type import CheckType
 from checkov.common.parallelizer.parallel_runner import parallel_runner
-from checkov.common.runners.base_runner import BaseRunner, filter_ignored_paths
+from checkov.common.runners.base_runner import BaseRunner
+from checkov.common.runners.file_index import walk_directory
 from checkov.common.util.dockerfile import is_docker_file
 from checkov.common.typing import _CheckResult
+from checkov.common.util.profiler import profiled, PARSE
 from checkov.dockerfile.parser import parse, collect_skipped_checks
 from checkov.dockerfile.registry import registry
 from checkov.runner_filter import RunnerFilter
@@ -50,9 +52,7 @@ class Runner(BaseRunner):
 
         if root_folder:
             filepath_fn = lambda f: f'/{os.path.relpath(f, os.path.commonprefix((root_folder, f)))}'
-            for root, d_names, f_names in os.walk(root_folder):
-                filter_ignored_paths(root, d_names, runner_filter.excluded_paths)
-                filter_ignored_paths(root, f_names, runner_filter.excluded_paths)
+            for root, _, f_names in walk_directory(root_folder, runner_filter.excluded_paths):
                 for file in f_names:
                     if is_docker_file(file):
                         file_path = os.path.join(root, file)
@@ -169,6 +169,7 @@ class Runner(BaseRunner):
         report.add_record(record=record)
 
 
+@profiled(PARSE)
 def get_files_definitions(
     files: list[str], filepath_fn: Callable[[str], str] | None = None
 ) -> tuple[dict[str, DictNode], dict[str, list[str]]]:
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import os
+import tempfile
+
+import yaml
+
+from checkov.version import version as checkov_version
+
+CHECKOV_HELM_RENDER_CACHE_DIR_ENV = "CHECKOV_HELM_RENDER_CACHE_DIR"
+# bump, when the structure of the cached payload changes
+RENDER_CACHE_FORMAT_VERSION = "1"
+LOCAL_DEPENDENCY_PREFIX = "file://"
+
+
+class RenderCache:
+    """
+    Persistent cache of the `helm template` output of charts, keyed by the content of the chart directory
+    including its lock file and packaged dependencies, the content of the values files and the helm version.
+
+    Dependencies, which are only referenced by a version range and not locked, are resolved again by helm
+    on a cache miss only, therefore a new matching dependency version is picked up with the next chart change.
+    Local dependencies referenced via 'file://' are repackaged by helm on every run,
+    therefore the content of their directories is part of the key too.
+    """
+
+    def __init__(self, cache_dir: str | None = None) -> None:
+        self.cache_dir = cache_dir
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.cache_dir)
+
+    def get_key(self, chart_dir: str, var_files: list[str] | None, helm_version: str) -> str:
+        chart_hash = hashlib.sha256(f"{RENDER_CACHE_FORMAT_VERSION}:{checkov_version}:{helm_version}".encode())
+        self._update_with_chart(chart_hash, chart_dir, chart_dir, set())
+        for var_file in var_files or []:
+            chart_hash.update(f"\0{var_file}\0".encode())
+            self._update_with_file(chart_hash, var_file)
+        return chart_hash.hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        cache_file = self._get_cache_file_path(key)
+        try:
+            with gzip.open(cache_file, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logging.debug(f"Failed to read render cache entry {cache_file}", exc_info=True)
+            return None
+
+    def put(self, key: str, output: bytes) -> None:
+        cache_file = self._get_cache_file_path(key)
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+
+            # write to a temp file first, so concurrent scans never read a partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(gzip.compress(output))
+                os.replace(tmp_path, cache_file)
+            except Exception:
+                os.remove(tmp_path)
+                raise
+        except Exception:
+            logging.debug(f"Failed to write render cache entry {cache_file}", exc_info=True)
+
+    def _update_with_chart(self, chart_hash: hashlib._Hash, chart_dir: str, root_chart_dir: str, visited: set[str]) -> None:
+        visited.add(os.path.realpath(chart_dir))
+        for root, dirs, files in os.walk(chart_dir):
+            dirs.sort()
+            for file in sorted(files):
+                file_path = os.path.join(root, file)
+                chart_hash.update(f"\0{os.path.relpath(file_path, root_chart_dir)}\0".encode())
+                self._update_with_file(chart_hash, file_path)
+
+        for dependency_dir in self._get_local_dependency_dirs(chart_dir):
+            if os.path.realpath(dependency_dir) in visited:
+                continue
+            chart_hash.update(f"\0{os.path.relpath(dependency_dir, root_chart_dir)}\0".encode())
+            self._update_with_chart(chart_hash, dependency_dir, root_chart_dir, visited)
+
+    @staticmethod
+    def _get_local_dependency_dirs(chart_dir: str) -> list[str]:
+        """Returns the directories of the 'file://' dependencies in Chart.yaml or the requirements.yaml of Helm v2"""
+
+        dependency_dirs = []
+        for file_name in ("Chart.yaml", "requirements.yaml"):
+            try:
+                with open(os.path.join(chart_dir, file_name)) as f:
+                    chart = yaml.safe_load(f)
+            except FileNotFoundError:
+                continue
+            except Exception:
+                # helm fails on an invalid file anyway, which is part of the key
+                logging.debug(f"Failed to read the dependencies of chart {chart_dir}", exc_info=True)
+                continue
+
+            dependencies = chart.get("dependencies") if isinstance(chart, dict) else None
+            for dependency in dependencies if isinstance(dependencies, list) else []:
+                repository = dependency.get("repository") if isinstance(dependency, dict) else None
+                if isinstance(repository, str) and repository.startswith(LOCAL_DEPENDENCY_PREFIX):
+                    dependency_path = repository[len(LOCAL_DEPENDENCY_PREFIX):]
+                    dependency_dirs.append(os.path.normpath(os.path.join(chart_dir, dependency_path)))
+        return dependency_dirs
+
+    @staticmethod
+    def _update_with_file(file_hash: hashlib._Hash, file_path: str) -> None:
+        try:
+            with open(file_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    file_hash.update(chunk)
+        except OSError:
+            # helm fails on unreadable files anyway, but the key still differs from the one of a readable file
+            file_hash.update(b"\0unreadable\0")
+
+    def _get_cache_file_path(self, key: str) -> str:
+        return os.path.join(str(self.cache_dir), key[:2], f"{key}.yaml.gz")
+
+
+render_cache = RenderCache(cache_dir=os.getenv(CHECKOV_HELM_RENDER_CACHE_DIR_ENV))
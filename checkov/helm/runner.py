@@ -6,6 +6,7 @@ import logging
 import os
 import subprocess  # nosec
 import tempfile
+import uuid
 from typing import Any, Type, Optional, List
 import yaml
 
@@ -16,9 +17,13 @@ from checkov.common.graph.db_connectors.networkx.networkx_db_connector import Ne
 from checkov.common.graph.graph_builder.local_graph import LocalGraph
 from checkov.common.output.report import Report
 from checkov.common.parallelizer.parallel_runner import parallel_runner
-from checkov.common.runners.base_runner import BaseRunner, filter_ignored_paths
+from checkov.common.runners.base_runner import BaseRunner, is_path_ignored
+from checkov.common.runners.file_index import find_files
+from checkov.common.util.profiler import profiled, PARSE
 from checkov.helm.registry import registry
+from checkov.helm.render_cache import render_cache
 from checkov.kubernetes.graph_builder.local_graph import KubernetesLocalGraph
+from checkov.kubernetes.kubernetes_utils import get_content_definitions, K8_POSSIBLE_ENDINGS
 from checkov.kubernetes.runner import Runner as k8_runner
 from checkov.runner_filter import RunnerFilter
 from checkov.common.parallelizer.parallel_runner import parallel_runner
@@ -71,6 +76,10 @@ class Runner(BaseRunner):
         self.target_folder_path = ''
         self.root_folder = ''
         self.runner_filter = None
+        self.helm_version = ''
+        # the Kubernetes definitions of the rendered charts, keyed by their path under the target folder
+        self.definitions: dict[str, Any] = {}
+        self.definitions_raw: dict[str, list[tuple[int, str]]] = {}
 
     def get_k8s_target_folder_path(self) -> str:
         return self.target_folder_path
@@ -104,11 +113,16 @@ class Runner(BaseRunner):
             logging.info(f"Error running necessary tools to process {self.check_type} checks.")
             return self.check_type
 
-    def _parse_output(self, target_dir: str, output: bytes) -> None:
+    @profiled(PARSE)
+    def _parse_output(self, target_dir: str, output: bytes) -> tuple[dict[str, Any], dict[str, list[tuple[int, str]]]]:
+        """
+        Splits the output of `helm template` by its `# Source:` comments into the rendered files
+        and parses them in memory to Kubernetes definitions, keyed by the path `<target_dir>/<source>`
+        """
         output = str(output, 'utf-8')
         reader = io.StringIO(output)
-        cur_source_file = None
-        cur_writer = None
+        files_lines: dict[str, list[str]] = {}
+        cur_lines = None
         last_line_dashes = False
         line_num = 1
         for s in reader:
@@ -119,38 +133,41 @@ class Runner(BaseRunner):
 
             if last_line_dashes:
                 # The next line should contain a "Source" comment saying the name of the file it came from
-                # So we will close the old file, open a new file, and write the dashes from last iteration plus this line
+                # So we will continue the content of that file with the dashes from last iteration plus this line
 
                 if not s.startswith('# Source: '):
                     raise Exception(f'Line {line_num}: Expected line to start with # Source: {s}')
                 source = s[10:]
-                if source != cur_source_file:
-                    if cur_writer:
-                        cur_writer.close()
-                    file_path = os.path.join(target_dir, source)
-                    parent = os.path.dirname(file_path)
-                    os.makedirs(parent, exist_ok=True)
-                    cur_source_file = source
-                    cur_writer = open(os.path.join(target_dir, source), 'a')
-                cur_writer.write('---' + os.linesep)
-                cur_writer.write(s + os.linesep)
+                cur_lines = files_lines.setdefault(os.path.join(target_dir, source), [])
+                cur_lines.append('---')
+                cur_lines.append(s)
 
                 last_line_dashes = False
             else:
                 if s.startswith('# Source: '):
                     raise Exception(f'Line {line_num}: Unexpected line starting with # Source: {s}')
 
-                if not cur_writer:
+                if cur_lines is None:
                     continue
                 else:
-                    cur_writer.write(s + os.linesep)
+                    cur_lines.append(s)
 
             line_num += 1
 
-        if cur_writer:
-            cur_writer.close()
-
-    def _convert_chart_to_k8s(self, chart_item):
+        # same files as the Kubernetes runner would pick up from a folder with the rendered charts
+        root_dir = self.target_folder_path or target_dir
+        excluded_paths = self.runner_filter.excluded_paths if self.runner_filter else None
+        files_content = {
+            file_path: os.linesep.join(lines) + os.linesep
+            for file_path, lines in files_lines.items()
+            if os.path.splitext(file_path)[1] in K8_POSSIBLE_ENDINGS
+            and not is_path_ignored(root_dir, file_path, excluded_paths)
+        }
+        return get_content_definitions(files_content)
+
+    def _convert_chart_to_k8s(
+        self, chart_item: tuple[str, dict[str, Any]]
+    ) -> tuple[dict[str, Any], dict[str, list[tuple[int, str]]]] | None:
         (chart_dir, chart_meta) = chart_item
         target_dir = chart_dir.replace(self.root_folder, f'{self.target_folder_path}/')
         target_dir.replace("//", "/")
@@ -161,13 +178,39 @@ class Runner(BaseRunner):
                 f"Error parsing chart located {chart_dir}, chart has no name available",
                 exc_info=True,
             )
-            return
+            return None
         if target_dir.endswith('/'):
             target_dir = target_dir[:-1]
         if target_dir.endswith(chart_name):
             target_dir = target_dir[:-len(chart_name)]
         logging.info(
             f"Processing chart found at: {chart_dir}, name: {chart_name}, version: {chart_version}")
+
+        o = None
+        cache_key = None
+        # without a known helm version the output can't be cached safely
+        if render_cache.enabled and self.helm_version:
+            cache_key = render_cache.get_key(chart_dir, self.runner_filter.var_files, self.helm_version)
+            o = render_cache.get(cache_key)
+            if o is not None:
+                logging.info(f"Using the cached template output of chart {chart_name} at dir: {chart_dir}")
+        if o is None:
+            o = self._template_chart(chart_dir, chart_name, target_dir, cache_key)
+            if o is None:
+                return None
+
+        try:
+            return self._parse_output(target_dir, o)
+        except Exception:
+            logging.info(
+                f"Error parsing output {chart_name} at dir: {chart_dir}. Working dir: {target_dir}.",
+                exc_info=True,
+            )
+            return None
+
+    def _template_chart(self, chart_dir: str, chart_name: str, target_dir: str, cache_key: str | None) -> bytes | None:
+        """Runs `helm template` for the given chart and adds the output to the render cache, if a key is given"""
+
         # dependency list is nicer to parse than dependency update.
         helm_binary_list_chart_deps = subprocess.Popen([self.helm_command, 'dependency', 'list', chart_dir], stdout=subprocess.PIPE, stderr=subprocess.PIPE)  # nosec
         o, e = helm_binary_list_chart_deps.communicate()
@@ -196,36 +239,52 @@ class Runner(BaseRunner):
                     f"Error processing helm chart {chart_name} at dir: {chart_dir}. Working dir: {target_dir}. Error details: {str(e, 'utf-8')}")
             logging.debug(
                 f"Ran helm command to template chart output. Chart: {chart_name}. dir: {target_dir}. Output: {str(o, 'utf-8')}. Errors: {str(e, 'utf-8')}")
-
+            if cache_key and o and proc.returncode == 0:
+                render_cache.put(cache_key, o)
+            return o
         except Exception:
             logging.info(
                 f"Error processing helm chart {chart_name} at dir: {chart_dir}. Working dir: {target_dir}.",
                 exc_info=True,
             )
+            return None
 
+    def _get_helm_version(self) -> str:
         try:
-            self._parse_output(target_dir, o)
+            proc = subprocess.Popen([self.helm_command, 'version'], stdout=subprocess.PIPE, stderr=subprocess.PIPE)  # nosec
+            o, _ = proc.communicate()
+            return str(o, 'utf-8').strip()
         except Exception:
-            logging.info(
-                f"Error parsing output {chart_name} at dir: {chart_dir}. Working dir: {target_dir}.",
-                exc_info=True,
-            )
+            logging.info(f"Error getting the version of {self.helm_command}", exc_info=True)
+            return ''
 
     def convert_helm_to_k8s(self, root_folder: str, files: list[str], runner_filter: RunnerFilter) -> list[tuple[Any, dict[str, Any]]]:
         self.root_folder = root_folder
         self.runner_filter = runner_filter
+        # the charts of a previous run of this runner are not part of this one
+        self.definitions = {}
+        self.definitions_raw = {}
         chart_directories = find_chart_directories(root_folder, files, runner_filter.excluded_paths)
         chart_dir_and_meta = list(parallel_runner.run_function(
             lambda cd: (cd, self.parse_helm_chart_details(cd)), chart_directories))
         # remove parsing failures
         chart_dir_and_meta = [chart_meta for chart_meta in chart_dir_and_meta if chart_meta[1]]
-        self.target_folder_path = tempfile.mkdtemp()
+        # the rendered charts are kept in memory, therefore the target folder is only a unique path prefix,
+        # which is removed from the report paths again
+        self.target_folder_path = os.path.join(tempfile.gettempdir(), f"checkov_helm_{uuid.uuid4().hex}")
+        if render_cache.enabled and chart_dir_and_meta:
+            # the rendered output depends on the helm version, therefore it is part of the cache key
+            self.helm_version = self._get_helm_version()
 
         processed_chart_dir_and_meta = []
         for chart_dir, chart_meta in chart_dir_and_meta:
             processed_chart_dir_and_meta.append((chart_dir.replace(root_folder, ""), chart_meta))
 
-        list(parallel_runner.run_function(lambda cd: self._convert_chart_to_k8s(cd), chart_dir_and_meta))
+        for result in parallel_runner.run_function(lambda cd: self._convert_chart_to_k8s(cd), chart_dir_and_meta):
+            if result:
+                definitions, definitions_raw = result
+                self.definitions.update(definitions)
+                self.definitions_raw.update(definitions_raw)
         return processed_chart_dir_and_meta
 
     def run(self, root_folder: str | None, external_checks_dir: list[str] | None = None, files: list[str] | None = None,
@@ -235,6 +294,8 @@ class Runner(BaseRunner):
 
         k8s_runner = K8sHelmRunner()
         k8s_runner.chart_dir_and_meta = self.convert_helm_to_k8s(root_folder, files, runner_filter)
+        k8s_runner.definitions = self.definitions
+        k8s_runner.definitions_raw = self.definitions_raw
         return k8s_runner.run(self.get_k8s_target_folder_path(), external_checks_dir=external_checks_dir, runner_filter=runner_filter)
 
 
@@ -283,10 +344,7 @@ def find_chart_directories(root_folder: str, files: list[str], excluded_paths: l
                 chart_directories.append(os.path.dirname(file))
 
     if root_folder:
-        for root, d_names, f_names in os.walk(root_folder):
-            filter_ignored_paths(root, d_names, excluded_paths)
-            filter_ignored_paths(root, f_names, excluded_paths)
-            if 'Chart.yaml' in f_names:
-                chart_directories.append(root)
+        for file in find_files(root_folder, excluded_paths, file_names=['Chart.yaml']):
+            chart_directories.append(os.path.dirname(file))
 
     return chart_directories
@@ -21,10 +21,7 @@ class Registry(BaseCheckRegistry):
                     skip_info = [x for x in skipped_checks if x['id'] == check.id][0]
 
             if self._should_run_scan(check, entity_configuration, runner_filter, self.report_type):
-                self.logger.debug("Running check: {} on file {}".format(check.name, scanned_file))
-
-                result = check.run(scanned_file=scanned_file, entity_configuration=entity_configuration,
-                                   entity_name=entity_type, entity_type=entity_type, skip_info=skip_info)
+                result = self.run_check(check, entity_configuration, entity_type, entity_type, scanned_file, skip_info)
                 results[check] = result
         return results
 
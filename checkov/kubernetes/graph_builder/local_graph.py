@@ -5,6 +5,7 @@ from typing import List, Dict
 from checkov.common.graph.graph_builder.local_graph import LocalGraph
 from checkov.kubernetes.graph_builder.graph_components.blocks import KubernetesBlock
 from checkov.kubernetes.kubernetes_utils import is_invalid_k8_definition, get_resource_id
+from checkov.common.util.profiler import profiled, GRAPH_BUILD
 
 
 class KubernetesLocalGraph(LocalGraph):
@@ -12,6 +13,7 @@ class KubernetesLocalGraph(LocalGraph):
         self.definitions = definitions
         super().__init__()
 
+    @profiled(GRAPH_BUILD)
     def build_graph(self, render_variables: bool):
         self._create_vertices()
 
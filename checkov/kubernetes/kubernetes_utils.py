@@ -12,9 +12,10 @@ from checkov.common.bridgecrew.integration_features.features.policy_metadata_int
 from checkov.common.models.consts import YAML_COMMENT_MARK
 from checkov.common.parallelizer.parallel_runner import parallel_runner
 from checkov.common.parsers.node import DictNode
-from checkov.common.runners.base_runner import filter_ignored_paths
+from checkov.common.runners.file_index import find_files
+from checkov.common.util.profiler import profiled, PARSE
 from checkov.common.util.type_forcers import force_list
-from checkov.kubernetes.parser.parser import parse
+from checkov.kubernetes.parser.parser import parse, parse_content
 
 K8_POSSIBLE_ENDINGS = {".yaml", ".yml", ".json"}
 
@@ -23,20 +24,17 @@ def get_folder_definitions(
         root_folder: str, excluded_paths: Optional[List[str]]
 ) -> Tuple[Dict[str, List], Dict[str, List[Tuple[int, str]]]]:
     files_list = []
-    for root, d_names, f_names in os.walk(root_folder):
-        filter_ignored_paths(root, d_names, excluded_paths)
-        filter_ignored_paths(root, f_names, excluded_paths)
-
-        for file in f_names:
-            file_ending = os.path.splitext(file)[1]
-            if file_ending in K8_POSSIBLE_ENDINGS:
-                full_path = os.path.join(root, file)
-                if "/." not in full_path and file not in ['package.json', 'package-lock.json']:
-                    # skip temp directories
-                    files_list.append(full_path)
+    for full_path in find_files(root_folder, excluded_paths, file_extensions=K8_POSSIBLE_ENDINGS):
+        if is_k8s_file_candidate(full_path):
+            files_list.append(full_path)
     return get_files_definitions(files_list)
 
 
+def is_k8s_file_candidate(full_path: str) -> bool:
+    # skip temp directories and package files
+    return "/." not in full_path and os.path.basename(full_path) not in ['package.json', 'package-lock.json']
+
+
 def get_files_definitions(files: List[str]) \
         -> Tuple[Dict[str, List], Dict[str, List[Tuple[int, str]]]]:
     def _parse_file(filename: str):
@@ -56,6 +54,25 @@ def get_files_definitions(files: List[str]) \
     return definitions, definitions_raw
 
 
+def get_content_definitions(files_content: Dict[str, str]) \
+        -> Tuple[Dict[str, List], Dict[str, List[Tuple[int, str]]]]:
+    """Parses the content of files, which are kept in memory, like rendered Helm templates"""
+
+    definitions = {}
+    definitions_raw = {}
+    for path, content in files_content.items():
+        if not is_k8s_file_candidate(path):
+            continue
+        try:
+            parse_result = parse_content(content, path)
+        except (TypeError, ValueError):
+            logging.warning(f"Kubernetes skipping {path} as it is not a valid Kubernetes template", exc_info=True)
+            continue
+        if parse_result:
+            (definitions[path], definitions_raw[path]) = parse_result
+    return definitions, definitions_raw
+
+
 def get_skipped_checks(entity_conf):
     skipped = []
     metadata = {}
@@ -94,6 +111,7 @@ def get_skipped_checks(entity_conf):
     return skipped
 
 
+@profiled(PARSE)
 def create_definitions(
     root_folder: str | None,
     files: list[str] | None = None,
@@ -32,6 +32,14 @@ def load(filename: Path) -> Tuple[List[Dict[str, Any]], List[Tuple[int, str]]]:
     file_path = filename if isinstance(filename, Path) else Path(filename)
     content = file_path.read_text()
 
+    return load_content(content)
+
+
+def load_content(content: str) -> Tuple[List[Dict[str, Any]], List[Tuple[int, str]]]:
+    """
+    Load the given JSON content together with its lines
+    """
+
     if not all(key in content for key in ("apiVersion", "kind")):
         return [{}], []
 
@@ -20,14 +20,8 @@ def parse(filename):
             (template, template_lines) = k8_yaml.load(filename)
         if filename.endswith(".json"):
             (template, template_lines) = k8_json.load(filename)
-        if template:
-            if isinstance(template, list):
-                for t in template:
-                    if t and isinstance(t, dict) and 'apiVersion' in t.keys() and 'kind' in t.keys():
-                        valid_templates.append(t)
-            else:
-                return
-        else:
+        valid_templates = _get_valid_templates(template)
+        if valid_templates is None:
             return
     except IOError as e:
         if e.errno == 2:
@@ -50,3 +44,32 @@ def parse(filename):
         return
 
     return valid_templates, template_lines
+
+
+def parse_content(content, filename):
+    """
+    Parses the content of a file, which isn't read from the disk, like a rendered Helm template.
+    The format is determined by the extension of the given file name.
+    """
+    template = None
+    template_lines = None
+    try:
+        if filename.endswith(".yaml") or filename.endswith(".yml"):
+            (template, template_lines) = k8_yaml.load_content(content)
+        if filename.endswith(".json"):
+            (template, template_lines) = k8_json.load_content(content)
+        valid_templates = _get_valid_templates(template)
+        if valid_templates is None:
+            return
+    except YAMLError:
+        logger.debug('Cannot parse contents of %s', filename)
+        return
+
+    return valid_templates, template_lines
+
+
+def _get_valid_templates(template):
+    if not template or not isinstance(template, list):
+        return None
+
+    return [t for t in template if t and isinstance(t, dict) and 'apiVersion' in t.keys() and 'kind' in t.keys()]
@@ -72,7 +72,10 @@ class Runner(BaseRunner):
 
         report = Report(self.check_type)
         if self.context is None or self.definitions is None:
-            if files or root_folder:
+            if self.definitions is not None:
+                # the definitions were already parsed in memory, like the rendered charts of the Helm runner
+                pass
+            elif files or root_folder:
                 self.definitions, self.definitions_raw = create_definitions(root_folder, files, runner_filter)
             else:
                 return report
@@ -12,7 +12,8 @@ from checkov.common.graph.graph_builder import CustomAttributes
 from checkov.common.output.record import Record
 from checkov.common.output.report import Report
 from checkov.common.bridgecrew.check_type import CheckType
-from checkov.common.runners.base_runner import BaseRunner, filter_ignored_paths
+from checkov.common.runners.base_runner import BaseRunner
+from checkov.common.runners.file_index import walk_directory
 from checkov.kubernetes.kubernetes_utils import get_resource_id
 from checkov.kubernetes.runner import Runner as K8sRunner
 from checkov.kubernetes.runner import _get_entity_abs_path
@@ -484,9 +485,7 @@ def find_kustomize_directories(root_folder, files, excluded_paths):
                 kustomize_directories.append(os.path.dirname(file))
 
     if root_folder:
-        for root, d_names, f_names in os.walk(root_folder):
-            filter_ignored_paths(root, d_names, excluded_paths)
-            filter_ignored_paths(root, f_names, excluded_paths)
+        for root, _, f_names in walk_directory(root_folder, excluded_paths):
             [kustomize_directories.append(os.path.abspath(root)) for x in f_names if x in Runner.kustomizeSupportedFileTypes]
 
         return kustomize_directories
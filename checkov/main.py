@@ -1,6 +1,5 @@
 #!/usr/bin/env python
 import atexit
-import json
 import logging
 import os
 import shutil
@@ -32,6 +31,7 @@ from checkov.common.bridgecrew.platform_integration import bc_integration
 from checkov.common.goget.github.get_git import GitGetter
 from checkov.common.output.baseline import Baseline
 from checkov.common.bridgecrew.check_type import CheckType
+from checkov.common.checks.check_timeout import check_timeouts
 from checkov.common.runners.runner_registry import RunnerRegistry, OUTPUT_CHOICES
 from checkov.common.util import prompt
 from checkov.common.util.banner import banner as checkov_banner
@@ -39,6 +39,7 @@ from checkov.common.util.config_utils import get_default_config_paths
 from checkov.common.util.consts import DEFAULT_EXTERNAL_MODULES_DIR
 from checkov.common.util.docs_generator import print_checks
 from checkov.common.util.ext_argument_parser import ExtArgumentParser
+from checkov.common.util.profiler import profiler, PROFILE_FORMATS
 from checkov.common.util.runner_dependency_handler import RunnerDependencyHandler
 from checkov.common.util.type_forcers import convert_str_to_bool
 from checkov.dockerfile.runner import Runner as dockerfile_runner
@@ -147,7 +148,8 @@ def run(banner: str = checkov_banner, argv: List[str] = sys.argv[1:]) -> Optiona
                                  runners=checkov_runners, excluded_paths=excluded_paths,
                                  all_external=config.run_all_external_checks, var_files=config.var_file,
                                  skip_cve_package=config.skip_cve_package, show_progress_bar=not config.quiet,
-                                 secrets_scan_file_type=config.secrets_scan_file_type, use_enforcement_rules=config.use_enforcement_rules)
+                                 secrets_scan_file_type=config.secrets_scan_file_type, use_enforcement_rules=config.use_enforcement_rules,
+                                 tf_graph_dump_path=config.tf_graph_dump_path)
 
     if outer_registry:
         runner_registry = outer_registry
@@ -254,6 +256,16 @@ def run(banner: str = checkov_banner, argv: List[str] = sys.argv[1:]) -> Optiona
                      include_all_checkov_policies=config.include_all_checkov_policies, filtered_policy_ids=runner_filter.filtered_policy_ids)
         return None
 
+    if config.check_timeout:
+        try:
+            check_timeouts.configure(config.check_timeout)
+        except ValueError:
+            parser.error("--check-timeout values have to be a positive number of seconds or <check ID>=<seconds>")
+            return None
+
+    if config.profile_output or config.slow_checks:
+        profiler.enable(track_memory=config.profile_memory, slowest_entities=config.slow_checks or 0)
+
     baseline = None
     if config.baseline:
         baseline = Baseline(config.output_baseline_as_skipped)
@@ -288,12 +300,12 @@ def run(banner: str = checkov_banner, argv: List[str] = sys.argv[1:]) -> Optiona
                 for report in scan_reports:
                     overall_baseline.add_findings_from_report(report)
                 created_baseline_path = os.path.join(os.path.abspath(root_folder), '.checkov.baseline')
-                with open(created_baseline_path, 'w') as f:
-                    json.dump(overall_baseline.to_dict(), f, indent=4)
+                overall_baseline.write(created_baseline_path, compact=config.compact_baseline)
             exit_codes.append(runner_registry.print_reports(scan_reports, config, url=url,
                                                             created_baseline_path=created_baseline_path,
                                                             baseline=baseline))
         exit_code = 1 if 1 in exit_codes else 0
+        write_profile(config)
         return exit_code
     elif config.docker_image:
         if config.bc_api_key is None:
@@ -315,6 +327,7 @@ def run(banner: str = checkov_banner, argv: List[str] = sys.argv[1:]) -> Optiona
                                                   config.branch)
         url = bc_integration.commit_repository(config.branch)
         exit_code = runner_registry.print_reports([result], config, url=url)
+        write_profile(config)
         return exit_code
     elif config.file:
         runner_registry.filter_runners_for_files(config.file)
@@ -328,8 +341,7 @@ def run(banner: str = checkov_banner, argv: List[str] = sys.argv[1:]) -> Optiona
                 overall_baseline.add_findings_from_report(report)
             created_baseline_path = os.path.join(os.path.abspath(os.path.commonprefix(config.file)),
                                                  '.checkov.baseline')
-            with open(created_baseline_path, 'w') as f:
-                json.dump(overall_baseline.to_dict(), f, indent=4)
+            overall_baseline.write(created_baseline_path, compact=config.compact_baseline)
 
         if bc_integration.is_integration_configured():
             files = [os.path.abspath(file) for file in config.file]
@@ -339,6 +351,7 @@ def run(banner: str = checkov_banner, argv: List[str] = sys.argv[1:]) -> Optiona
             bc_integration.persist_scan_results(scan_reports)
             url = bc_integration.commit_repository(config.branch)
         exit_code = runner_registry.print_reports(scan_reports, config, url=url, created_baseline_path=created_baseline_path, baseline=baseline)
+        write_profile(config)
         return exit_code
     elif not config.quiet:
         print(f"{banner}")
@@ -388,6 +401,9 @@ def add_parser_args(parser: ArgumentParser) -> None:
     parser.add('--compact', action='store_true',
                default=False,
                help='in case of CLI output, do not display code blocks')
+    parser.add('--compact-json', action='store_true',
+               default=False, env_var='CKV_COMPACT_JSON',
+               help='in case of JSON output, print it without indentation, which is faster for big reports')
     parser.add('--framework',
                help='Filter scan to run only on specific infrastructure code frameworks',
                choices=checkov_runners + ["all"],
@@ -505,6 +521,11 @@ def add_parser_args(parser: ArgumentParser) -> None:
     parser.add('--external-modules-download-path',
                help="set the path for the download external terraform modules",
                default=DEFAULT_EXTERNAL_MODULES_DIR, env_var='EXTERNAL_MODULES_DIR')
+    parser.add('--tf-graph-dump-path',
+               help='File to keep the Terraform graph in between scans of the same directory. If it exists, '
+                    'only the parts of the graph affected by the changed files are built again. '
+                    'Only use files created by Checkov, because the content is unpickled',
+               default=None, env_var='CKV_TF_GRAPH_DUMP_PATH')
     parser.add('--evaluate-variables',
                help="evaluate the values of variables and locals",
                env_var="CKV_EVAL_VARS",
@@ -523,6 +544,10 @@ def add_parser_args(parser: ArgumentParser) -> None:
     parser.add('--create-baseline', help='Alongside outputting the findings, save all results to .checkov.baseline file'
                                          ' so future runs will not re-flag the same noise. Works only with `--directory` flag',
                action='store_true', default=False)
+    parser.add('--compact-baseline',
+               help='Save the .checkov.baseline file created by --create-baseline in a compact, gzip compressed '
+                    'format, which is a lot smaller for big baselines. --baseline reads both formats',
+               action='store_true', default=False)
     parser.add(
         '--baseline',
         help=(
@@ -550,6 +575,29 @@ def add_parser_args(parser: ArgumentParser) -> None:
                     '".template", ".py", ".js", ".properties", ".pem", ".php", ".xml", ".ts", ".env", "Dockerfile", '
                     '".java", ".rb", ".go", ".cs", ".txt") specify the argument with `--secrets-scan-file-type all`. '
                     'default scan will be for ".tf", ".yml", ".yaml", ".json", ".template" and exclude "Pipfile.lock", "yarn.lock", "package-lock.json", "requirements.txt"')
+    parser.add('--profile-output', default=None, env_var='CKV_PROFILE_OUTPUT',
+               help='Records the time spent in each phase of the scan per framework, like file discovery, parsing, '
+                    'graph building, variable rendering and report generation, and per check and scanned directory, '
+                    'and writes the profile to the given file')
+    parser.add('--profile-format', default='json', choices=PROFILE_FORMATS,
+               help='Format of the profile written to --profile-output, either JSON or the Chrome trace event format, '
+                    'which can be opened with chrome://tracing or Perfetto')
+    parser.add('--profile-memory', action='store_true', default=False,
+               help='Additionally records the allocated memory in the profile written to --profile-output. '
+                    'Note that this slows down the scan noticeably')
+    parser.add('--check-timeout', action='append', default=None,
+               help='Time budget in seconds of a single check on a single resource. A check exceeding it is '
+                    'interrupted and its result is skipped with a timeout comment. Either a number of seconds for all '
+                    'checks or <check ID>=<seconds> for a specific check, like CKV2_CUSTOM_1=30. Can be specified '
+                    'multiple times. Only supported on platforms with SIGALRM, like Linux and macOS')
+    parser.add('--slow-checks', type=int, default=None, env_var='CKV_SLOW_CHECKS',
+               help='Adds a section with the given number of the slowest checks and the slowest checks per resource '
+                    'to the CLI output')
+
+
+def write_profile(config: Namespace) -> None:
+    if config.profile_output:
+        profiler.write(config.profile_output, config.profile_format)
 
 
 def get_external_checks_dir(config: Any) -> Any:
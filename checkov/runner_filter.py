@@ -2,24 +2,45 @@ from __future__ import annotations
 
 import logging
 import fnmatch
+import os
+import threading
 from collections.abc import Iterable
-from typing import Set, Optional, Union, List, TYPE_CHECKING, Dict
+from typing import Set, Optional, Union, List, TYPE_CHECKING, Dict, Tuple, Any
+
+from cachetools import LRUCache
 
 from checkov.common.bridgecrew.code_categories import CodeCategoryMapping, CodeCategoryConfiguration
 from checkov.common.bridgecrew.severities import Severity, Severities
 from checkov.common.util.consts import DEFAULT_EXTERNAL_MODULES_DIR
-from checkov.common.util.type_forcers import convert_csv_string_arg_to_list
+from checkov.common.util.type_forcers import convert_csv_string_arg_to_list, force_int
 
 if TYPE_CHECKING:
     from checkov.common.checks.base_check import BaseCheck
     from checkov.common.graph.checks_infra.base_check import BaseGraphCheck
 
+CHECKOV_RUNNER_FILTER_CACHE_SIZE = force_int(os.getenv("CHECKOV_RUNNER_FILTER_CACHE_SIZE")) or 100000
+
+# check ID, BC check ID, severity name and level, report type
+_DecisionKey = Tuple[str, Optional[str], Optional[Tuple[str, int]], Optional[str]]
+
 
 class RunnerFilter(object):
     # NOTE: This needs to be static because different filters may be used at load time versus runtime
     #       (see note in BaseCheckRegistery.register). The concept of which checks are external is
     #       logically a "static" concept anyway, so this makes logical sense.
     __EXTERNAL_CHECK_IDS: Set[str] = set()
+    # the decisions of should_run_check() are cached and need to be made again, if one of these attributes changes
+    DECISION_ATTRIBUTES = frozenset((
+        "use_enforcement_rules",
+        "enforcement_rule_configs",
+        "check_threshold",
+        "skip_check_threshold",
+        "checks",
+        "skip_checks",
+        "include_all_checkov_policies",
+        "all_external",
+        "filtered_policy_ids",
+    ))
 
     def __init__(
             self,
@@ -39,9 +60,18 @@ class RunnerFilter(object):
             use_enforcement_rules: bool = False,
             filtered_policy_ids: Optional[List[str]] = None,
             show_progress_bar: Optional[bool] = True,
-            secrets_scan_file_type: Optional[List[str]] = None
+            secrets_scan_file_type: Optional[List[str]] = None,
+            tf_graph_dump_path: Optional[str] = None
     ) -> None:
 
+        # bumped, whenever the decisions of should_run_check() may change, see decision_generation
+        self._decision_generation = 0
+        self._decision_cache: LRUCache[_DecisionKey, bool] = LRUCache(maxsize=CHECKOV_RUNNER_FILTER_CACHE_SIZE)
+        self._decision_cache_lock = threading.Lock()
+        self._decision_cache_external_check_count = len(RunnerFilter.__EXTERNAL_CHECK_IDS)
+        self.decision_cache_hits = 0
+        self.decision_cache_misses = 0
+
         checks = convert_csv_string_arg_to_list(checks)
         skip_checks = convert_csv_string_arg_to_list(skip_checks)
 
@@ -95,6 +125,36 @@ class RunnerFilter(object):
         self.skip_cve_package = skip_cve_package
         self.filtered_policy_ids = filtered_policy_ids or []
         self.secrets_scan_file_type = secrets_scan_file_type
+        self.tf_graph_dump_path = tf_graph_dump_path
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in RunnerFilter.DECISION_ATTRIBUTES:
+            self.clear_decision_cache()
+
+    def clear_decision_cache(self) -> None:
+        with self._decision_cache_lock:
+            self._decision_cache.clear()
+            self._decision_cache_external_check_count = len(RunnerFilter.__EXTERNAL_CHECK_IDS)
+            self._decision_generation += 1
+
+    @property
+    def decision_generation(self) -> Tuple[int, int]:
+        """
+        Changes, whenever the decisions of should_run_check() may change, either by changing one of the
+        DECISION_ATTRIBUTES or by registering an external check. Used to invalidate decisions cached elsewhere.
+        """
+
+        return self._decision_generation, len(RunnerFilter.__EXTERNAL_CHECK_IDS)
+
+    def get_decision_cache_info(self) -> Dict[str, int]:
+        """Returns the hit and miss counts of the should_run_check() cache, used for profiling"""
+
+        return {
+            "hits": self.decision_cache_hits,
+            "misses": self.decision_cache_misses,
+            "size": len(self._decision_cache),
+        }
 
     def apply_enforcement_rules(self, enforcement_rule_configs: Dict[str, CodeCategoryConfiguration]) -> None:
         self.enforcement_rule_configs = {}
@@ -103,6 +163,7 @@ class RunnerFilter(object):
             if not config:
                 raise Exception(f'Could not find an enforcement rule config for category {code_category} (runner: {report_type})')
             self.enforcement_rule_configs[report_type] = config.soft_fail_threshold
+        self.clear_decision_cache()
 
     def should_run_check(
         self,
@@ -119,6 +180,31 @@ class RunnerFilter(object):
 
         assert check_id is not None  # nosec (for mypy (and then for bandit))
 
+        key = (check_id, bc_check_id, (severity.name, severity.level) if severity else None, report_type)
+        with self._decision_cache_lock:
+            if self._decision_cache_external_check_count != len(RunnerFilter.__EXTERNAL_CHECK_IDS):
+                # a newly registered external check may change the decision for its ID
+                self._decision_cache.clear()
+                self._decision_cache_external_check_count = len(RunnerFilter.__EXTERNAL_CHECK_IDS)
+
+            result = self._decision_cache.get(key)
+            if result is not None:
+                self.decision_cache_hits += 1
+                return result
+            self.decision_cache_misses += 1
+
+        result = self._should_run_check(check_id, bc_check_id, severity, report_type)
+        with self._decision_cache_lock:
+            self._decision_cache[key] = result
+        return result
+
+    def _should_run_check(
+        self,
+        check_id: str,
+        bc_check_id: str | None,
+        severity: Severity | None,
+        report_type: str | None
+    ) -> bool:
         # apply enforcement rules if specified, but let --check/--skip-check with a severity take priority
         if self.use_enforcement_rules and report_type:
             if not self.check_threshold and not self.skip_check_threshold:
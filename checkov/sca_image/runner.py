@@ -19,7 +19,8 @@ from checkov.common.images.image_referencer import ImageReferencer, Image
 from checkov.common.output.report import Report, merge_reports
 from checkov.common.bridgecrew.check_type import CheckType
 from checkov.common.output.common import ImageDetails
-from checkov.common.runners.base_runner import filter_ignored_paths, strtobool
+from checkov.common.runners.base_runner import strtobool
+from checkov.common.runners.file_index import find_files
 from checkov.common.util.file_utils import compress_file_gzip_base64
 from checkov.common.util.dockerfile import is_docker_file
 from checkov.runner_filter import RunnerFilter
@@ -154,12 +155,8 @@ class Runner(PackageRunner):
             self.pbar.close()
 
         if root_folder:
-            for root, d_names, f_names in os.walk(root_folder):
-                filter_ignored_paths(root, d_names, runner_filter.excluded_paths, included_paths=self.included_paths())
-                filter_ignored_paths(root, f_names, runner_filter.excluded_paths, included_paths=self.included_paths())
-                for file in f_names:
-                    abs_fname = os.path.join(root, file)
-                    self.iterate_image_files(abs_fname, report, runner_filter)
+            for abs_fname in find_files(str(root_folder), runner_filter.excluded_paths, included_paths=self.included_paths()):
+                self.iterate_image_files(abs_fname, report, runner_filter)
         return report
 
     def iterate_image_files(self, abs_fname: str, report: Report, runner_filter: RunnerFilter) -> None:
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import re
+
 from detect_secrets.core.potential_secret import PotentialSecret
 from detect_secrets.plugins.high_entropy_strings import Base64HighEntropyString, HexHighEntropyString
-from detect_secrets.plugins.keyword import KeywordDetector
+from detect_secrets.plugins.keyword import DENYLIST_REGEX, KeywordDetector
 from detect_secrets.plugins.base import BasePlugin
-from typing import Generator, Any, TYPE_CHECKING
+from typing import Generator, Any, Pattern, TYPE_CHECKING
 
 from checkov.secrets.runner import SOURCE_CODE_EXTENSION
 
@@ -12,6 +14,8 @@ if TYPE_CHECKING:
     from detect_secrets.util.code_snippet import CodeSnippet
 
 MAX_LINE_LENGTH = 10000
+# every keyword regex contains one of the denylisted keywords
+KEYWORD_PREFILTER_PATTERN = re.compile(DENYLIST_REGEX, flags=re.IGNORECASE)
 
 
 class EntropyKeywordCombinator(BasePlugin):
@@ -52,5 +56,14 @@ class EntropyKeywordCombinator(BasePlugin):
                         return matches
         return set()
 
+    def get_prefilter_patterns(self, filename: str) -> list[Pattern[str]] | None:
+        """
+        Returns the patterns, which match every line this plugin could find a secret in,
+        source code files are scanned by the entropy scanners without a keyword, therefore every line is needed
+        """
+        if f".{filename.split('.')[-1]}" in SOURCE_CODE_EXTENSION:
+            return None
+        return [KEYWORD_PREFILTER_PATTERN]
+
     def analyze_string(self, string: str) -> Generator[str, None, None]:
         raise NotImplementedError()
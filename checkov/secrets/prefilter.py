@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Generator, Pattern, Tuple
+
+from detect_secrets.core.log import log
+from detect_secrets.core.potential_secret import PotentialSecret
+from detect_secrets.core import scan
+from detect_secrets.plugins.base import RegexBasedDetector
+from detect_secrets.settings import get_plugins
+from detect_secrets.util.code_snippet import get_code_snippet
+
+try:
+    # private helpers of detect_secrets, which may change between versions
+    from detect_secrets.core.scan import _get_lines_from_file, _is_filtered_out, _scan_line
+
+    PREFILTER_AVAILABLE = True
+except ImportError:
+    PREFILTER_AVAILABLE = False
+
+# only these flags can be scoped to a part of the combined regex, the unicode flag is the default anyway
+SCOPED_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"))
+
+
+def get_prefilter_regex(filename: str) -> Pattern[str] | None:
+    """
+    Returns a single regex, which matches every line any of the enabled plugins could report a secret for,
+    or None, if a plugin needs to see every line of the given file
+    """
+
+    patterns: list[Tuple[str, int]] = []
+    for plugin in get_plugins():
+        if isinstance(plugin, RegexBasedDetector):
+            plugin_patterns = list(plugin.denylist)
+        elif hasattr(plugin, "get_prefilter_patterns"):
+            plugin_patterns = plugin.get_prefilter_patterns(filename)
+        else:
+            # the lines a custom plugin is interested in are unknown
+            return None
+
+        if plugin_patterns is None:
+            return None
+        patterns.extend((pattern.pattern, pattern.flags) for pattern in plugin_patterns)
+
+    return _build_prefilter_regex(tuple(patterns))
+
+
+@lru_cache(maxsize=None)
+def _build_prefilter_regex(patterns: Tuple[Tuple[str, int], ...]) -> Pattern[str]:
+    scoped_patterns = []
+    for pattern, flags in patterns:
+        scoped_flags = "".join(letter for flag, letter in SCOPED_FLAGS if flags & flag)
+        scoped_patterns.append(f"(?{scoped_flags}:{pattern})" if scoped_flags else f"(?:{pattern})")
+
+    return re.compile("|".join(scoped_patterns))
+
+
+def scan_file(filename: str) -> Generator[PotentialSecret, None, None]:
+    """
+    Same as 'detect_secrets.core.scan.scan_file', but lines, which don't match the prefilter regex,
+    are not passed to the plugins, because none of them could find a secret there
+    """
+
+    if not PREFILTER_AVAILABLE:
+        # the installed detect_secrets version doesn't provide the needed helpers
+        yield from scan.scan_file(filename)
+        return
+
+    if not get_plugins():
+        log.error('No plugins to scan with!')
+        return
+
+    if _is_filtered_out(required_filter_parameters=['filename'], filename=filename):
+        return
+
+    prefilter_regex = get_prefilter_regex(filename)
+    try:
+        has_secret = False
+        for lines in _get_lines_from_file(filename):
+            for secret in _process_line_based_plugins(lines=lines, filename=filename, prefilter_regex=prefilter_regex):
+                has_secret = True
+                yield secret
+
+            if has_secret:
+                break
+    except IOError:
+        log.warning(f'Unable to open file: {filename}')
+        return
+
+
+def _process_line_based_plugins(
+    lines: list[str],
+    filename: str,
+    prefilter_regex: Pattern[str] | None,
+) -> Generator[PotentialSecret, None, None]:
+    for line_number, line in enumerate(lines, start=1):
+        line = line.rstrip()
+        if prefilter_regex and not prefilter_regex.search(line):
+            continue
+
+        code_snippet = get_code_snippet(
+            lines=lines,
+            line_number=line_number,
+        )
+
+        if _is_filtered_out(
+            required_filter_parameters=['line'],
+            filename=filename,
+            line=line,
+            context=code_snippet,
+        ):
+            continue
+
+        yield from (
+            secret
+            for plugin in get_plugins()
+            for secret in _scan_line(
+                plugin=plugin,
+                filename=filename,
+                line=line,
+                line_number=line_number,
+                context=code_snippet,
+            )
+            if not _is_filtered_out(
+                required_filter_parameters=['context'],
+                filename=secret.filename,
+                secret=secret.secret_value,
+                plugin=plugin,
+                line=line,
+                context=code_snippet,
+            )
+        )
@@ -9,7 +9,6 @@ from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 from detect_secrets import SecretsCollection
-from detect_secrets.core import scan
 from detect_secrets.core.potential_secret import PotentialSecret
 from detect_secrets.settings import transient_settings
 
@@ -23,13 +22,16 @@ from checkov.common.models.enums import CheckResult
 from checkov.common.output.record import Record
 from checkov.common.output.report import Report
 from checkov.common.bridgecrew.check_type import CheckType
-from checkov.common.runners.base_runner import BaseRunner, filter_ignored_paths
+from checkov.common.runners.base_runner import BaseRunner
 from checkov.common.runners.base_runner import ignored_directories
+from checkov.common.runners.file_index import walk_directory
+from checkov.common.util.profiler import profiler, SECRETS_SCAN
 from checkov.common.typing import _CheckResult
 from checkov.common.util.consts import DEFAULT_EXTERNAL_MODULES_DIR
 from checkov.common.util.dockerfile import is_docker_file
 from checkov.common.util.secrets import omit_secret_value_from_line
 from checkov.runner_filter import RunnerFilter
+from checkov.secrets.prefilter import scan_file
 
 if TYPE_CHECKING:
     from checkov.common.util.tqdm_utils import ProgressBar
@@ -140,9 +142,7 @@ class Runner(BaseRunner[None]):
                 secrets_scan_file_type = runner_filter.secrets_scan_file_type
                 if secrets_scan_file_type:
                     secrets_scan_file_type_lower = [file_type.lower() for file_type in secrets_scan_file_type]
-                for root, d_names, f_names in os.walk(root_folder):
-                    filter_ignored_paths(root, d_names, excluded_paths)
-                    filter_ignored_paths(root, f_names, excluded_paths)
+                for root, _, f_names in walk_directory(root_folder, excluded_paths):
                     for file in f_names:
                         if secrets_scan_file_type:
                             if 'all' in secrets_scan_file_type:
@@ -237,7 +237,8 @@ class Runner(BaseRunner[None]):
             return file_path, []
         try:
             start_time = datetime.datetime.now()
-            file_results = [*scan.scan_file(full_file_path)]
+            with profiler.measure(SECRETS_SCAN, "scan_file", file_path):
+                file_results = [*scan_file(full_file_path)]
             end_time = datetime.datetime.now()
             run_time = end_time - start_time
             if run_time > datetime.timedelta(seconds=10):
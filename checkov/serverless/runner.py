@@ -20,10 +20,12 @@ from checkov.serverless.checks.package.registry import package_registry
 from checkov.serverless.checks.plugin.registry import plugin_registry
 from checkov.serverless.checks.provider.registry import provider_registry
 from checkov.serverless.checks.service.registry import service_registry
-from checkov.common.runners.base_runner import BaseRunner, filter_ignored_paths
+from checkov.common.runners.base_runner import BaseRunner
+from checkov.common.runners.file_index import walk_directory
 from checkov.runner_filter import RunnerFilter
 from checkov.common.output.record import Record
 from checkov.common.output.report import Report
+from checkov.common.util.profiler import profiled, PARSE
 from checkov.serverless.parsers.parser import parse
 from checkov.common.parsers.node import DictNode
 from checkov.serverless.parsers.parser import CFN_RESOURCES_TOKEN
@@ -74,14 +76,12 @@ class Runner(BaseRunner):
 
         if root_folder:
             filepath_fn = lambda f: f'/{os.path.relpath(f, os.path.commonprefix((root_folder, f)))}'
-            for root, d_names, f_names in os.walk(root_folder):
+            for root, d_names, f_names in walk_directory(root_folder, runner_filter.excluded_paths):
                 # Don't walk in to "node_modules" directories under the root folder. If –for some reason–
                 # scanning one of these is desired, it can be directly specified.
                 if "node_modules" in d_names:
                     d_names.remove("node_modules")
 
-                filter_ignored_paths(root, d_names, runner_filter.excluded_paths)
-                filter_ignored_paths(root, f_names, runner_filter.excluded_paths)
                 for file in f_names:
                     if file in SLS_FILE_MASK:
                         full_path = os.path.join(root, file)
@@ -237,6 +237,7 @@ class Runner(BaseRunner):
         return report
 
 
+@profiled(PARSE)
 def get_files_definitions(files: List[str], filepath_fn=None) \
         -> Tuple[Dict[str, DictNode], Dict[str, List[Tuple[int, str]]]]:
     results = parallel_runner.run_function(lambda f: (f, parse(f)), files)
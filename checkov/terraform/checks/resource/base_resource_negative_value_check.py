@@ -2,12 +2,11 @@ from abc import abstractmethod
 from collections.abc import Iterable
 from typing import List, Dict, Any, Optional
 
-import dpath
-
 from checkov.common.models.consts import ANY_VALUE
 from checkov.common.models.enums import CheckResult, CheckCategories
 from checkov.common.util.type_forcers import force_list
 from checkov.terraform.checks.resource.base_resource_check import BaseResourceCheck
+from checkov.terraform.checks.utils.attribute_path import get_path_value
 from checkov.terraform.graph_builder.utils import get_referenced_vertices_in_value
 from checkov.terraform.parser_functions import handle_dynamic_values
 
@@ -29,8 +28,8 @@ class BaseResourceNegativeValueCheck(BaseResourceCheck):
 
         excluded_key = self.get_excluded_key()
         if excluded_key is not None:
-            if dpath.search(conf, excluded_key) != {}:
-                value = dpath.get(conf, excluded_key)
+            key_found, value = get_path_value(conf, excluded_key)
+            if key_found:
                 if isinstance(value, list) and len(value) == 1:
                     value = value[0]
                 if self.check_excluded_condition(value):
@@ -38,8 +37,8 @@ class BaseResourceNegativeValueCheck(BaseResourceCheck):
 
         inspected_key = self.get_inspected_key()
         bad_values = self.get_forbidden_values()
-        if dpath.search(conf, inspected_key) != {}:
-            value = dpath.get(conf, inspected_key)
+        key_found, value = get_path_value(conf, inspected_key)
+        if key_found:
             if isinstance(value, list) and len(value) == 1:
                 value = value[0]
             if value is None or (isinstance(value, list) and not value):
@@ -2,12 +2,11 @@ from abc import abstractmethod
 from collections.abc import Iterable
 from typing import List, Dict, Any
 
-import dpath.util
-import re
 from checkov.terraform.checks.resource.base_resource_check import BaseResourceCheck
 from checkov.common.models.enums import CheckResult, CheckCategories
 from checkov.common.models.consts import ANY_VALUE
 from checkov.common.util.type_forcers import force_list
+from checkov.terraform.checks.utils.attribute_path import filter_key_path, find_attribute_values, get_path_value
 from checkov.terraform.graph_builder.utils import get_referenced_vertices_in_value
 from checkov.terraform.parser_functions import handle_dynamic_values
 
@@ -31,7 +30,7 @@ class BaseResourceValueCheck(BaseResourceCheck):
         :param path: valid JSONPath of an attribute
         :return: List of named attributes with respect to the input JSONPath order
         """
-        return [x for x in path.split("/") if not re.search(re.compile(r"^\[?\d+]?$"), x)]
+        return filter_key_path(path)
 
     @staticmethod
     def _is_nesting_key(inspected_attributes: List[str], key: List[str]) -> bool:
@@ -47,9 +46,9 @@ class BaseResourceValueCheck(BaseResourceCheck):
         handle_dynamic_values(conf)
         inspected_key = self.get_inspected_key()
         expected_values = self.get_expected_values()
-        if dpath.search(conf, inspected_key) != {}:
+        key_found, value = get_path_value(conf, inspected_key)
+        if key_found:
             # Inspected key exists
-            value = dpath.get(conf, inspected_key)
             if isinstance(value, list) and len(value) == 1:
                 value = value[0]
             if value is None or (isinstance(value, list) and not value):
@@ -67,21 +66,17 @@ class BaseResourceValueCheck(BaseResourceCheck):
                 return CheckResult.UNKNOWN
             return CheckResult.FAILED
         else:
-            # Look for the configuration in a bottom-up fashion
+            # Look for the configuration in a bottom-up fashion,
+            # only values with the full path of the key are considered - not partial matches
             inspected_attributes = self._filter_key_path(inspected_key)
-            for attribute in reversed(inspected_attributes):
-                for sub_key, sub_conf in dpath.search(conf, f"**/{attribute}", yielded=True):
-                    filtered_sub_key = self._filter_key_path(sub_key)
-                    # Only proceed with check if full path for key is similar - not partial match
-                    if inspected_attributes == filtered_sub_key:
-                        if self._is_nesting_key(inspected_attributes, filtered_sub_key):
-                            if isinstance(sub_conf, list) and len(sub_conf) == 1:
-                                sub_conf = sub_conf[0]
-                            if sub_conf in self.get_expected_values():
-                                return CheckResult.PASSED
-                            if self._is_variable_dependant(sub_conf):
-                                # If the tested attribute is variable-dependant, then result is PASSED
-                                return CheckResult.PASSED
+            for sub_conf in find_attribute_values(conf, inspected_attributes):
+                if isinstance(sub_conf, list) and len(sub_conf) == 1:
+                    sub_conf = sub_conf[0]
+                if sub_conf in expected_values:
+                    return CheckResult.PASSED
+                if self._is_variable_dependant(sub_conf):
+                    # If the tested attribute is variable-dependant, then result is PASSED
+                    return CheckResult.PASSED
 
         return self.missing_block_result
 
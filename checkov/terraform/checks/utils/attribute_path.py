@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional, Tuple
+
+import dpath.util
+
+# matches the list index parts of an attribute path, ex. '0' or '[0]'
+KEY_INDEX_PATTERN = re.compile(r"^\[?\d+]?$")
+# single digit list index in glob syntax, ex. '[0]', which is the only character class used by the checks
+GLOB_INDEX_PATTERN = re.compile(r"^\[(\d)]$")
+GLOB_CHARACTERS = ("*", "?", "[", "]")
+
+# a part of an attribute path, which matches a dict key and optionally a list index
+_PathPart = Tuple[str, Optional[int]]
+
+
+def filter_key_path(path: str) -> List[str]:
+    """
+    Filter an attribute path to contain only named attributes by dropping array indices from the path
+    :param path: valid JSONPath of an attribute
+    :return: List of named attributes with respect to the input JSONPath order
+    """
+    return [x for x in path.split("/") if not KEY_INDEX_PATTERN.match(x)]
+
+
+@lru_cache(maxsize=None)
+def parse_key_path(path: str) -> Tuple[_PathPart, ...] | None:
+    """
+    Parses a dpath glob into its parts, if it can be resolved by plain lookups.
+
+    :return: tuple of the dict key and list index to look up for each part or None, if the path has to be searched
+    """
+    parts = []
+    for part in path.split("/"):
+        index_match = GLOB_INDEX_PATTERN.match(part)
+        if index_match:
+            parts.append((index_match.group(1), int(index_match.group(1))))
+        elif not part or part.startswith("+") or any(char in part for char in GLOB_CHARACTERS):
+            # dpath skips keys starting with '+' and needs to do the pattern matching for the rest
+            return None
+        elif part.isdecimal() and str(int(part)) == part:
+            parts.append((part, int(part)))
+        else:
+            parts.append((part, None))
+    return tuple(parts)
+
+
+def get_path_value(conf: Any, path: str) -> Tuple[bool, Any]:
+    """
+    Same as checking 'dpath.search(conf, path) != {}' and then 'dpath.get(conf, path)',
+    but resolves the value via plain dict and list lookups instead of searching through the whole conf
+
+    :return: if the path exists and its value
+    """
+    parts = parse_key_path(path)
+    if parts is None:
+        if dpath.search(conf, path) != {}:
+            return True, dpath.get(conf, path)
+        return False, None
+
+    value = conf
+    for key, index in parts:
+        if isinstance(value, dict):
+            if key not in value:
+                return False, None
+            value = value[key]
+        elif isinstance(value, list) and index is not None and index < len(value):
+            value = value[index]
+        else:
+            return False, None
+    return True, value
+
+
+def find_attribute_values(conf: Any, attributes: List[str]) -> Iterator[Any]:
+    """
+    Same as searching 'dpath.search(conf, f"**/{attribute}", yielded=True)' for the attributes and keeping
+    the values, which path matches the attributes after dropping the list indices,
+    but only follows the given attributes instead of visiting every part of the conf
+
+    :param attributes: named attributes as returned by filter_key_path()
+    :return: values of the matching paths
+    """
+    if attributes:
+        yield from _find_attribute_values(conf, attributes, 0)
+
+
+def _find_attribute_values(value: Any, attributes: List[str], position: int) -> Iterator[Any]:
+    if isinstance(value, dict):
+        for key, sub_value in value.items():
+            str_key = str(key)
+            if str_key.startswith("+"):
+                # dpath skips them
+                continue
+            if KEY_INDEX_PATTERN.match(str_key):
+                yield from _find_attribute_values(sub_value, attributes, position)
+            elif str_key == attributes[position]:
+                if position == len(attributes) - 1:
+                    yield sub_value
+                else:
+                    yield from _find_attribute_values(sub_value, attributes, position + 1)
+    elif isinstance(value, list):
+        for sub_value in value:
+            yield from _find_attribute_values(sub_value, attributes, position)
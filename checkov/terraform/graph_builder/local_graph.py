@@ -1,9 +1,9 @@
 import logging
 import os
 from collections import defaultdict
-from copy import deepcopy
+from copy import copy, deepcopy
 from pathlib import Path
-from typing import List, Optional, Union, Any, Dict, Set, Tuple
+from typing import List, Optional, Union, Any, Dict, Set, Tuple, Iterable
 
 from typing_extensions import TypedDict
 
@@ -12,6 +12,7 @@ from checkov.common.graph.graph_builder import reserved_attribute_names
 from checkov.common.graph.graph_builder.graph_components.attribute_names import CustomAttributes
 from checkov.common.graph.graph_builder.local_graph import LocalGraph
 from checkov.common.graph.graph_builder.utils import calculate_hash, join_trimmed_strings, filter_sub_keys
+from checkov.common.graph.graph_builder.variable_rendering.breadcrumb_metadata import BreadcrumbMetadata
 from checkov.terraform.checks.utils.dependency_path_handler import unify_dependency_path
 from checkov.terraform.graph_builder.graph_components.block_types import BlockType
 from checkov.terraform.graph_builder.graph_components.blocks import TerraformBlock
@@ -23,6 +24,7 @@ from checkov.terraform.graph_builder.utils import (
 )
 from checkov.terraform.graph_builder.utils import is_local_path
 from checkov.terraform.graph_builder.variable_rendering.renderer import TerraformVariableRenderer
+from checkov.common.util.profiler import profiled, GRAPH_BUILD
 
 MODULE_RESERVED_ATTRIBUTES = ("source", "version")
 
@@ -43,35 +45,248 @@ class TerraformLocalGraph(LocalGraph):
         self.dirname_cache: Dict[str, str] = {}
         self.vertices_by_module_dependency_by_name: Dict[Tuple[str, str], Dict[BlockType, Dict[str, List[int]]]] = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
         self.vertices_by_module_dependency: Dict[Tuple[str, str], Dict[BlockType, List[int]]] = defaultdict(lambda: defaultdict(list))
+        # names, which were looked up while creating the edges of a vertex, used to find vertices affected by changed files
+        self.vertices_lookup_names: Dict[int, Set[str]] = defaultdict(set)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "module": self.module,
+            "vertices": self.vertices,
+            "edges": self.edges,
+            "vertices_lookup_names": dict(self.vertices_lookup_names),
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["module"])  # type:ignore[misc]
+        self.vertices = state["vertices"]
+        for i, block in enumerate(self.vertices):
+            self._add_vertex_to_indexes(i, block)
+        for edge in state["edges"]:
+            self._create_edge(edge.origin, edge.dest, edge.label)
+        self.vertices_lookup_names.update(state["vertices_lookup_names"])
+
+    @profiled(GRAPH_BUILD)
     def build_graph(self, render_variables: bool) -> None:
         self._create_vertices()
         self._build_edges()
         self.calculate_encryption_attribute(ENCRYPTION_BY_RESOURCE_TYPE)
         if render_variables:
-            logging.info(f"Rendering variables, graph has {len(self.vertices)} vertices and {len(self.edges)} edges")
-            renderer = TerraformVariableRenderer(self)
-            renderer.render_variables_from_local_graph()
-            self.update_vertices_breadcrumbs_and_module_connections()
+            self._render_variables()
+
+    @profiled(GRAPH_BUILD)
+    def build_graph_incrementally(
+        self, previous_graph: "TerraformLocalGraph", changed_files: Iterable[str], render_variables: bool
+    ) -> None:
+        """
+        Builds the graph by reusing the already rendered vertices of a previous graph of the same source.
+        Only the vertices of the changed files and the vertices depending on them are connected and rendered again.
+        If the module structure changed since the previous graph, the whole graph is built.
+
+        :param previous_graph: the graph of the previous scan
+        :param changed_files: the files, which were added, modified or removed since the previous scan
+        """
+        self._create_vertices()
+        if not self._is_reusable_graph(previous_graph):
+            logging.info("Module structure changed since the previous graph, building the whole graph")
+            self._build_edges()
+            self.calculate_encryption_attribute(ENCRYPTION_BY_RESOURCE_TYPE)
+            if render_variables:
+                self._render_variables()
+            return
+
+        changed_paths = {os.path.realpath(file) for file in changed_files}
+        new_to_previous_index, dirty_vertices = self._match_previous_vertices(previous_graph, changed_paths)
+        previous_to_new_index = {previous: new for new, previous in new_to_previous_index.items()}
+
+        # edges of unchanged vertices can be reused, as long as they don't point to a removed vertex
+        reused_edges: List[Edge] = []
+        for edge in previous_graph.edges:
+            creator_index = previous_to_new_index.get(self._get_edge_creator(previous_graph, edge))
+            if creator_index is None or creator_index in dirty_vertices:
+                continue
+            origin_index = previous_to_new_index.get(edge.origin)
+            dest_index = previous_to_new_index.get(edge.dest)
+            if origin_index is None or dest_index is None:
+                dirty_vertices.add(creator_index)
+                continue
+            reused_edges.append(Edge(origin_index, dest_index, edge.label))
+
+        for index, previous_index in new_to_previous_index.items():
+            if index not in dirty_vertices:
+                self.vertices_lookup_names[index] = set(previous_graph.vertices_lookup_names.get(previous_index, ()))
+        self._build_edges(sorted(dirty_vertices))
+        for edge in reused_edges:
+            if self._get_edge_creator(self, edge) not in dirty_vertices:
+                self._create_edge(edge.origin, edge.dest, edge.label)
+
+        vertices_to_render = self._get_dependent_vertices(dirty_vertices)
+        while True:
+            # the rendered values of a reused vertex can only originate in other reused vertices
+            not_reusable_vertices = {
+                index
+                for index, previous_index in new_to_previous_index.items()
+                if index not in vertices_to_render
+                and not self._are_references_reusable(
+                    previous_graph.vertices[previous_index], previous_to_new_index, vertices_to_render
+                )
+            }
+            if not not_reusable_vertices:
+                break
+            vertices_to_render = self._get_dependent_vertices(vertices_to_render | not_reusable_vertices)
+
+        for index, previous_index in new_to_previous_index.items():
+            if index not in vertices_to_render:
+                self.vertices[index] = self._reuse_vertex(
+                    previous_graph.vertices[previous_index], self.vertices[index], previous_to_new_index
+                )
+                self.module.blocks[index] = self.vertices[index]
+
+        logging.info(f"Reusing {len(self.vertices) - len(vertices_to_render)} of {len(self.vertices)} vertices")
+        self.calculate_encryption_attribute(ENCRYPTION_BY_RESOURCE_TYPE, vertices_to_render)
+        if render_variables:
+            self._render_variables(vertices_to_render)
+
+    def _render_variables(self, vertices_to_render: Optional[Set[int]] = None) -> None:
+        logging.info(f"Rendering variables, graph has {len(self.vertices)} vertices and {len(self.edges)} edges")
+        renderer = TerraformVariableRenderer(self, vertices_to_render)
+        renderer.render_variables_from_local_graph()
+        self.update_vertices_breadcrumbs_and_module_connections()
+
+    def _is_reusable_graph(self, previous_graph: "TerraformLocalGraph") -> bool:
+        return (
+            self.module.module_dependency_map == previous_graph.module.module_dependency_map
+            and self.module.module_address_map == previous_graph.module.module_address_map
+            and self.module.external_modules_source_map == previous_graph.module.external_modules_source_map
+            and set(self.get_resources_types_in_graph()) == set(previous_graph.get_resources_types_in_graph())
+            and self._get_aliases().keys() == previous_graph._get_aliases().keys()
+        )
+
+    def _match_previous_vertices(
+        self, previous_graph: "TerraformLocalGraph", changed_paths: Set[str]
+    ) -> Tuple[Dict[int, int], Set[int]]:
+        """
+        :return: map between the indexes of the unchanged vertices and their indexes in the previous graph,
+                 and the indexes of the vertices, which need to be connected again
+        """
+        previous_indexes: Dict[Tuple[str, ...], Optional[int]] = {}
+        for index, vertex in enumerate(previous_graph.vertices):
+            key = self._get_vertex_key(vertex)
+            # vertices with the same key can't be matched reliably
+            previous_indexes[key] = None if key in previous_indexes else index
+
+        new_to_previous_index: Dict[int, int] = {}
+        dirty_vertices: Set[int] = set()
+        changed_names: Set[str] = set()
+        for index, vertex in enumerate(self.vertices):
+            previous_index = previous_indexes.get(self._get_vertex_key(vertex))
+            if vertex.path in changed_paths or previous_index is None:
+                dirty_vertices.add(index)
+                changed_names.add(vertex.name)
+            else:
+                new_to_previous_index[index] = previous_index
+
+        matched_previous_indexes = set(new_to_previous_index.values())
+        for index, vertex in enumerate(previous_graph.vertices):
+            if index not in matched_previous_indexes:
+                changed_names.add(vertex.name)
+
+        # a reference to a changed name can resolve to a different vertex now
+        for index, previous_index in new_to_previous_index.items():
+            if not previous_graph.vertices_lookup_names.get(previous_index, set()).isdisjoint(changed_names):
+                dirty_vertices.add(index)
+
+        return new_to_previous_index, dirty_vertices
+
+    @staticmethod
+    def _get_vertex_key(vertex: TerraformBlock) -> Tuple[str, ...]:
+        return vertex.block_type, vertex.name, vertex.path, vertex.module_dependency, vertex.module_dependency_num
+
+    @staticmethod
+    def _get_edge_creator(graph: "TerraformLocalGraph", edge: Edge) -> int:
+        """
+        :return: the index of the vertex, which created the edge while its attributes were connected
+        """
+        if (
+            edge.label == "default"
+            and graph.vertices[edge.origin].block_type == BlockType.VARIABLE
+            and graph.vertices[edge.dest].block_type in (BlockType.MODULE, BlockType.TF_VARIABLE)
+        ):
+            return edge.dest
+        return edge.origin
+
+    def _get_dependent_vertices(self, vertices_indexes: Set[int]) -> Set[int]:
+        """
+        :return: the given vertices and all the vertices, which directly or transitively reference them
+        """
+        dependent_vertices = set(vertices_indexes)
+        vertices_to_visit = list(vertices_indexes)
+        while vertices_to_visit:
+            vertex_index = vertices_to_visit.pop()
+            for edge in self.in_edges.get(vertex_index, []):
+                if edge.origin not in dependent_vertices:
+                    dependent_vertices.add(edge.origin)
+                    vertices_to_visit.append(edge.origin)
+        return dependent_vertices
+
+    @staticmethod
+    def _are_references_reusable(
+        previous_vertex: TerraformBlock, previous_to_new_index: Dict[int, int], vertices_to_render: Set[int]
+    ) -> bool:
+        referenced_indexes = [
+            breadcrumb.vertex_id
+            for breadcrumbs in previous_vertex.changed_attributes.values()
+            for breadcrumb in breadcrumbs
+        ]
+        referenced_indexes.extend(index for indexes in previous_vertex.module_connections.values() for index in indexes)
+        for previous_index in referenced_indexes:
+            index = previous_to_new_index.get(previous_index)
+            if index is None or index in vertices_to_render:
+                return False
+        return True
+
+    @staticmethod
+    def _reuse_vertex(
+        previous_vertex: TerraformBlock, new_vertex: TerraformBlock, previous_to_new_index: Dict[int, int]
+    ) -> TerraformBlock:
+        """
+        Creates a copy of a rendered vertex of the previous graph, which references the vertices of the new graph
+        """
+        vertex = copy(previous_vertex)
+        vertex.changed_attributes = {
+            attribute_key: [
+                BreadcrumbMetadata(previous_to_new_index[breadcrumb.vertex_id], breadcrumb.attribute_key)
+                for breadcrumb in breadcrumbs
+            ]
+            for attribute_key, breadcrumbs in previous_vertex.changed_attributes.items()
+        }
+        vertex.module_connections = {
+            attribute_key: [previous_to_new_index[index] for index in indexes]
+            for attribute_key, indexes in previous_vertex.module_connections.items()
+        }
+        vertex.source_module = new_vertex.source_module
+        vertex.breadcrumbs = {}
+        return vertex
 
     def _create_vertices(self) -> None:
         logging.info("Creating vertices")
         self.vertices: List[TerraformBlock] = [None] * len(self.module.blocks)  # type: ignore
         for i, block in enumerate(self.module.blocks):
             self.vertices[i] = block
+            self._add_vertex_to_indexes(i, block)
 
-            self.vertices_by_block_type[block.block_type].append(i)
-            self.vertices_block_name_map[block.block_type][block.name].append(i)
+    def _add_vertex_to_indexes(self, i: int, block: TerraformBlock) -> None:
+        self.vertices_by_block_type[block.block_type].append(i)
+        self.vertices_block_name_map[block.block_type][block.name].append(i)
 
-            if block.block_type == BlockType.MODULE:
-                # map between file paths and module vertices indexes from that file
-                self.map_path_to_module.setdefault(block.path, []).append(i)
+        if block.block_type == BlockType.MODULE:
+            # map between file paths and module vertices indexes from that file
+            self.map_path_to_module.setdefault(block.path, []).append(i)
 
-            self.vertices_by_module_dependency[(block.module_dependency, block.module_dependency_num)][block.block_type].append(i)
-            self.vertices_by_module_dependency_by_name[(block.module_dependency, block.module_dependency_num)][block.block_type][block.name].append(i)
+        self.vertices_by_module_dependency[(block.module_dependency, block.module_dependency_num)][block.block_type].append(i)
+        self.vertices_by_module_dependency_by_name[(block.module_dependency, block.module_dependency_num)][block.block_type][block.name].append(i)
 
-            self.in_edges[i] = []
-            self.out_edges[i] = []
+        self.in_edges[i] = []
+        self.out_edges[i] = []
 
     def _set_variables_values_from_modules(self) -> List[Undetermined]:
         undetermined_values: List[Undetermined] = []
@@ -158,11 +373,18 @@ class TerraformLocalGraph(LocalGraph):
                 if module_indices:
                     vertex.source_module = module_indices
 
-    def _build_edges(self) -> None:
+    def _build_edges(self, vertices_indexes: Optional[Iterable[int]] = None) -> None:
+        """
+        :param vertices_indexes: the vertices to connect, if not set all vertices are connected
+        """
         logging.info("Creating edges")
         self.get_module_vertices_mapping()
         aliases = self._get_aliases()
-        for origin_node_index, vertex in enumerate(self.vertices):
+        if vertices_indexes is None:
+            vertices_indexes = range(len(self.vertices))
+        for origin_node_index in vertices_indexes:
+            vertex = self.vertices[origin_node_index]
+            lookup_names = self.vertices_lookup_names[origin_node_index]
             for attribute_key in vertex.attributes:
                 if attribute_key in reserved_attribute_names or attribute_has_nested_attributes(
                     attribute_key, vertex.attributes
@@ -177,8 +399,12 @@ class TerraformLocalGraph(LocalGraph):
                     # for certain blocks such as data and resource, the block name is composed from several parts.
                     # the purpose of the loop is to avoid not finding the node if the name has several parts
                     sub_values = [remove_index_pattern_from_str(sub_value) for sub_value in vertex_reference.sub_parts]
+                    if vertex_reference.block_type == BlockType.MODULE:
+                        # the module outputs are looked up by their name
+                        lookup_names.update(sub_values)
                     for i, _ in enumerate(sub_values):
                         reference_name = join_trimmed_strings(char_to_join=".", str_lst=sub_values, num_to_trim=i)
+                        lookup_names.add(reference_name)
                         if vertex.module_dependency:
                             dest_node_index = self._find_vertex_index_relative_to_path(
                                 vertex_reference.block_type, reference_name, vertex.path, vertex.module_dependency, vertex.module_dependency_num
@@ -224,10 +450,12 @@ class TerraformLocalGraph(LocalGraph):
                 for attribute, value in vertex.attributes.items():
                     if attribute in MODULE_RESERVED_ATTRIBUTES:
                         continue
+                    lookup_names.add(attribute)
                     target_variable = next((v for v in target_variables if self.vertices[v].name == attribute), None)
                     if target_variable is not None:
                         self._create_edge(target_variable, origin_node_index, "default")
             elif vertex.block_type == BlockType.TF_VARIABLE:
+                lookup_names.add(vertex.name)
                 # Assuming the tfvars file is in the same directory as the variables file (best practice)
                 target_variables = [
                     index
@@ -371,8 +599,9 @@ class TerraformLocalGraph(LocalGraph):
             attribute_key, attribute_value, change_origin_id, previous_breadcrumbs, attribute_at_dest
         )
 
-    def update_vertices_configs(self) -> None:
-        for vertex in self.vertices:
+    def update_vertices_configs(self, vertices_indexes: Optional[Iterable[int]] = None) -> None:
+        vertices = self.vertices if vertices_indexes is None else [self.vertices[idx] for idx in vertices_indexes]
+        for vertex in vertices:
             changed_attributes = list(vertex.changed_attributes.keys())
             changed_attributes = filter_sub_keys(changed_attributes)
             self.update_vertex_config(vertex, changed_attributes)
@@ -74,12 +74,12 @@ def replace_string_value(original_str: Any, str_to_replace: str, replaced_value:
     if original_str is None or type(original_str) not in (str, list):
         return original_str
 
-    if type(original_str) is list:
-        for i, item in enumerate(original_str):
-            original_str[i] = replace_string_value(item, str_to_replace, replaced_value, keep_origin)
-            if type(replaced_value) in [int, float, bool]:
-                original_str[i] = evaluate_terraform(original_str[i])
-            return original_str
+    if type(original_str) is list and original_str:
+        # the given list is not modified, only the first item is replaced in a new list and the others are shared
+        new_item = replace_string_value(original_str[0], str_to_replace, replaced_value, keep_origin)
+        if type(replaced_value) in [int, float, bool]:
+            new_item = evaluate_terraform(new_item)
+        return [new_item, *original_str[1:]]
 
     if str_to_replace not in original_str:
         return original_str if keep_origin else str_to_replace
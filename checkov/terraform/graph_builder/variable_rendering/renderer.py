@@ -2,8 +2,7 @@ import logging
 import os
 import re
 from collections.abc import Hashable
-from copy import deepcopy
-from typing import TYPE_CHECKING, List, Dict, Any, Tuple, Union, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Tuple, Union, Optional, Set
 
 from lark.tree import Tree
 
@@ -37,17 +36,19 @@ CHECKOV_RENDER_MAX_LEN = force_int(os.getenv("CHECKOV_RENDER_MAX_LEN", "10000"))
 
 
 class TerraformVariableRenderer(VariableRenderer):
-    def __init__(self, local_graph: "TerraformLocalGraph") -> None:
-        super().__init__(local_graph)
+    def __init__(self, local_graph: "TerraformLocalGraph", vertices_to_render: Optional[Set[int]] = None) -> None:
+        super().__init__(local_graph, vertices_to_render)
+        # attributes of the referenced vertices, they are only re-created, after the vertex was updated
+        self.vertices_attributes_cache: Dict[int, Dict[str, Any]] = {}
 
     def evaluate_vertex_attribute_from_edge(self, edge_list: List[Edge]) -> None:
         multiple_edges = len(edge_list) > 1
         edge = edge_list[0]
         origin_vertex_attributes = self.local_graph.vertices[edge.origin].attributes
-        val_to_eval = deepcopy(origin_vertex_attributes.get(edge.label, ""))
+        origin_val = origin_vertex_attributes.get(edge.label, "")
 
         referenced_vertices = get_referenced_vertices_in_value(
-            value=val_to_eval, aliases={}, resources_types=self.local_graph.get_resources_types_in_graph()
+            value=origin_val, aliases={}, resources_types=self.local_graph.get_resources_types_in_graph()
         )
         if not referenced_vertices:
             origin_vertex = self.local_graph.vertices[edge.origin]
@@ -75,14 +76,13 @@ class TerraformVariableRenderer(VariableRenderer):
                 )
                 return
 
-        modified_vertex_attributes = self.local_graph.vertices[edge.origin].attributes
-        origin_val = modified_vertex_attributes.get(edge.label, "")
-        val_to_eval = deepcopy(origin_val)
+        # the value is never modified in place, replacing a reference creates a new value
+        val_to_eval = origin_val
         first_key_path = None
 
         if referenced_vertices:
             for edge in edge_list:
-                dest_vertex_attributes = self.local_graph.get_vertex_attributes_by_index(edge.dest, add_hash=False)
+                dest_vertex_attributes = self.get_vertex_attributes(edge.dest)
                 key_path_in_dest_vertex, replaced_key = self.find_path_from_referenced_vertices(
                     referenced_vertices, dest_vertex_attributes
                 )
@@ -114,15 +114,6 @@ class TerraformVariableRenderer(VariableRenderer):
                 attribute_at_dest=first_key_path,
             )
 
-        # Avoid loops on output => output edges
-        if (
-            self.local_graph.vertices[edge.origin].block_type == BlockType.OUTPUT
-            and self.local_graph.vertices[edge.dest].block_type == BlockType.OUTPUT
-        ):
-            if edge.origin not in self.done_edges_by_origin_vertex:
-                self.done_edges_by_origin_vertex[edge.origin] = []
-            self.done_edges_by_origin_vertex[edge.origin].append(edge)
-
     def extract_value_from_vertex(self, key_path: List[str], attributes: Dict[str, Any]) -> Any:
         for i, _ in enumerate(key_path):
             key = join_trimmed_strings(char_to_join=".", str_lst=key_path, num_to_trim=i)
@@ -211,6 +202,14 @@ class TerraformVariableRenderer(VariableRenderer):
         self.local_graph.update_vertex_attribute(
             vertex, changed_attribute_key, evaluated_attribute_value, change_origin_id, attribute_at_dest
         )
+        self.vertices_attributes_cache.pop(vertex, None)
+
+    def get_vertex_attributes(self, vertex_index: int) -> Dict[str, Any]:
+        vertex_attributes = self.vertices_attributes_cache.get(vertex_index)
+        if vertex_attributes is None:
+            vertex_attributes = self.local_graph.get_vertex_attributes_by_index(vertex_index, add_hash=False)
+            self.vertices_attributes_cache[vertex_index] = vertex_attributes
+        return vertex_attributes
 
     def evaluate_vertices_attributes(self) -> None:
         for vertex in self.local_graph.vertices:
@@ -248,7 +247,7 @@ class TerraformVariableRenderer(VariableRenderer):
         pass
 
     def evaluate_non_rendered_values(self) -> None:
-        for vertex in self.local_graph.vertices:
+        for vertex in self.get_vertices_to_render():
             changed_attributes = {}
             attributes: Dict[str, Any] = {}
             vertex.get_origin_attributes(attributes)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import hashlib
 import logging
-from typing import Type, Any
+import os
+import pickle  # nosec
+from typing import Type, Any, Iterable
 
 from checkov.common.graph.db_connectors.db_connector import DBConnector
 from checkov.common.graph.graph_manager import GraphManager
@@ -9,6 +12,11 @@ from checkov.common.util.consts import DEFAULT_EXTERNAL_MODULES_DIR
 from checkov.terraform.graph_builder.local_graph import TerraformLocalGraph
 from checkov.terraform.parser import Parser
 
+# bump, when the serialized structure of the local graph changes
+LOCAL_GRAPH_DUMP_VERSION = 2
+TERRAFORM_FILE_SUFFIXES = (".tf", ".tf.json", ".hcl", ".tfvars", ".tfvars.json")
+VARS_FILE_SUFFIXES = (".tfvars", ".tfvars.json")
+
 
 class TerraformGraphManager(GraphManager[TerraformLocalGraph]):
     def __init__(self, db_connector: DBConnector, source: str = "") -> None:
@@ -25,7 +33,14 @@ class TerraformGraphManager(GraphManager[TerraformLocalGraph]):
         excluded_paths: list[str] | None = None,
         vars_files: list[str] | None = None,
         create_graph: bool = True,
+        previous_local_graph: TerraformLocalGraph | None = None,
+        changed_files: list[str] | None = None,
     ) -> tuple[TerraformLocalGraph | None, dict[str, dict[str, Any]]]:
+        """
+        :param previous_local_graph: graph of a previous scan of the same source directory, if set together with
+                                     `changed_files`, only the parts of the graph affected by them are rebuilt
+        :param changed_files: files, which were added, modified or removed since the previous scan
+        """
         logging.info("Parsing HCL files in source dir")
         module, tf_definitions = self.parser.parse_hcl_module(
             source_dir=source_dir,
@@ -40,9 +55,17 @@ class TerraformGraphManager(GraphManager[TerraformLocalGraph]):
 
         local_graph = None
         if create_graph and module:
-            logging.info("Building graph from parsed module")
             local_graph = local_graph_class(module)
-            local_graph.build_graph(render_variables=render_variables)
+            if previous_local_graph is not None and changed_files is not None:
+                logging.info("Building graph from parsed module and previous graph")
+                local_graph.build_graph_incrementally(
+                    previous_graph=previous_local_graph,
+                    changed_files=changed_files,
+                    render_variables=render_variables,
+                )
+            else:
+                logging.info("Building graph from parsed module")
+                local_graph.build_graph(render_variables=render_variables)
 
         return local_graph, tf_definitions
 
@@ -54,3 +77,93 @@ class TerraformGraphManager(GraphManager[TerraformLocalGraph]):
         local_graph.build_graph(render_variables=render_variables)
 
         return local_graph
+
+    @staticmethod
+    def dump_local_graph(local_graph: TerraformLocalGraph, file_path: str, vars_files: list[str] | None = None) -> None:
+        """
+        Serializes the local graph together with the hashes of its source files to a file,
+        so it can be used by a later scan to build the graph incrementally
+        """
+        directories = {os.path.dirname(vertex.path) for vertex in local_graph.vertices}
+        file_hashes = TerraformGraphManager._get_file_hashes(directories, vars_files or [])
+        with open(file_path, "wb") as f:
+            pickle.dump(
+                {"version": LOCAL_GRAPH_DUMP_VERSION, "local_graph": local_graph, "file_hashes": file_hashes},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+
+    @staticmethod
+    def load_local_graph(file_path: str) -> TerraformLocalGraph | None:
+        """
+        Loads a local graph, which was serialized by `dump_local_graph`.
+        Only load files created by checkov itself, because the content is unpickled.
+
+        :return: the local graph or None, if it was serialized by an incompatible version
+        """
+        data = TerraformGraphManager._load_local_graph_dump(file_path)
+        if data is None:
+            return None
+        local_graph: TerraformLocalGraph = data["local_graph"]
+        return local_graph
+
+    @staticmethod
+    def load_local_graph_with_changed_files(
+        file_path: str, vars_files: list[str] | None = None
+    ) -> tuple[TerraformLocalGraph | None, list[str] | None]:
+        """
+        Loads a local graph like `load_local_graph` and the files, which were added, modified or removed since then.
+
+        :return: the local graph and the changed files or None for both, if the graph can't be reused,
+                 because a variables file changed or it was serialized by an incompatible version
+        """
+        data = TerraformGraphManager._load_local_graph_dump(file_path)
+        if data is None:
+            return None, None
+
+        previous_file_hashes: dict[str, str] = data["file_hashes"]
+        directories = {os.path.dirname(path) for path in previous_file_hashes}
+        file_hashes = TerraformGraphManager._get_file_hashes(directories, vars_files or [])
+        changed_files = sorted(
+            path
+            for path in previous_file_hashes.keys() | file_hashes.keys()
+            if previous_file_hashes.get(path) != file_hashes.get(path)
+        )
+        vars_file_paths = {os.path.realpath(path) for path in vars_files or []}
+        if any(path.endswith(VARS_FILE_SUFFIXES) or path in vars_file_paths for path in changed_files):
+            # variable values aren't linked to the vertices of the variables files
+            logging.info(f"Variables files changed since the local graph in {file_path} was created, ignoring it")
+            return None, None
+
+        local_graph: TerraformLocalGraph = data["local_graph"]
+        return local_graph, changed_files
+
+    @staticmethod
+    def _load_local_graph_dump(file_path: str) -> dict[str, Any] | None:
+        with open(file_path, "rb") as f:
+            data: dict[str, Any] = pickle.load(f)  # nosec
+
+        if data.get("version") != LOCAL_GRAPH_DUMP_VERSION:
+            logging.info(f"Local graph in {file_path} has an incompatible version, ignoring it")
+            return None
+        return data
+
+    @staticmethod
+    def _get_file_hashes(directories: Iterable[str], files: Iterable[str]) -> dict[str, str]:
+        """Hashes the Terraform files of the given directories and the given files"""
+
+        file_paths = set(files)
+        for directory in directories:
+            if os.path.isdir(directory):
+                file_paths.update(
+                    entry.path
+                    for entry in os.scandir(directory)
+                    if entry.is_file() and entry.name.endswith(TERRAFORM_FILE_SUFFIXES)
+                )
+
+        file_hashes = {}
+        for path in file_paths:
+            if os.path.isfile(path):
+                with open(path, "rb") as f:
+                    file_hashes[os.path.realpath(path)] = hashlib.sha256(f.read()).hexdigest()
+        return file_hashes
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Any
+
+import hcl2
+
+from checkov.common.util.json_utils import CustomJSONEncoder
+from checkov.version import version as checkov_version
+
+CHECKOV_TF_PARSE_CACHE_DIR_ENV = "CHECKOV_TF_PARSE_CACHE_DIR"
+# bump, when the structure of the cached payload changes
+PARSE_CACHE_FORMAT_VERSION = "1"
+
+
+class ParseCache:
+    """
+    Persistent cache of parsed Terraform files, keyed by the file content, the loader and the parser version.
+
+    The payload is stored as gzip compressed compact JSON, which is equivalent to the JSON round trip
+    the parser does anyway before the definitions are used.
+    """
+
+    def __init__(self, cache_dir: str | None = None) -> None:
+        self.cache_dir = cache_dir
+        self.parser_version = f"{PARSE_CACHE_FORMAT_VERSION}:{checkov_version}:{hcl2.__version__}"
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.cache_dir)
+
+    def get_key(self, content: bytes, loader: str, clean_definitions: bool) -> str:
+        """
+        :param loader: the loader of the file, 'json' or 'hcl2', because the same content results in different definitions
+        """
+        file_hash = hashlib.sha256(content)
+        file_hash.update(f"{self.parser_version}:{loader}:{clean_definitions}".encode())
+        return file_hash.hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        cache_file = self._get_cache_file_path(key)
+        try:
+            with gzip.open(cache_file, "rb") as f:
+                return json.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logging.debug(f"Failed to read parse cache entry {cache_file}", exc_info=True)
+            return None
+
+    def put(self, key: str, payload: Any) -> None:
+        cache_file = self._get_cache_file_path(key)
+        try:
+            data = json.dumps(payload, cls=CustomJSONEncoder, separators=(",", ":")).encode()
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+
+            # write to a temp file first, so concurrent scans never read a partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(gzip.compress(data))
+                os.replace(tmp_path, cache_file)
+            except Exception:
+                os.remove(tmp_path)
+                raise
+        except Exception:
+            logging.debug(f"Failed to write parse cache entry {cache_file}", exc_info=True)
+
+    def _get_cache_file_path(self, key: str) -> str:
+        return os.path.join(str(self.cache_dir), key[:2], f"{key}.json.gz")
+
+
+parse_cache = ParseCache(cache_dir=os.getenv(CHECKOV_TF_PARSE_CACHE_DIR_ENV))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import json
 import logging
 import os
@@ -16,6 +17,7 @@ from lark import Tree
 from typing_extensions import TypeAlias
 
 from checkov.common.runners.base_runner import filter_ignored_paths, IGNORE_HIDDEN_DIRECTORY_ENV
+from checkov.common.runners.file_index import walk_directory
 from checkov.common.util.config_utils import should_scan_hcl_files
 from checkov.common.util.consts import DEFAULT_EXTERNAL_MODULES_DIR, RESOLVED_MODULE_ENTRY_NAME
 from checkov.common.util.json_utils import CustomJSONEncoder
@@ -25,10 +27,12 @@ from checkov.terraform.graph_builder.graph_components.block_types import BlockTy
 from checkov.terraform.graph_builder.graph_components.module import Module
 from checkov.terraform.graph_builder.utils import remove_module_dependency_in_path
 from checkov.terraform.module_loading.content import ModuleContent
+from checkov.terraform.parse_cache import parse_cache
 from checkov.terraform.module_loading.module_finder import load_tf_modules
 from checkov.terraform.module_loading.registry import module_loader_registry as default_ml_registry, \
     ModuleLoaderRegistry
 from checkov.common.util.parser_utils import eval_string, find_var_blocks
+from checkov.common.util.profiler import profiled, PARSE
 
 _Hcl2Payload: TypeAlias = "dict[str, list[dict[str, Any]]]"
 
@@ -155,7 +159,7 @@ class Parser:
         keys_referenced_as_modules: Set[str] = set()
 
         if include_sub_dirs:
-            for sub_dir, d_names, f_names in os.walk(self.directory):
+            for sub_dir, d_names, _ in walk_directory(self.directory, self.excluded_paths):
                 # filter subdirectories for future iterations (we filter files while iterating the directory)
                 _filter_ignored_paths(sub_dir, d_names, self.excluded_paths)
                 if dir_filter(os.path.abspath(sub_dir)):
@@ -496,6 +500,7 @@ class Parser:
             deep_merge.merge(self.out_evaluations_context, all_module_evaluations_context)
         return skipped_a_module
 
+    @profiled(PARSE)
     def parse_hcl_module(
         self,
         source_dir: str,
@@ -733,18 +738,34 @@ Load JSON or HCL, depending on filename.
     file_name = os.path.basename(file_path)
 
     try:
+        # the file is only read once, the content is used for the cache key and for parsing
+        with open(file_path, "rb") as f:
+            content = f.read()
+
+        loader = "json" if file_name.endswith(".json") else "hcl2"
+        cache_key = None
+        if parse_cache.enabled:
+            cache_key = parse_cache.get_key(content, loader, clean_definitions)
+            cached_data = parse_cache.get(cache_key)
+            if cached_data is not None:
+                logging.debug(f"Loaded {file_path} from the parse cache")
+                return cached_data
+
         logging.debug(f"Parsing {file_path}")
 
-        with open(file_path, "r", encoding="utf-8-sig") as f:
-            if file_name.endswith(".json"):
-                return json.load(f)
+        # the content is decoded the same way as by a file opened in text mode
+        with io.TextIOWrapper(io.BytesIO(content), encoding="utf-8-sig") as f:
+            if loader == "json":
+                data = json.load(f)
             else:
                 raw_data = hcl2.load(f)
-                non_malformed_definitions = validate_malformed_definitions(raw_data)
+                data = validate_malformed_definitions(raw_data)
                 if clean_definitions:
-                    return clean_bad_definitions(non_malformed_definitions)
-                else:
-                    return non_malformed_definitions
+                    data = clean_bad_definitions(data)
+
+        if cache_key:
+            parse_cache.put(cache_key, data)
+        return data
     except Exception as e:
         logging.debug(f'failed while parsing file {file_path}', exc_info=True)
         parsing_errors[file_path] = e
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import itertools
-from typing import Optional, Tuple, Dict, List, Any
+import logging
+from json import JSONDecodeError
+from typing import Optional, Tuple, Dict, List, Any, Iterable, Iterator
 
+from checkov.cloudformation.parser.cfn_yaml import read_file_content
 from checkov.common.parsers.node import DictNode, ListNode
 from checkov.terraform.context_parsers.tf_plan import parse
+from checkov.terraform.plan_reader import TfPlanReader
 
 SIMPLE_TYPES = (str, int, float, bool)
 TF_PLAN_RESOURCE_ADDRESS = "__address__"
@@ -120,56 +124,25 @@ def _prepare_resource_block(
     return resource_block, prepared
 
 
-def _find_child_modules(
-    child_modules: ListNode, resource_changes: dict[str, dict[str, Any]], root_module_conf: dict[str, Any]
-) -> List[Dict[str, Dict[str, Any]]]:
-    """ Find all child modules if any. Including any amount of nested child modules.
+def _iter_planned_resources(template: dict[str, Any]) -> Iterator[tuple[str, DictNode]]:
+    """Yields the module address and resource of the 'planned_values' resources like TfPlanReader.iter_planned_resources()"""
+
+    root_module = template.get("planned_values", {}).get("root_module", {})
+    for resource in root_module.get("resources", []):
+        yield "", resource
+
+    # Terraform supports modules within modules so we need to search
+    # in nested modules to find all resource blocks
+    yield from _iter_child_module_resources(root_module.get("child_modules", []))
 
-    :param child_modules: list of terraform child_module objects
-    :param resource_changes: a resource address to resource changes dict
-    :param root_module_conf: configuration block of the root module
-    :returns:
-        list of terraform resource blocks
-    """
 
-    resource_blocks = []
+def _iter_child_module_resources(child_modules: ListNode) -> Iterator[tuple[str, DictNode]]:
     for child_module in child_modules:
-        nested_child_modules = child_module.get("child_modules", [])
-        if nested_child_modules:
-            nested_blocks = _find_child_modules(
-                child_modules=nested_child_modules,
-                resource_changes=resource_changes,
-                root_module_conf=root_module_conf
-            )
-            for resource in nested_blocks:
-                resource_blocks.append(resource)
+        yield from _iter_child_module_resources(child_module.get("child_modules", []))
 
         module_address = child_module.get("address", "")
-        module_call_resources = _get_module_call_resources(
-            module_address=module_address,
-            root_module_conf=root_module_conf,
-        )
-
         for resource in child_module.get("resources", []):
-            module_call_conf = None
-            if module_address and module_call_resources:
-                module_call_conf = next(
-                    (
-                        module_call_resource
-                        for module_call_resource in module_call_resources
-                        if f"{module_address}.{module_call_resource['address']}" == resource["address"]
-                    ),
-                    None
-                )
-
-            resource_block, prepared = _prepare_resource_block(
-                resource=resource,
-                conf=module_call_conf,
-                resource_changes=resource_changes,
-            )
-            if prepared is True:
-                resource_blocks.append(resource_block)
-    return resource_blocks
+            yield module_address, resource
 
 
 def _get_module_call_resources(module_address: str, root_module_conf: dict[str, Any]) -> list[dict[str, Any]]:
@@ -184,12 +157,36 @@ def _get_module_call_resources(module_address: str, root_module_conf: dict[str,
     return root_module_conf.get("resources", [])
 
 
-def _get_resource_changes(template: dict[str, Any]) -> dict[str, dict[str, Any]]:
+class _ConfigurationIndex:
+    """Index of the 'configuration' resources, so the matching one for a planned resource can be looked up directly"""
+
+    def __init__(self, root_module_conf: dict[str, Any]) -> None:
+        self.root_module_conf = root_module_conf
+        self.root_resources: dict[tuple[str, str], dict[str, Any]] = {}
+        for resource in root_module_conf.get("resources", []):
+            # the first matching one wins
+            self.root_resources.setdefault((resource["type"], resource["name"]), resource)
+        self.module_resources: dict[str, dict[str, dict[str, Any]]] = {}
+
+    def get_resource_conf(self, resource: dict[str, Any], module_address: str) -> dict[str, Any] | None:
+        if not module_address:
+            return self.root_resources.get((resource["type"], resource["name"]))
+
+        module_resources = self.module_resources.get(module_address)
+        if module_resources is None:
+            module_resources = {}
+            for module_call_resource in _get_module_call_resources(module_address, self.root_module_conf):
+                module_resources.setdefault(f"{module_address}.{module_call_resource['address']}", module_call_resource)
+            self.module_resources[module_address] = module_resources
+
+        return module_resources.get(resource["address"])
+
+
+def _get_resource_changes(resource_changes: Any) -> dict[str, dict[str, Any]]:
     """Returns a resource address to resource changes dict"""
 
     resource_changes_map = {}
 
-    resource_changes = template.get("resource_changes")
     if resource_changes and isinstance(resource_changes, list):
         resource_changes_map = {
             change.get("address", ""): change
@@ -199,45 +196,68 @@ def _get_resource_changes(template: dict[str, Any]) -> dict[str, dict[str, Any]]
     return resource_changes_map
 
 
-def parse_tf_plan(tf_plan_file: str, out_parsing_errors: Dict[str, str]) -> Tuple[Optional[Dict[str, Any]], Optional[List[Tuple[int, str]]]]:
-    """
-    :type tf_plan_file: str - path to plan file
-    :rtype: tf_definition dictionary and template_lines of the plan file
-    """
+def _build_tf_definition(
+    planned_resources: Iterable[tuple[str, DictNode]],
+    root_module_conf: dict[str, Any],
+    resource_changes: dict[str, dict[str, Any]],
+) -> Dict[str, Any]:
     tf_definition: Dict[str, Any] = {"resource": []}
-    template, template_lines = parse(tf_plan_file, out_parsing_errors)
-    if not template:
-        return None, None
+    configuration_index = _ConfigurationIndex(root_module_conf)
 
-    resource_changes = _get_resource_changes(template=template)
-
-    for resource in template.get("planned_values", {}).get("root_module", {}).get("resources", []):
-        conf = next(
-            (
-                x
-                for x in template.get("configuration", {}).get("root_module", {}).get("resources", [])
-                if x["type"] == resource["type"] and x["name"] == resource["name"]
-            ),
-            None,
-        )
+    for module_address, resource in planned_resources:
         resource_block, prepared = _prepare_resource_block(
             resource=resource,
-            conf=conf,
+            conf=configuration_index.get_resource_conf(resource, module_address),
             resource_changes=resource_changes,
         )
         if prepared is True:
             tf_definition["resource"].append(resource_block)
-    child_modules = template.get("planned_values", {}).get("root_module", {}).get("child_modules", [])
-    root_module_conf = template.get("configuration", {}).get("root_module", {})
-    # Terraform supports modules within modules so we need to search
-    # in nested modules to find all resource blocks
-    resource_blocks = _find_child_modules(
-        child_modules=child_modules,
-        resource_changes=resource_changes,
-        root_module_conf=root_module_conf,
+    return tf_definition
+
+
+def _parse_tf_plan_template(
+    tf_plan_file: str, out_parsing_errors: Dict[str, str]
+) -> Tuple[Optional[Dict[str, Any]], Optional[List[Tuple[int, str]]]]:
+    """Parses the plan file with the YAML based loader, which also supports files, which are not strict JSON"""
+
+    template, template_lines = parse(tf_plan_file, out_parsing_errors)
+    if not template:
+        return None, None
+
+    tf_definition = _build_tf_definition(
+        planned_resources=_iter_planned_resources(template),
+        root_module_conf=template.get("configuration", {}).get("root_module", {}),
+        resource_changes=_get_resource_changes(resource_changes=template.get("resource_changes")),
+    )
+    return tf_definition, template_lines
+
+
+def parse_tf_plan(tf_plan_file: str, out_parsing_errors: Dict[str, str]) -> Tuple[Optional[Dict[str, Any]], Optional[List[Tuple[int, str]]]]:
+    """
+    :type tf_plan_file: str - path to plan file
+    :rtype: tf_definition dictionary and template_lines of the plan file
+    """
+    try:
+        content = read_file_content(tf_plan_file)
+        if "planned_values" not in content:
+            return None, None
+
+        reader = TfPlanReader(content)
+        if not reader.read_sections():
+            return None, None
+    except JSONDecodeError:
+        logging.debug(f"Failed to read plan file {tf_plan_file} as JSON, falling back to the YAML based loader", exc_info=True)
+        return _parse_tf_plan_template(tf_plan_file, out_parsing_errors)
+    except Exception as e:
+        out_parsing_errors[tf_plan_file] = str(e)
+        return None, None
+
+    template_lines = [(idx + 1, line) for idx, line in enumerate(content.splitlines(keepends=True))]
+    tf_definition = _build_tf_definition(
+        planned_resources=reader.iter_planned_resources(),
+        root_module_conf=(reader.get_section("configuration") or {}).get("root_module", {}),
+        resource_changes=_get_resource_changes(resource_changes=reader.get_section("resource_changes")),
     )
-    for resource in resource_blocks:
-        tf_definition["resource"].append(resource)
     return tf_definition, template_lines
 
 
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import json
+from bisect import bisect_left
+from json import JSONDecodeError
+from json.decoder import WHITESPACE, scanstring  # type:ignore[attr-defined]  # they are not explicitly exported
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from checkov.common.parsers.json.decoder import TOKEN_PATTERN, Mark, NodeBuilder, Pairs, find_indexes
+from checkov.common.parsers.node import DictNode, LineIndex, StrNode
+
+# the sections needed besides 'planned_values', which is streamed
+PLAN_SECTIONS = ("terraform_version", "configuration", "resource_changes")
+
+
+class _PlanNodeBuilder(NodeBuilder):
+    """Creates the nodes of the YAML based loader, which also have their one based lines"""
+
+    def create_dict(self, value: Pairs, pairs: List[Tuple[StrNode, Any]], start: int, end: int) -> DictNode:
+        node = super().create_dict(value, pairs, start, end)
+        node["__startline__"] = node.start_mark.line + 1
+        node["__endline__"] = node.end_mark.line + 1
+        return node
+
+
+class PlanLineIndex(LineIndex):
+    """Line index, which creates the zero based marks of the YAML based loader"""
+
+    __slots__ = ()
+
+    def get_start_mark(self, offset: int) -> Mark:
+        line = bisect_left(self.newline_indexes, offset)
+        line_start = self.newline_indexes[line - 1] + 1 if line else 0
+        return Mark(line, offset - line_start)
+
+    def get_end_mark(self, offset: int) -> Mark:
+        return self.get_start_mark(offset)
+
+
+class TfPlanReader:
+    """
+    Reads a Terraform plan JSON document without materializing it as a whole.
+
+    The 'planned_values' resources are decoded one at a time with the same marks the YAML based loader creates,
+    all other needed sections are decoded as plain Python objects and the rest is skipped.
+    """
+
+    def __init__(self, content: str) -> None:
+        self.content = content
+        self.pos = 0
+        self._decoder = json.JSONDecoder()
+        self._pairs_decoder = json.JSONDecoder(object_pairs_hook=Pairs)
+        # objects of skipped values are dropped right away to keep the memory footprint low
+        self._skip_decoder = json.JSONDecoder(object_pairs_hook=lambda pairs: None)
+        self._sections: Dict[str, Any] = {}
+        self._planned_values_pos: Optional[int] = None
+        self._node_builder: Optional[_PlanNodeBuilder] = None
+
+    def read_sections(self) -> bool:
+        """
+        Reads the top level sections of the plan
+
+        :return: if the document is a Terraform plan
+        """
+
+        self.pos = 0
+        self._skip_whitespace()
+        if not self.content.startswith("{", self.pos):
+            self.skip_value()
+            return False
+
+        for key in self.iter_object():
+            if key in PLAN_SECTIONS:
+                self._sections[key] = self.read_value()
+            elif key == "planned_values":
+                self._planned_values_pos = self.pos
+                self.skip_value()
+            else:
+                self.skip_value()
+
+        self._skip_whitespace()
+        if self.pos != len(self.content):
+            raise JSONDecodeError("Extra data", self.content, self.pos)
+
+        return "terraform_version" in self._sections and self._planned_values_pos is not None
+
+    def get_section(self, name: str) -> Any:
+        return self._sections.get(name)
+
+    def iter_planned_resources(self) -> Iterator[Tuple[str, DictNode]]:
+        """
+        Yields the module address and the marked resource of the 'planned_values' resources,
+        first the ones of the root module followed by the ones of the child modules, nested ones first
+        """
+
+        if self._planned_values_pos is None:
+            return
+
+        self.pos = self._planned_values_pos
+        root_module_pos = None
+        for key in self.iter_object():
+            if key == "root_module":
+                root_module_pos = self.pos
+            self.skip_value()
+
+        if root_module_pos is not None:
+            resources_pos, child_modules_pos, _ = self._read_module(root_module_pos)
+            yield from self._iter_resources(resources_pos, "")
+            yield from self._iter_child_modules(child_modules_pos)
+
+    def _iter_child_modules(self, child_modules_pos: Optional[int]) -> Iterator[Tuple[str, DictNode]]:
+        if child_modules_pos is None:
+            return
+
+        self.pos = child_modules_pos
+        child_module_positions = []
+        for _ in self.iter_array():
+            child_module_positions.append(self.pos)
+            self.skip_value()
+
+        for child_module_pos in child_module_positions:
+            resources_pos, nested_child_modules_pos, module_address = self._read_module(child_module_pos)
+            yield from self._iter_child_modules(nested_child_modules_pos)
+            yield from self._iter_resources(resources_pos, module_address)
+
+    def _read_module(self, module_pos: int) -> Tuple[Optional[int], Optional[int], str]:
+        """Returns the position of the resources and child modules and the address of a module"""
+
+        resources_pos = None
+        child_modules_pos = None
+        module_address = ""
+
+        self.pos = module_pos
+        for key in self.iter_object():
+            if key == "resources":
+                resources_pos = self.pos
+            elif key == "child_modules":
+                child_modules_pos = self.pos
+            elif key == "address":
+                module_address = self.read_value() or ""
+                continue
+            self.skip_value()
+
+        return resources_pos, child_modules_pos, module_address
+
+    def _iter_resources(self, resources_pos: Optional[int], module_address: str) -> Iterator[Tuple[str, DictNode]]:
+        if resources_pos is None:
+            return
+
+        self.pos = resources_pos
+        for _ in self.iter_array():
+            resource = self.read_marked_value()
+            if isinstance(resource, DictNode):
+                # the position needs to be kept, because the consumer may use the reader in between
+                pos = self.pos
+                yield module_address, resource
+                self.pos = pos
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Yields the keys of the object at the current position,
+        the value has to be consumed before the next key is requested, otherwise it is skipped.
+        A value other than an object is skipped and yields nothing.
+        """
+
+        content = self.content
+        self._skip_whitespace()
+        if not content.startswith("{", self.pos):
+            self.skip_value()
+            return
+
+        self.pos = self._skip_whitespace(self.pos + 1)
+        if content.startswith("}", self.pos):
+            self.pos += 1
+            return
+
+        while True:
+            if not content.startswith('"', self.pos):
+                raise JSONDecodeError("Expecting property name enclosed in double quotes", content, self.pos)
+            key, self.pos = scanstring(content, self.pos + 1)
+            self.pos = self._skip_whitespace()
+            if not content.startswith(":", self.pos):
+                raise JSONDecodeError("Expecting ':' delimiter", content, self.pos)
+            value_pos = self.pos = self._skip_whitespace(self.pos + 1)
+
+            yield key
+
+            if self.pos == value_pos:
+                self.skip_value()
+            if self._read_delimiter("}"):
+                return
+
+    def iter_array(self) -> Iterator[None]:
+        """
+        Yields once for each value of the array at the current position,
+        the value has to be consumed before the next one is requested, otherwise it is skipped.
+        A value other than an array is skipped and yields nothing.
+        """
+
+        content = self.content
+        self._skip_whitespace()
+        if not content.startswith("[", self.pos):
+            self.skip_value()
+            return
+
+        self.pos = self._skip_whitespace(self.pos + 1)
+        if content.startswith("]", self.pos):
+            self.pos += 1
+            return
+
+        while True:
+            value_pos = self.pos
+
+            yield None
+
+            if self.pos == value_pos:
+                self.skip_value()
+            if self._read_delimiter("]"):
+                return
+
+    def read_value(self) -> Any:
+        """Decodes the value at the current position as plain Python object"""
+
+        value, self.pos = self._decoder.raw_decode(self.content, self._skip_whitespace())
+        return value
+
+    def skip_value(self) -> None:
+        _, self.pos = self._skip_decoder.raw_decode(self.content, self._skip_whitespace())
+
+    def read_marked_value(self) -> Any:
+        """
+        Decodes the value at the current position like the YAML based loader,
+        therefore objects, arrays and strings are nodes with marks
+        """
+
+        start = self._skip_whitespace()
+        value, self.pos = self._pairs_decoder.raw_decode(self.content, start)
+
+        if self._node_builder is None:
+            # the line index is shared by all nodes of the document, which only keep the offsets of their marks
+            self._node_builder = _PlanNodeBuilder(PlanLineIndex(find_indexes(self.content)))
+
+        tokens = TOKEN_PATTERN.finditer(self.content, start, self.pos)
+        return self._node_builder.to_node(value, tokens)
+
+    def _read_delimiter(self, closing: str) -> bool:
+        """Reads the delimiter after a value and returns, if the container was closed"""
+
+        self.pos = self._skip_whitespace()
+        char = self.content[self.pos:self.pos + 1]
+        self.pos += 1
+        if char == closing:
+            return True
+        if char != ",":
+            raise JSONDecodeError(f"Expecting ',' delimiter or '{closing}'", self.content, self.pos - 1)
+        self.pos = self._skip_whitespace()
+        return False
+
+    def _skip_whitespace(self, pos: Optional[int] = None) -> int:
+        self.pos = WHITESPACE.match(self.content, self.pos if pos is None else pos).end()
+        return self.pos
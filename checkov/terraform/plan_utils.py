@@ -2,15 +2,16 @@ import json
 import logging
 import os
 from typing import Dict, List, Tuple, Any, Optional
-import dpath
 
 from checkov.terraform.context_parsers.registry import parser_registry
 from checkov.terraform.plan_parser import parse_tf_plan, TF_PLAN_RESOURCE_ADDRESS
-from checkov.common.runners.base_runner import filter_ignored_paths
+from checkov.common.runners.file_index import walk_directory
+from checkov.common.util.profiler import profiled, PARSE
 from checkov.runner_filter import RunnerFilter
 from checkov.common.parsers.node import DictNode
 
 
+@profiled(PARSE)
 def create_definitions(
     root_folder: str,
     files: Optional[List[str]] = None,
@@ -19,9 +20,7 @@ def create_definitions(
 ) -> Tuple[Dict[str, DictNode], Dict[str, List[Tuple[int, str]]]]:
     if root_folder:
         files = [] if not files else files
-        for root, d_names, f_names in os.walk(root_folder):
-            filter_ignored_paths(root, d_names, runner_filter.excluded_paths)
-            filter_ignored_paths(root, f_names, runner_filter.excluded_paths)
+        for root, _, f_names in walk_directory(root_folder, runner_filter.excluded_paths):
             for file in f_names:
                 file_ending = os.path.splitext(file)[1]
                 if file_ending == '.json':
@@ -52,39 +51,54 @@ def create_definitions(
 
 def build_definitions_context(definitions: Dict[str, DictNode], definitions_raw: Dict[str, List[Tuple[int, str]]]) -> \
         Dict[str, Dict[str, Any]]:
-    definitions_context = {}
+    definitions_context: Dict[str, Dict[str, Any]] = {}
     block_type = 'resource'
     for full_file_path, definition in definitions.items():
         entities = definition.get(block_type, [])
+        resource_definitions = _get_resource_definitions(entities)
         for entity in entities:
             context_parser = parser_registry.context_parsers[block_type]
             definition_path = context_parser.get_entity_context_path(entity)
             entity_id = ".".join(definition_path)
             # Entity can exist only once per dir, for file as well
-            entity_context = get_entity_context(definitions, definitions_raw, definition_path, full_file_path)
-            dpath.new(definitions_context, [full_file_path, entity_id], entity_context)
+            resource_definition = resource_definitions.get((definition_path[0], definition_path[1]))
+            entity_context = _build_entity_context(resource_definition, definitions_raw[full_file_path])
+            definitions_context.setdefault(full_file_path, {})[entity_id] = entity_context
     return definitions_context
 
 
+def _get_resource_definitions(resources: List[Dict[str, Any]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """Returns the resource definitions by their type and name, the first one wins like in get_entity_context()"""
+
+    resource_definitions: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for resource in resources:
+        for resource_type, resource_names in resource.items():
+            for resource_name, resource_definition in resource_names.items():
+                resource_definitions.setdefault((resource_type, resource_name), resource_definition)
+    return resource_definitions
+
+
+def _build_entity_context(
+    resource_definition: Optional[Dict[str, Any]], definition_raw: List[Tuple[int, str]]
+) -> Dict[str, Any]:
+    entity_context: Dict[str, Any] = {}
+    if resource_definition is None:
+        return entity_context
+
+    entity_context['start_line'] = resource_definition['start_line'][0]
+    entity_context['end_line'] = resource_definition['end_line'][0]
+    entity_context["code_lines"] = definition_raw[entity_context["start_line"]: entity_context["end_line"]]
+    entity_context['address'] = resource_definition[TF_PLAN_RESOURCE_ADDRESS]
+    return entity_context
+
+
 def get_entity_context(definitions, definitions_raw, definition_path, full_file_path):
     # return self.context.get(full_file_path, {})
-    entity_context = {}
-
     if full_file_path not in definitions:
         logging.debug(
             f'Tried to look up file {full_file_path} in TF plan entity definitions, but it does not exist')
-        return entity_context
+        return {}
 
-    for resource in definitions.get(full_file_path, {}).get('resource', []):
-        resource_type = definition_path[0]
-        if resource_type in resource.keys():
-            resource_name = definition_path[1]
-            if resource_name in resource[resource_type].keys():
-                resource_defintion = resource[resource_type][resource_name]
-                entity_context['start_line'] = resource_defintion['start_line'][0]
-                entity_context['end_line'] = resource_defintion['end_line'][0]
-                entity_context["code_lines"] = definitions_raw[full_file_path][
-                                               entity_context["start_line"]: entity_context["end_line"]]
-                entity_context['address'] = resource_defintion[TF_PLAN_RESOURCE_ADDRESS]
-                return entity_context
-    return entity_context
+    resource_definitions = _get_resource_definitions(definitions.get(full_file_path, {}).get('resource', []))
+    resource_definition = resource_definitions.get((definition_path[0], definition_path[1]))
+    return _build_entity_context(resource_definition, definitions_raw[full_file_path])
@@ -36,6 +36,7 @@ from checkov.terraform.graph_builder.graph_components.block_types import BlockTy
 from checkov.terraform.graph_builder.graph_to_tf_definitions import convert_graph_vertices_to_tf_definitions
 from checkov.terraform.graph_builder.local_graph import TerraformLocalGraph
 from checkov.terraform.graph_manager import TerraformGraphManager
+from checkov.common.util.profiler import profiled, PARSE
 # Allow the evaluation of empty variables
 from checkov.terraform.parser import Parser
 from checkov.terraform.tag_providers import get_resource_tags
@@ -103,6 +104,7 @@ class Runner(BaseRunner):
             if root_folder:
                 root_folder = os.path.abspath(root_folder)
 
+                previous_local_graph, changed_files = self._load_previous_local_graph(runner_filter)
                 local_graph, self.definitions = self.graph_manager.build_graph_from_source_directory(
                     source_dir=root_folder,
                     local_graph_class=self.graph_class,
@@ -112,7 +114,11 @@ class Runner(BaseRunner):
                     excluded_paths=runner_filter.excluded_paths,
                     vars_files=runner_filter.var_files,
                     create_graph=CHECKOV_CREATE_GRAPH,
+                    previous_local_graph=previous_local_graph,
+                    changed_files=changed_files,
                 )
+                if local_graph and runner_filter.tf_graph_dump_path:
+                    self._dump_local_graph(local_graph, runner_filter)
             elif files:
                 files = [os.path.abspath(file) for file in files]
                 root_folder = os.path.split(os.path.commonprefix(files))[0]
@@ -268,6 +274,27 @@ class Runner(BaseRunner):
             self.pbar.update()
         self.pbar.close()
 
+    def _load_previous_local_graph(
+        self, runner_filter: RunnerFilter
+    ) -> Tuple[Optional[TerraformLocalGraph], Optional[List[str]]]:
+        """Loads the graph of the previous scan and the files changed since then, if a graph dump path is set"""
+
+        dump_path = runner_filter.tf_graph_dump_path
+        if not CHECKOV_CREATE_GRAPH or not dump_path or not os.path.isfile(dump_path):
+            return None, None
+
+        try:
+            return self.graph_manager.load_local_graph_with_changed_files(dump_path, runner_filter.var_files)
+        except Exception:
+            logging.warning(f"Failed to load the Terraform graph from {dump_path}, building the whole graph", exc_info=True)
+            return None, None
+
+    def _dump_local_graph(self, local_graph: TerraformLocalGraph, runner_filter: RunnerFilter) -> None:
+        try:
+            self.graph_manager.dump_local_graph(local_graph, runner_filter.tf_graph_dump_path, runner_filter.var_files)
+        except Exception:
+            logging.warning(f"Failed to dump the Terraform graph to {runner_filter.tf_graph_dump_path}", exc_info=True)
+
     def run_all_blocks(self, definition, definitions_context, full_file_path, root_folder, report,
                        scanned_file, runner_filter, module_referrer: Optional[str]):
         if not definition:
@@ -399,6 +426,7 @@ class Runner(BaseRunner):
                         )
                     )
 
+    @profiled(PARSE)
     def _parse_files(self, files, scan_hcl, parsing_errors):
         def parse_file(file):
             if not (file.endswith(".tf") or (scan_hcl and file.endswith(".hcl"))):
@@ -54,7 +54,7 @@ setup(
         "docker",
         "configargparse",
         "argcomplete",
-        "detect-secrets",
+        "detect-secrets>=1.3.0,<1.4.0",
         "policyuniverse",
         "typing-extensions>=4.1.0",
         "cachetools",
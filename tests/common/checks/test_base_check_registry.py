@@ -1,7 +1,9 @@
 import unittest
 
+from checkov.common.bridgecrew.severities import Severities, BcSeverities
 from checkov.common.checks.base_check import BaseCheck
 from checkov.common.checks.base_check_registry import BaseCheckRegistry
+from checkov.runner_filter import RunnerFilter
 
 
 class TestCheck(BaseCheck):
@@ -177,5 +179,91 @@ class TestRunnerRegistry(unittest.TestCase):
         self.assertIn(resource_s_check, resource__checks)
 
 
+    def test_get_checks_to_run(self):
+        registry = BaseCheckRegistry('')
+        resource_1_check = TestCheck("resource_1", id="CKV_T_1")
+        resource_s_check = TestCheck("resource_*", id="CKV_T_2")
+        registry.register(resource_1_check)
+        registry.register(resource_s_check)
+
+        runner_filter = RunnerFilter(skip_checks=["CKV_T_2"])
+        self.assertEqual([resource_1_check], registry.get_checks_to_run("resource_1", runner_filter, ''))
+        self.assertEqual([], registry.get_checks_to_run("resource_2", runner_filter, ''))
+
+        all_checks = registry.get_checks_to_run("resource_1", RunnerFilter(), '')
+        self.assertEqual(2, len(all_checks))
+        self.assertIn(resource_1_check, all_checks)
+        self.assertIn(resource_s_check, all_checks)
+
+        # registering a check resets the cached checks
+        resource_3_check = TestCheck("resource_1", id="CKV_T_3")
+        registry.register(resource_3_check)
+        self.assertEqual(
+            [resource_1_check, resource_3_check], registry.get_checks_to_run("resource_1", runner_filter, '')
+        )
+
+        # removing a check from the lists directly is also picked up
+        registry.checks["resource_1"].remove(resource_3_check)
+        registry.wildcard_checks["resource_*"].remove(resource_s_check)
+        self.assertEqual([resource_1_check], registry.get_checks_to_run("resource_1", RunnerFilter(), ''))
+        self.assertEqual([resource_1_check], registry.get_checks_to_run("resource_1", runner_filter, ''))
+
+    def test_get_checks_to_run_after_runner_filter_change(self):
+        registry = BaseCheckRegistry('')
+        resource_1_check = TestCheck("resource_1", id="CKV_T_1")
+        resource_2_check = TestCheck("resource_1", id="CKV_T_2")
+        registry.register(resource_1_check)
+        registry.register(resource_2_check)
+
+        runner_filter = RunnerFilter()
+        self.assertEqual([resource_1_check, resource_2_check], registry.get_checks_to_run("resource_1", runner_filter, ''))
+
+        # changing a decision attribute of the runner filter drops the cached checks
+        runner_filter.skip_checks = ["CKV_T_1"]
+        self.assertFalse(runner_filter.should_run_check(resource_1_check))
+        self.assertEqual([resource_2_check], registry.get_checks_to_run("resource_1", runner_filter, ''))
+
+        runner_filter.skip_checks = []
+        runner_filter.checks = ["CKV_T_1"]
+        self.assertEqual([resource_1_check], registry.get_checks_to_run("resource_1", runner_filter, ''))
+
+        # replacing the checks of the registry is picked up too
+        registry.checks = {"resource_1": [resource_2_check]}
+        self.assertEqual([], registry.get_checks_to_run("resource_1", runner_filter, ''))
+        registry.checks = {}
+        self.assertEqual([], registry.get_checks_to_run("resource_1", RunnerFilter(), ''))
+
+    def test_get_checks_to_run_after_check_change(self):
+        registry = BaseCheckRegistry('')
+        resource_1_check = TestCheck("resource_1", id="CKV_T_1")
+        resource_2_check = TestCheck("resource_1", id="CKV_T_2")
+        registry.register(resource_1_check)
+
+        runner_filter = RunnerFilter(checks=["HIGH"])
+        self.assertEqual([], registry.get_checks_to_run("resource_1", runner_filter, ''))
+
+        # the severity is assigned by the policy metadata after the registration
+        resource_1_check.severity = Severities[BcSeverities.HIGH]
+        self.assertEqual([resource_1_check], registry.get_checks_to_run("resource_1", runner_filter, ''))
+
+        # replacing a check in place keeps the length of the list
+        resource_2_check.severity = Severities[BcSeverities.LOW]
+        registry.checks["resource_1"][0] = resource_2_check
+        self.assertEqual([], registry.get_checks_to_run("resource_1", runner_filter, ''))
+
+    def test_get_skip_infos(self):
+        skipped_checks = [
+            {"id": "CKV_T_1", "suppress_comment": "first"},
+            {"id": "CKV_T_2", "suppress_comment": "other"},
+            {"id": "CKV_T_1", "suppress_comment": "second"},
+        ]
+
+        skip_infos = BaseCheckRegistry._get_skip_infos(skipped_checks)
+
+        self.assertEqual({"CKV_T_1", "CKV_T_2"}, set(skip_infos))
+        self.assertEqual("first", skip_infos["CKV_T_1"]["suppress_comment"])
+        self.assertEqual({}, BaseCheckRegistry._get_skip_infos(None))
+
+
 if __name__ == '__main__':
     unittest.main()
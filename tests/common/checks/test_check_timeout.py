@@ -0,0 +1,182 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+from networkx import DiGraph
+
+from checkov.common.checks import check_timeout
+from checkov.common.checks.base_check import BaseCheck
+from checkov.common.checks.check_timeout import CheckTimeouts, CheckTimeoutError
+from checkov.common.graph.checks_infra.registry import BaseRegistry
+from checkov.common.models.enums import CheckResult
+from checkov.common.util.profiler import profiler, GRAPH_CHECK, PYTHON_CHECK
+from checkov.runner_filter import RunnerFilter
+
+
+class SlowCheck(BaseCheck):
+    # for pytest not to collect this class as tests
+    __test__ = False
+
+    def __init__(self):
+        super().__init__(
+            name="Slow check", id="CKV_T_SLOW", categories=[], supported_entities=["module"], block_type="module"
+        )
+
+    def scan_entity_conf(self, conf, entity_type):
+        time.sleep(conf.get("sleep", 0))
+        return CheckResult.PASSED
+
+
+class SwallowingSlowCheck(SlowCheck):
+    # for pytest not to collect this class as tests
+    __test__ = False
+
+    def scan_entity_conf(self, conf, entity_type):
+        try:
+            return super().scan_entity_conf(conf, entity_type)
+        except Exception:
+            return CheckResult.FAILED
+
+
+@pytest.fixture
+def timeouts():
+    timeouts = CheckTimeouts()
+    with mock.patch.object(check_timeout, "check_timeouts", timeouts), \
+            mock.patch("checkov.common.checks.base_check.check_timeouts", timeouts), \
+            mock.patch("checkov.common.graph.checks_infra.registry.check_timeouts", timeouts):
+        yield timeouts
+
+
+@pytest.fixture
+def enabled_profiler():
+    profiler.enable(slowest_entities=5)
+    yield profiler
+    profiler.disable()
+    profiler.reset()
+
+
+def test_configure():
+    timeouts = CheckTimeouts()
+    assert not timeouts.enabled
+
+    timeouts.configure(["10", "CKV2_CUSTOM_1=0.5"])
+
+    assert timeouts.enabled
+    assert timeouts.get_timeout("CKV_AWS_1") == 10
+    assert timeouts.get_timeout("CKV2_CUSTOM_1") == 0.5
+
+
+@pytest.mark.parametrize("value", ["abc", "CKV_AWS_1=", "0", "CKV_AWS_1=-1"])
+def test_configure_invalid(value):
+    with pytest.raises(ValueError):
+        CheckTimeouts().configure([value])
+
+
+def test_limit(timeouts):
+    timeouts.configure(["CKV_T_SLOW=0.01"])
+
+    with pytest.raises(CheckTimeoutError):
+        with timeouts.limit("CKV_T_SLOW"):
+            time.sleep(1)
+
+    # other checks and checks finishing in time are not affected
+    with timeouts.limit("CKV_T_OTHER"):
+        time.sleep(0.03)
+    with timeouts.limit("CKV_T_SLOW"):
+        pass
+    time.sleep(0.03)
+
+
+def test_limit_with_swallowed_timeout(timeouts):
+    timeouts.configure(["CKV_T_SLOW=0.01"])
+
+    with pytest.raises(CheckTimeoutError):
+        with timeouts.limit("CKV_T_SLOW"):
+            try:
+                time.sleep(1)
+            except BaseException:
+                pass
+
+
+@pytest.mark.parametrize("check_class", [SlowCheck, SwallowingSlowCheck])
+def test_check_run_times_out(timeouts, enabled_profiler, check_class):
+    timeouts.configure(["0.01"])
+    check = check_class()
+
+    result = check.run("/main.tf", {"sleep": 1}, "example", "module", {})
+    assert result == {
+        "result": CheckResult.SKIPPED,
+        "suppress_comment": "Check CKV_T_SLOW timed out after 0.01 seconds",
+    }
+
+    result = check.run("/main.tf", {}, "example", "module", {})
+    assert result["result"] == CheckResult.PASSED
+
+    checks = enabled_profiler.to_json()["checks"]
+    assert [(check["category"], check["id"], check["timeouts"]) for check in checks] == [
+        (PYTHON_CHECK, "CKV_T_SLOW", 1)
+    ]
+
+
+def test_graph_check_times_out(timeouts, enabled_profiler):
+    timeouts.configure(["CKV2_T_SLOW=0.01"])
+
+    def create_check(check_id, sleep):
+        def run(graph_connector):
+            time.sleep(sleep)
+            return [{"id": check_id}], []
+
+        check = mock.Mock(id=check_id, run=run, resource_types=["aws_s3_bucket"])
+        check.get_evaluated_keys.return_value = []
+        return check
+
+    graph = DiGraph()
+    graph.add_node(0, resource_type="aws_s3_bucket", block_type_="resource")
+    graph.add_node(1, resource_type="aws_iam_role", block_type_="resource")
+    registry = BaseRegistry(parser=mock.Mock())
+    slow_check = create_check("CKV2_T_SLOW", 1)
+    fast_check = create_check("CKV2_T_FAST", 0)
+    registry.checks = [slow_check, fast_check]
+    runner_filter = mock.Mock(spec=RunnerFilter)
+    runner_filter.should_run_check.return_value = True
+
+    results = registry.run_checks(graph_connector=graph, runner_filter=runner_filter, report_type="terraform")
+
+    assert results[fast_check] == [{"result": CheckResult.PASSED, "entity": {"id": "CKV2_T_FAST"}, "evaluated_keys": []}]
+    assert results[slow_check] == [
+        {
+            "result": CheckResult.SKIPPED,
+            "entity": graph.nodes[0],
+            "evaluated_keys": [],
+            "suppress_comment": "Check CKV2_T_SLOW timed out after 0.01 seconds",
+        }
+    ]
+    stats = {check["id"]: check for check in enabled_profiler.to_json()["checks"]}
+    assert stats["CKV2_T_SLOW"]["category"] == GRAPH_CHECK
+    assert stats["CKV2_T_SLOW"]["timeouts"] == 1
+    assert stats["CKV2_T_FAST"]["timeouts"] == 0
+
+
+def test_graph_checks_without_budget_run_in_threads(timeouts):
+    timeouts.configure(["CKV2_T_SLOW=5"])
+    thread_names = {}
+
+    def create_check(check_id):
+        def run(graph_connector):
+            thread_names[check_id] = threading.current_thread().name
+            return [], []
+
+        check = mock.Mock(id=check_id, run=run)
+        check.get_evaluated_keys.return_value = []
+        return check
+
+    registry = BaseRegistry(parser=mock.Mock())
+    registry.checks = [create_check("CKV2_T_SLOW"), create_check("CKV2_T_OTHER")]
+    runner_filter = mock.Mock(spec=RunnerFilter)
+    runner_filter.should_run_check.return_value = True
+
+    registry.run_checks(graph_connector=DiGraph(), runner_filter=runner_filter, report_type="terraform")
+
+    assert thread_names["CKV2_T_SLOW"] == threading.main_thread().name
+    assert thread_names["CKV2_T_OTHER"] != threading.main_thread().name
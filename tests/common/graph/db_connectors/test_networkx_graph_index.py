@@ -0,0 +1,84 @@
+import networkx as nx
+
+from checkov.common.graph.db_connectors.networkx.networkx_db_connector import NetworkxConnector
+from checkov.common.graph.db_connectors.networkx.networkx_graph_index import (
+    NetworkxGraphIndex,
+    get_graph_index,
+    invalidate_graph_index,
+)
+from checkov.common.graph.graph_builder import CustomAttributes
+
+
+def _build_graph() -> nx.DiGraph:
+    graph = nx.DiGraph()
+    graph.add_nodes_from(
+        [
+            (0, {CustomAttributes.BLOCK_TYPE: "resource", CustomAttributes.RESOURCE_TYPE: "aws_s3_bucket"}),
+            (1, {CustomAttributes.BLOCK_TYPE: "variable"}),
+            (2, {CustomAttributes.BLOCK_TYPE: "resource", CustomAttributes.RESOURCE_TYPE: "aws_instance"}),
+            (3, {CustomAttributes.BLOCK_TYPE: "data", CustomAttributes.RESOURCE_TYPE: "aws_s3_bucket"}),
+            (4, {CustomAttributes.BLOCK_TYPE: "resource", CustomAttributes.RESOURCE_TYPE: ["aws_instance"]}),
+        ]
+    )
+    return graph
+
+
+def test_get_nodes():
+    # given
+    graph_index = NetworkxGraphIndex(_build_graph())
+
+    # then
+    assert graph_index.get_nodes() == [0, 1, 2, 3, 4]
+    assert graph_index.get_nodes(resource_types=["aws_s3_bucket"]) == [0, 3]
+    assert graph_index.get_nodes(resource_types=["aws_instance", "aws_s3_bucket"]) == [0, 2, 3]
+    assert graph_index.get_nodes(resource_types=[["aws_instance"]]) == [4]
+    assert graph_index.get_nodes(block_types=["resource", "variable"]) == [0, 1, 2, 4]
+    assert graph_index.get_nodes(resource_types=["aws_s3_bucket"], block_types=["resource"]) == [0]
+    assert graph_index.get_nodes(resource_types=["azurerm_key_vault"]) == []
+
+
+def test_get_vertices():
+    # given
+    graph = _build_graph()
+    graph_index = NetworkxGraphIndex(graph)
+
+    # when
+    vertices = graph_index.get_vertices(resource_types=["aws_instance"])
+
+    # then
+    assert vertices == [graph.nodes[2]]
+    assert vertices[0] is graph.nodes[2]
+
+
+def test_get_graph_index_rebuilds_after_invalidation():
+    # given
+    graph = _build_graph()
+    graph_index = get_graph_index(graph)
+
+    # then
+    assert get_graph_index(graph) is graph_index
+
+    # when
+    graph.add_node(5, **{CustomAttributes.BLOCK_TYPE: "resource", CustomAttributes.RESOURCE_TYPE: "aws_s3_bucket"})
+    invalidate_graph_index(graph)
+
+    # then
+    new_graph_index = get_graph_index(graph)
+    assert new_graph_index is not graph_index
+    assert new_graph_index.get_nodes(resource_types=["aws_s3_bucket"]) == [0, 3, 5]
+
+
+def test_writer_endpoint_invalidates_graph_index():
+    # given
+    db_connector = NetworkxConnector()
+    db_connector.graph = _build_graph()
+    get_graph_index(db_connector.graph)
+
+    # when
+    graph = db_connector.get_writer_endpoint()
+    graph.nodes[0][CustomAttributes.RESOURCE_TYPE] = "aws_instance"
+
+    # then
+    graph_index = get_graph_index(graph)
+    assert graph_index.get_nodes(resource_types=["aws_s3_bucket"]) == [3]
+    assert graph_index.get_nodes(resource_types=["aws_instance"]) == [0, 2]
@@ -0,0 +1,134 @@
+import pytest
+from networkx import DiGraph
+
+from checkov.common.checks_infra.solvers.attribute_solvers.base_attribute_solver import BaseAttributeSolver
+from checkov.common.graph.checks_infra.solvers.vertex_keys_index import (
+    VertexKeysIndex,
+    get_vertex_keys_index,
+    invalidate_vertex_keys_index,
+    normalize_key,
+)
+from checkov.common.graph.db_connectors.networkx.networkx_graph_index import get_graph_index
+
+VERTEX = {
+    "resource_type": "aws_security_group",
+    "ingress": [{"cidr_blocks": ["0.0.0.0/0"]}, {"cidr_blocks": ["10.0.0.0/8"]}],
+    "ingress.0": {"cidr_blocks": ["0.0.0.0/0"]},
+    "ingress.0.cidr_blocks": ["0.0.0.0/0"],
+    "ingress.0.cidr_blocks.0": "0.0.0.0/0",
+    "ingress.1.cidr_blocks": ["10.0.0.0/8"],
+    "ingress.cidr_blocks": ["0.0.0.0/0"],
+    "egress.0.cidr_blocks": ["0.0.0.0/0"],
+    "tags.*.name": "wildcard",
+}
+
+
+def test_normalize_key():
+    assert normalize_key("ingress.0.cidr_blocks.12") == "ingress.*.cidr_blocks.*"
+    assert normalize_key("name") == "name"
+
+
+def test_get_keys():
+    # given
+    vertex_keys_index = VertexKeysIndex(VERTEX)
+
+    # then
+    assert vertex_keys_index.get_keys(["ingress.*.cidr_blocks", "ingress.cidr_blocks"]) == [
+        "ingress.0.cidr_blocks",
+        "ingress.1.cidr_blocks",
+        "ingress.cidr_blocks",
+    ]
+    assert vertex_keys_index.get_keys(["tags.*.name"]) == []
+
+
+def test_get_vertex_keys_index_rebuilds_after_invalidation():
+    # given
+    graph = DiGraph()
+    graph.add_node(0, **VERTEX)
+    vertex = graph.nodes[0]
+    graph_index = get_graph_index(graph)
+    vertex_keys_index = get_vertex_keys_index(vertex, graph_index)
+
+    # then
+    assert get_vertex_keys_index(vertex, graph_index) is vertex_keys_index
+    assert graph_index.vertex_keys_indexes == {id(vertex): vertex_keys_index}
+
+    # when
+    del vertex["ingress.1.cidr_blocks"]
+    vertex["ingress.2.cidr_blocks"] = []
+    invalidate_vertex_keys_index(vertex)
+
+    # then
+    assert get_vertex_keys_index(vertex, graph_index).get_keys(["ingress.*.cidr_blocks"]) == [
+        "ingress.0.cidr_blocks",
+        "ingress.2.cidr_blocks",
+    ]
+
+
+def test_invalidate_vertex_keys_index_of_subgraph_view():
+    # given
+    graph = DiGraph()
+    graph.add_node(0, **VERTEX)
+    vertex = graph.nodes[0]
+    graph_index = get_graph_index(graph)
+    subgraph = graph.subgraph([0])
+    subgraph_index = get_graph_index(subgraph)
+    get_vertex_keys_index(vertex, graph_index)
+    get_vertex_keys_index(vertex, subgraph_index)
+
+    # when
+    invalidate_vertex_keys_index(vertex)
+
+    # then
+    assert graph_index.vertex_keys_indexes == {}
+    assert subgraph_index.vertex_keys_indexes == {}
+
+
+def test_get_vertex_keys_index_without_graph_index():
+    # given
+    graph = DiGraph()
+    graph.add_node(0, **VERTEX)
+    graph_index = get_graph_index(graph)
+    vertex = dict(VERTEX)
+
+    # then
+    assert get_vertex_keys_index(vertex) is not get_vertex_keys_index(vertex)
+    assert get_vertex_keys_index(vertex, graph_index) is not get_vertex_keys_index(vertex, graph_index)
+    assert graph_index.vertex_keys_indexes == {}
+
+
+def test_attribute_solver_shares_vertex_keys_index():
+    # given
+    graph = DiGraph()
+    graph.add_node(0, **VERTEX, block_type_="resource")
+    solver = BaseAttributeSolver(resource_types=["aws_security_group"], attribute="ingress.*.cidr_blocks", value=None)
+    solver._get_operation = lambda vertex, attribute: True
+
+    # when
+    solver.run(graph)
+
+    # then
+    assert list(get_graph_index(graph).vertex_keys_indexes) == [id(graph.nodes[0])]
+
+
+@pytest.mark.parametrize(
+    "attribute",
+    [
+        "ingress.*.cidr_blocks",
+        "ingress.*.cidr_blocks.*",
+        "*.*.cidr_blocks",
+        "ingress.*",
+        "tags.*.name",
+        "ingress.[0-9].cidr_blocks",
+    ],
+)
+def test_get_attribute_matches_equals_pattern_matching(attribute):
+    # given
+    solver = BaseAttributeSolver(resource_types=["aws_security_group"], attribute=attribute, value=None)
+    attribute_patterns = BaseAttributeSolver.get_attribute_patterns(attribute)
+
+    # when
+    attribute_matches = solver.get_attribute_matches(VERTEX)
+
+    # then
+    assert attribute_matches == [key for key in VERTEX if any(pattern.match(key) for pattern in attribute_patterns)]
@@ -0,0 +1,59 @@
+import concurrent.futures
+from unittest import mock
+
+import pytest
+
+from checkov.common.graph.checks_infra.solvers.vertices_evaluator import (
+    VerticesEvaluator,
+    PROCESS_BACKEND,
+    SERIAL_BACKEND,
+)
+
+
+def _predicate(vertex):
+    if vertex["resource_type"] != "aws_s3_bucket":
+        return None
+    return vertex["index"] % 2 == 0
+
+
+@pytest.mark.parametrize("backend", [SERIAL_BACKEND, PROCESS_BACKEND])
+def test_evaluate(backend):
+    # given
+    vertices = [
+        {"resource_type": "aws_instance" if index % 3 == 0 else "aws_s3_bucket", "index": index} for index in range(25)
+    ]
+    evaluator = VerticesEvaluator(backend=backend, batch_size=4, process_min_vertices=1)
+
+    # when
+    passed, failed = evaluator.evaluate(_predicate, vertices)
+
+    # then
+    assert [vertex["index"] for vertex in passed] == [2, 4, 8, 10, 14, 16, 20, 22]
+    assert [vertex["index"] for vertex in failed] == [1, 5, 7, 11, 13, 17, 19, 23]
+    # the original vertices are returned, even if they were evaluated in another process
+    assert passed[0] is vertices[2]
+    assert failed[0] is vertices[1]
+
+
+def test_evaluate_empty():
+    assert VerticesEvaluator(backend=PROCESS_BACKEND, process_min_vertices=1).evaluate(_predicate, []) == ([], [])
+
+
+def test_unsupported_backend():
+    assert VerticesEvaluator(backend="gpu").backend == SERIAL_BACKEND
+
+
+def test_process_backend_is_not_used_in_threads():
+    # given
+    vertices = [{"resource_type": "aws_s3_bucket", "index": index} for index in range(10)]
+    evaluator = VerticesEvaluator(backend=PROCESS_BACKEND, batch_size=4, process_min_vertices=1)
+
+    # when
+    with mock.patch.object(evaluator, "_evaluate_multiprocess") as evaluate_multiprocess:
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            passed, failed = executor.submit(evaluator.evaluate, _predicate, vertices).result()
+
+    # then
+    evaluate_multiprocess.assert_not_called()
+    assert [vertex["index"] for vertex in passed] == [0, 2, 4, 6, 8]
+    assert [vertex["index"] for vertex in failed] == [1, 3, 5, 7, 9]
@@ -480,5 +480,74 @@ class TestSuppressionsIntegration(unittest.TestCase):
         self.assertEqual(len(report.skipped_checks), 2)
 
 
+    def test_apply_indexed_suppressions_to_report(self):
+        instance = BcPlatformIntegration()
+        instance.repo_id = 'org/repo'
+
+        suppressions_integration = SuppressionsIntegration(instance)
+        suppressions_integration.suppressions = {
+            'CKV_AWS_18': [
+                {
+                    "suppressionType": "Accounts",
+                    "policyId": "BC_AWS_S3_13",
+                    "comment": "other repo",
+                    "accountIds": ["bcorg_other/repo"],
+                    "checkovPolicyId": "CKV_AWS_18",
+                },
+                {
+                    "suppressionType": "Tags",
+                    "policyId": "BC_AWS_S3_13",
+                    "comment": "tag",
+                    "tags": [{"key": "env", "value": "dev"}],
+                    "checkovPolicyId": "CKV_AWS_18",
+                },
+                {
+                    "suppressionType": "Resources",
+                    "policyId": "BC_AWS_S3_13",
+                    "comment": "resource",
+                    "resources": [
+                        {"accountId": "bcorg_org/repo", "resourceId": "/s3.tf:aws_s3_bucket.operations"},
+                        {"accountId": "bcorg_other/repo", "resourceId": "/s3.tf:aws_s3_bucket.other"},
+                    ],
+                    "checkovPolicyId": "CKV_AWS_18",
+                },
+            ]
+        }
+
+        def create_record(resource, result, entity_tags=None):
+            record = Record(check_id='CKV_AWS_18', check_name=None, check_result={'result': result},
+                            code_block=None, file_path=None,
+                            file_line_range=None,
+                            resource=resource, evaluations=None,
+                            check_class=None, file_abs_path='.', entity_tags=entity_tags)
+            record.repo_file_path = '/s3.tf'
+            return record
+
+        report = Report('terraform')
+        # the tag suppression comes before the resource suppression
+        report.add_record(create_record('aws_s3_bucket.operations', CheckResult.FAILED, {'env': 'dev', 'list': ['a']}))
+        report.add_record(create_record('aws_s3_bucket.operations', CheckResult.PASSED, {'env': 'prod'}))
+        report.add_record(create_record('aws_s3_bucket.other', CheckResult.FAILED))
+        report.add_record(create_record('aws_s3_bucket.no', CheckResult.PASSED, {'env': 'dev'}))
+
+        suppressions_integration._apply_suppressions_to_report(report)
+
+        self.assertEqual([record.resource for record in report.failed_checks], ['aws_s3_bucket.other'])
+        self.assertEqual(report.passed_checks, [])
+        self.assertEqual(
+            [(record.resource, record.check_result['suppress_comment']) for record in report.skipped_checks],
+            [
+                ('aws_s3_bucket.operations', 'tag'),
+                ('aws_s3_bucket.operations', 'resource'),
+                ('aws_s3_bucket.no', 'tag'),
+            ]
+        )
+        for record in report.skipped_checks:
+            self.assertEqual(
+                suppressions_integration._find_suppression(record),
+                suppressions_integration._check_suppressions(record, suppressions_integration.suppressions['CKV_AWS_18'])
+            )
+
+
 if __name__ == '__main__':
     unittest.main()
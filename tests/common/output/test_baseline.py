@@ -1,6 +1,8 @@
 import argparse
 from pathlib import Path
 
+import pytest
+
 from checkov.common.output.baseline import Baseline
 from checkov.runner_filter import RunnerFilter
 from checkov.terraform.runner import Runner
@@ -45,3 +47,33 @@ def test_to_dict():
             },
         ]
     }
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_write_and_compare(tmp_path, compact):
+    # given
+    test_folder = Path(__file__).parent / "fixtures"
+    checks = ["CKV_AWS_18", "CKV_AWS_19", "CKV_AWS_21", "CKV2_AWS_6"]  # 1 pass, 2 fail, 1 skip
+    report = Runner().run(root_folder=str(test_folder), runner_filter=RunnerFilter(checks=checks))
+
+    created_baseline = Baseline()
+    created_baseline.add_findings_from_report(report)
+    baseline_path = tmp_path / ".checkov.baseline"
+    created_baseline.write(str(baseline_path), compact=compact)
+
+    # when
+    baseline = Baseline(output_skipped=True)
+    baseline.from_json(str(baseline_path))
+    report = Runner().run(root_folder=str(test_folder), runner_filter=RunnerFilter(checks=checks))
+    failed_count = len(report.failed_checks)
+    baseline.compare_and_reduce_reports([report])
+
+    # then
+    assert baseline.failed_checks == created_baseline.to_dict()["failed_checks"]
+    assert ("aws_s3_bucket.destination", "CKV_AWS_18") in baseline.findings_index
+    assert baseline_path.read_bytes().startswith(b"\x1f\x8b") is compact
+    assert report.failed_checks == []
+    baseline_skipped = [
+        check for check in report.skipped_checks if check.check_result["suppress_comment"] == "baseline-skipped"
+    ]
+    assert len(baseline_skipped) == failed_count
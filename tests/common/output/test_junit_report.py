@@ -1,4 +1,5 @@
 import argparse
+import io
 import unittest
 import xml
 import xml.etree.ElementTree as ET
@@ -105,6 +106,26 @@ class TestJunitReport(unittest.TestCase):
             ).toprettyxml()
         )
 
+    def test_write_junit_xml_with_terraform(self):
+        # given
+        test_file = Path(__file__).parent / "fixtures/main.tf"
+        config = argparse.Namespace(file="fixtures/main.tf", framework=["terraform"])
+        report = TerrafomrRunner().run(root_folder="", files=[str(test_file)])
+
+        properties = Report.create_test_suite_properties_block(config=config)
+        test_suites = [
+            report.get_test_suite(properties=properties),
+            Report("empty").get_test_suite(properties=properties),
+            Report("empty").get_test_suite(),
+        ]
+
+        # when
+        output = io.StringIO()
+        Report.write_junit_xml(output, test_suites)
+
+        # then
+        assert output.getvalue() == Report.get_junit_xml_string(test_suites)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,85 @@
+import pytest
+
+from checkov.common.models.enums import CheckResult
+from checkov.common.output.record import Record
+from checkov.common.output.report import Report, remove_duplicate_results
+
+
+def create_record(check_id: str, result: CheckResult, resource: str = "aws_s3_bucket.example") -> Record:
+    return Record(
+        check_id=check_id,
+        check_name="Some Check",
+        check_result={"result": result},
+        code_block=[],
+        file_path="/main.tf",
+        file_line_range=[1, 3],
+        resource=resource,
+        evaluations=None,
+        check_class="",
+        file_abs_path="/path/to/main.tf",
+        resource_address=resource,
+    )
+
+
+@pytest.fixture
+def report() -> Report:
+    report = Report("terraform")
+    report.add_record(create_record("CKV_AWS_1", CheckResult.PASSED))
+    report.add_record(create_record("CKV_AWS_2", CheckResult.FAILED))
+    report.add_record(create_record("CKV_AWS_3", CheckResult.FAILED))
+    report.add_record(create_record("CKV_AWS_4", CheckResult.SKIPPED))
+    return report
+
+
+def test_remove_duplicate_results(report):
+    report.add_record(create_record("CKV_AWS_1", CheckResult.PASSED))
+    report.add_record(create_record("CKV_AWS_2", CheckResult.FAILED))
+    report.add_record(create_record("CKV_AWS_2", CheckResult.FAILED, resource="aws_s3_bucket.other"))
+
+    report = remove_duplicate_results(report)
+
+    assert [record.check_id for record in report.passed_checks] == ["CKV_AWS_1"]
+    assert [(record.check_id, record.resource) for record in report.failed_checks] == [
+        ("CKV_AWS_2", "aws_s3_bucket.example"),
+        ("CKV_AWS_3", "aws_s3_bucket.example"),
+        ("CKV_AWS_2", "aws_s3_bucket.other"),
+    ]
+
+
+def test_remove_records(report):
+    # records are removed by identity and not by their content
+    report.remove_records([report.failed_checks[1], report.skipped_checks[0], create_record("CKV_AWS_1", CheckResult.PASSED)])
+
+    assert [record.check_id for record in report.passed_checks] == ["CKV_AWS_1"]
+    assert [record.check_id for record in report.failed_checks] == ["CKV_AWS_2"]
+    assert report.skipped_checks == []
+
+
+def test_move_records(report):
+    failed_record = report.failed_checks[0]
+    passed_record = report.passed_checks[0]
+
+    report.move_records([failed_record, passed_record, failed_record], CheckResult.SKIPPED)
+
+    assert report.passed_checks == []
+    assert [record.check_id for record in report.failed_checks] == ["CKV_AWS_3"]
+    assert [record.check_id for record in report.skipped_checks] == ["CKV_AWS_4", "CKV_AWS_2", "CKV_AWS_1"]
+    assert failed_record.check_result["result"] == CheckResult.SKIPPED
+
+
+def test_handle_skipped_checks(report):
+    module_record = create_record("CKV_AWS_5", CheckResult.FAILED, resource="module.s3.aws_s3_bucket.example")
+    report.add_record(module_record)
+    enriched_resources = {
+        "aws_s3_bucket.example": {"skipped_checks": [{"id": "CKV_AWS_2", "suppress_comment": "resource skip"}]},
+        "module.s3": {"skipped_checks": [{"id": "CKV_AWS_5", "suppress_comment": "module skip"}]},
+    }
+
+    report = Report.handle_skipped_checks(report, enriched_resources)
+
+    assert [record.check_id for record in report.failed_checks] == ["CKV_AWS_3"]
+    assert [(record.check_id, record.check_result.get("suppress_comment")) for record in report.skipped_checks] == [
+        ("CKV_AWS_4", None),
+        ("CKV_AWS_2", "resource skip"),
+        ("CKV_AWS_5", "module skip"),
+    ]
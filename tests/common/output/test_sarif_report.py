@@ -1,3 +1,4 @@
+import io
 import unittest
 import json
 import jsonschema
@@ -194,6 +195,44 @@ class TestSarifReport(unittest.TestCase):
         self.assertFalse(are_duplicates_in_sarif_rules(json_structure))
         self.assertTrue(are_rule_indexes_correct_in_results(json_structure))
 
+    def test_write_sarif(self):
+        record1 = Record(
+            check_id="CKV_AWS_21",
+            check_name="Some Check",
+            check_result={"result": CheckResult.FAILED},
+            code_block=None,
+            file_path="./s3.tf",
+            file_line_range=[0, 0],
+            resource="aws_s3_bucket.operations",
+            evaluations=None,
+            check_class=None,
+            file_abs_path=",.",
+            entity_tags={"tag1": "value1"},
+        )
+        record2 = Record(
+            check_id="CKV_AWS_21",
+            check_name="Some Check",
+            check_result={"result": CheckResult.SKIPPED, "suppress_comment": "not needed"},
+            code_block=None,
+            file_path="./ec2.tf",
+            file_line_range=[22, 25],
+            resource="aws_s3_bucket.web_host_storage",
+            evaluations=None,
+            check_class=None,
+            file_abs_path=",.",
+            entity_tags={"tag1": "value1"},
+        )
+
+        r = Report("terraform")
+        r.add_record(record=record1)
+        r.add_record(record=record2)
+
+        output = io.StringIO()
+        r.write_sarif(output, "checkov")
+
+        self.assertEqual(output.getvalue(), json.dumps(r.get_sarif_json("checkov")))
+        self.assertEqual(len(json.loads(output.getvalue())["runs"][0]["results"]), 2)
+
 
 def get_sarif_schema():
     file_name, headers = urllib.request.urlretrieve(
@@ -0,0 +1,80 @@
+import os
+import time
+
+from checkov.common.parallelizer.parallel_runner import ParallelRunner
+
+
+def test_run_function_multiprocess_keeps_order():
+    runner = ParallelRunner(workers_number=3, results_batch_size=4)
+
+    results = list(runner.run_function(lambda x: x * 2, list(range(50)), run_multiprocess=True))
+
+    assert results == [x * 2 for x in range(50)]
+
+
+def test_run_function_multiprocess_with_group_size():
+    runner = ParallelRunner(workers_number=2)
+
+    results = list(runner.run_function(lambda x: (x, os.getpid()), ["a", "b", "c"], group_size=1, run_multiprocess=True))
+
+    assert [item for item, _ in results] == ["a", "b", "c"]
+    assert len({pid for _, pid in results}) == 3
+
+
+def test_run_function_multiprocess_limits_workers():
+    runner = ParallelRunner(workers_number=2)
+
+    def run(x):
+        start = time.monotonic()
+        time.sleep(0.2)
+        return start, time.monotonic()
+
+    intervals = list(runner.run_function(run, list(range(6)), group_size=1, run_multiprocess=True))
+
+    # never more than 2 workers run at the same time, even with 6 groups
+    for start, _ in intervals:
+        assert sum(1 for other_start, other_end in intervals if other_start <= start < other_end) <= 2
+
+
+def test_run_function_multiprocess_does_not_wait_for_slow_group():
+    runner = ParallelRunner(workers_number=2)
+
+    def run(x):
+        start = time.monotonic()
+        time.sleep(0.5 if x == 0 else 0.01)
+        return x, start, time.monotonic()
+
+    results = list(runner.run_function(run, list(range(6)), group_size=1, run_multiprocess=True))
+
+    # the other groups run in the free slot, while the first one is still running
+    assert [x for x, _, _ in results] == list(range(6))
+    _, _, slow_end = results[0]
+    assert all(start < slow_end for _, start, _ in results[1:])
+
+
+def test_run_function_multiprocess_keeps_results_before_failure(caplog):
+    runner = ParallelRunner(workers_number=1, results_batch_size=10)
+
+    def run(x):
+        if x == 3:
+            raise ValueError("item failed")
+        return x
+
+    assert list(runner.run_function(run, list(range(6)), run_multiprocess=True)) == [0, 1, 2]
+    assert "ValueError: item failed" in caplog.text
+
+
+def test_run_function_multiprocess_empty_items():
+    runner = ParallelRunner(workers_number=2)
+
+    assert list(runner.run_function(lambda x: x, [], run_multiprocess=True)) == []
+
+
+def test_run_function_multiprocess_stops_early():
+    runner = ParallelRunner(workers_number=2, results_batch_size=1)
+
+    results = runner.run_function(lambda x: x, list(range(1000)), run_multiprocess=True)
+
+    assert next(results) == 0
+    # closing the generator shouldn't hang and should clean up the worker processes
+    results.close()
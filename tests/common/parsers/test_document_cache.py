@@ -0,0 +1,82 @@
+import os
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from yaml import YAMLError
+
+from checkov.common.parsers import document_cache
+from checkov.common.parsers.document_cache import load_document, shared_document_cache
+from checkov.common.parsers.yaml import loader
+from checkov.common.parsers.yaml.parser import parse
+
+
+class TestDocumentCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "example.yaml")
+        Path(self.file_path).write_text("a: 1\nb:\n  - c\n")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_load_document_without_cache(self):
+        load = mock.Mock(side_effect=loader.load)
+
+        load_document("yaml", self.file_path, load)
+        load_document("yaml", self.file_path, load)
+
+        self.assertEqual(load.call_count, 2)
+
+    def test_load_document_loads_once(self):
+        load = mock.Mock(side_effect=loader.load)
+
+        with shared_document_cache() as cache_dir:
+            self.assertIsNotNone(cache_dir)
+            first = load_document("yaml", self.file_path, load)
+            second = load_document("yaml", self.file_path, load)
+
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(first, second)
+        # each call returns an own copy, which can be modified
+        self.assertIsNot(first[0], second[0])
+        self.assertFalse(os.path.exists(cache_dir))
+        self.assertIsNone(document_cache._cache_dir)
+
+    def test_load_document_per_loader_and_version(self):
+        load = mock.Mock(side_effect=loader.load)
+
+        with shared_document_cache():
+            load_document("yaml", self.file_path, load)
+            load_document("other", self.file_path, load)
+            self.assertEqual(load.call_count, 2)
+
+            Path(self.file_path).write_text("a: 2\n")
+            template, _ = load_document("yaml", self.file_path, load)
+
+        self.assertEqual(load.call_count, 3)
+        self.assertEqual(template[0]["a"], 2)
+
+    def test_load_document_error_is_cached(self):
+        load = mock.Mock(side_effect=YAMLError("invalid"))
+
+        with shared_document_cache():
+            for _ in range(2):
+                with self.assertRaises(YAMLError):
+                    load_document("yaml", self.file_path, load)
+
+        self.assertEqual(load.call_count, 1)
+
+    def test_yaml_parse_uses_cache(self):
+        with shared_document_cache():
+            with mock.patch.object(loader, "load", side_effect=loader.load) as load:
+                expected = parse(self.file_path)
+                result = parse(self.file_path)
+
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(expected, result)
+
+
+if __name__ == '__main__':
+    unittest.main()
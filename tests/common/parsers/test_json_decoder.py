@@ -0,0 +1,78 @@
+import json
+import pickle
+import unittest
+from copy import deepcopy
+
+from checkov.common.parsers.json.decoder import Decoder, FastDecoder, Mark, decode
+from checkov.common.parsers.json.errors import DecodeError
+from checkov.common.parsers.node import DictNode, ListNode, StrNode
+
+DOCUMENT = """{
+  "Resources": {
+    "Bucket": {"Type": "AWS::S3::Bucket", "Properties": {"Tags": [{"Key": "a", "Value": "b"}, []]}},
+    "Empty": {}
+  },
+  "Escaped \\" key": ["{[", 1.5, null, true]
+}
+"""
+
+
+def _get_marks(obj):
+    marks = []
+    if hasattr(obj, "start_mark"):
+        marks.append((obj.start_mark.line, obj.start_mark.column, obj.end_mark.line, obj.end_mark.column))
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            marks.extend(_get_marks(key))
+            marks.extend(_get_marks(value))
+    elif isinstance(obj, list):
+        for value in obj:
+            marks.extend(_get_marks(value))
+    return marks
+
+
+class TestFastDecoder(unittest.TestCase):
+    def test_decode_same_as_decoder(self):
+        expected = json.loads(DOCUMENT, cls=Decoder)
+
+        result = FastDecoder().decode(DOCUMENT)
+
+        self.assertEqual(expected, result)
+        self.assertIsInstance(result, DictNode)
+        self.assertIsInstance(next(iter(result)), StrNode)
+        self.assertIsInstance(result["Escaped \" key"], ListNode)
+        self.assertEqual(_get_marks(expected), _get_marks(result))
+
+    def test_decode_falls_back_to_decoder_errors(self):
+        with self.assertRaises(DecodeError) as duplicate_error:
+            decode('{"a": 1, "a": 2}')
+        self.assertIn('Duplicate found', str(duplicate_error.exception))
+
+        with self.assertRaises(DecodeError) as null_error:
+            decode('{"a": null}', allow_nulls=False)
+        self.assertIn('Null Error', str(null_error.exception))
+
+        with self.assertRaises(ValueError):
+            decode('{"a": }')
+
+    def test_node_marks_survive_pickle_and_deepcopy(self):
+        expected_mark = json.loads(DOCUMENT, cls=Decoder)["Resources"].start_mark
+        result = decode(DOCUMENT)
+
+        for node in (pickle.loads(pickle.dumps(result))["Resources"], deepcopy(result)["Resources"]):
+            mark = node.start_mark
+            self.assertIs(type(mark), Mark)
+            self.assertEqual((expected_mark.line, expected_mark.column), (mark.line, mark.column))
+
+    def test_nodes_share_line_index(self):
+        result = decode(DOCUMENT)
+        resources = result["Resources"]
+
+        # the nodes only keep offsets, the marks are created on access
+        self.assertIsInstance(resources._start_mark, int)
+        self.assertIs(resources._line_index, result._line_index)
+        self.assertIs(deepcopy(resources)._line_index, result._line_index)
+
+
+if __name__ == '__main__':
+    unittest.main()
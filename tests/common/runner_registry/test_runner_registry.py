@@ -91,6 +91,7 @@ class TestRunnerRegistry(unittest.TestCase):
         config = argparse.Namespace(
             file=['./example_s3_tf/main.tf'],
             compact=True,
+            compact_json=True,
             output=['json'],
             quiet=False,
             soft_fail=False,
@@ -107,6 +108,8 @@ class TestRunnerRegistry(unittest.TestCase):
 
         assert 'code_block' not in output
         assert 'connected_node' not in output
+        # compact JSON is printed without indentation
+        assert '\n    "' not in output
 
     def test_compact_csv_output(self):
         test_files_dir = os.path.dirname(os.path.realpath(__file__)) + "/example_s3_tf"
@@ -218,6 +221,7 @@ def test_non_compact_json_output(capsys):
     config = argparse.Namespace(
         file=['./example_s3_tf/main.tf'],
         compact=False,
+        compact_json=False,
         output=['json'],
         quiet=False,
         soft_fail=False,
@@ -234,6 +238,7 @@ def test_non_compact_json_output(capsys):
     captured = capsys.readouterr()
 
     assert 'code_block' in captured.out
+    assert '\n    "' in captured.out
 
 
 if __name__ == "__main__":
@@ -0,0 +1,121 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from checkov.common.runners.base_runner import filter_ignored_paths
+from checkov.common.runners import file_index
+from checkov.common.runners.file_index import FileIndex, find_files, shared_file_index, walk_directory
+
+
+@pytest.fixture
+def root_folder(tmp_path: Path) -> str:
+    for file_path in (
+        "main.tf",
+        "template.yaml",
+        "dir1/Chart.yaml",
+        "dir1/values.yaml",
+        "dir1/dir2/file.json",
+        "dir3/file.tf",
+        ".github/workflows/build.yml",
+        ".circleci/config.yml",
+        ".gitlab-ci.yml",
+        "node_modules/package/index.json",
+    ):
+        path = tmp_path / file_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+
+    return str(tmp_path)
+
+
+def _walk(root_folder, excluded_paths, included_paths=None):
+    result = []
+    for root, d_names, f_names in os.walk(root_folder):
+        filter_ignored_paths(root, d_names, excluded_paths, included_paths)
+        filter_ignored_paths(root, f_names, excluded_paths, included_paths)
+        result.append((root, sorted(d_names), sorted(f_names)))
+    return result
+
+
+@pytest.mark.parametrize(
+    "excluded_paths,included_paths",
+    [
+        (["dir3"], []),
+        (["dir3"], [".circleci"]),
+        (["dir3", "dir2"], [".github"]),
+        (["dir3"], [".github", ".circleci", ".gitlab-ci.yml"]),
+    ],
+)
+def test_walk_same_as_os_walk(root_folder, excluded_paths, included_paths):
+    index = FileIndex(root_folder, ["dir3"], [".github", ".circleci", ".gitlab-ci.yml"])
+
+    result = [(root, sorted(d_names), sorted(f_names)) for root, d_names, f_names in index.walk(excluded_paths, included_paths)]
+
+    assert sorted(result) == sorted(_walk(root_folder, excluded_paths, included_paths))
+
+
+def test_walk_can_be_pruned(root_folder):
+    index = FileIndex(root_folder)
+
+    roots = []
+    for root, d_names, _ in index.walk():
+        roots.append(os.path.relpath(root, root_folder))
+        if "dir2" in d_names:
+            d_names.remove("dir2")
+
+    assert sorted(roots) == [".", "dir1", "dir3"]
+
+
+def test_find_files(root_folder):
+    index = FileIndex(root_folder, ["dir3"], [".github", ".gitlab-ci.yml"])
+
+    def relative(files):
+        return sorted(os.path.relpath(file, root_folder) for file in files)
+
+    assert relative(index.find_files(file_extensions=[".tf", ".json"])) == ["dir1/dir2/file.json", "main.tf"]
+    assert relative(index.find_files(file_names=["Chart.yaml"], file_extensions=[".json"])) == [
+        "dir1/Chart.yaml",
+        "dir1/dir2/file.json",
+    ]
+    assert relative(index.find_files(file_extensions=[".yml"])) == []
+    assert relative(index.find_files(file_extensions=[".yml"], included_paths=[".github", ".gitlab-ci.yml"])) == [
+        ".github/workflows/build.yml",
+        ".gitlab-ci.yml",
+    ]
+    assert relative(index.find_files(excluded_paths=["dir3", "dir2"])) == [
+        "dir1/Chart.yaml",
+        "dir1/values.yaml",
+        "main.tf",
+        "template.yaml",
+    ]
+
+
+def test_find_files_keeps_walk_order(root_folder):
+    index = FileIndex(root_folder)
+
+    expected = [
+        os.path.join(root, f_name)
+        for root, _, f_names in walk_directory(root_folder, None)
+        for f_name in f_names
+        if f_name.endswith((".yaml", ".json"))
+    ]
+
+    assert index.find_files(file_extensions=[".json", ".yaml"]) == expected
+
+
+def test_shared_file_index(root_folder, mocker):
+    with shared_file_index(root_folder, ["dir3"], [".github"]) as index:
+        assert file_index._shared_file_index is index
+
+        os_walk = mocker.spy(file_index.os, "walk")
+        assert find_files(root_folder, ["dir3"], file_extensions=[".yml"], included_paths=[".github"])
+        list(walk_directory(root_folder, ["dir3", "dir2"]))
+        os_walk.assert_not_called()
+
+        # the index doesn't apply to other folders or paths, which it doesn't include
+        list(walk_directory(root_folder, None))
+        find_files(root_folder, ["dir3"], included_paths=[".circleci"])
+        assert os_walk.call_count == 2
+
+    assert file_index._shared_file_index is None
@@ -637,5 +637,40 @@ class TestRunnerFilter(unittest.TestCase):
         self.assertFalse(instance.should_run_check(check_id='CKV_AWS_123', severity=Severities[BcSeverities.LOW], report_type=CheckType.SCA_IMAGE))
 
 
+    def test_should_run_check_decision_cache(self):
+        instance = RunnerFilter(checks=['CKV_AWS_1'])
+
+        self.assertTrue(instance.should_run_check(check_id='CKV_AWS_1'))
+        self.assertTrue(instance.should_run_check(check_id='CKV_AWS_1'))
+        self.assertFalse(instance.should_run_check(check_id='CKV_AWS_2'))
+        self.assertEqual({"hits": 1, "misses": 2, "size": 2}, instance.get_decision_cache_info())
+
+        # changing the filter config invalidates the cached decisions
+        instance.skip_checks = ['CKV_AWS_1']
+        self.assertFalse(instance.should_run_check(check_id='CKV_AWS_1'))
+        instance.filtered_policy_ids = ['CKV_AWS_3']
+        self.assertEqual(0, instance.get_decision_cache_info()["size"])
+
+    def test_should_run_check_decision_cache_external_check(self):
+        instance = RunnerFilter(checks=['CKV_AWS_1'], all_external=True)
+        self.assertFalse(instance.should_run_check(check_id='EXT_CHECK_CACHE_1'))
+
+        instance.notify_external_check('EXT_CHECK_CACHE_1')
+        self.assertTrue(instance.should_run_check(check_id='EXT_CHECK_CACHE_1'))
+
+    def test_should_run_check_decision_cache_enforcement_rules(self):
+        instance = RunnerFilter(include_all_checkov_policies=True, use_enforcement_rules=True)
+        instance.enforcement_rule_configs = {CheckType.TERRAFORM: Severities[BcSeverities.LOW]}
+        self.assertTrue(instance.should_run_check(check_id='CKV_AWS_789', severity=Severities[BcSeverities.MEDIUM], report_type=CheckType.TERRAFORM))
+
+        enforcement_rule_configs = {
+            category: CodeCategoryConfiguration(category, Severities[BcSeverities.HIGH], Severities[BcSeverities.HIGH])
+            for category in (CodeCategoryType.IAC, CodeCategoryType.SUPPLY_CHAIN, CodeCategoryType.OPEN_SOURCE,
+                             CodeCategoryType.IMAGES, CodeCategoryType.SECRETS)
+        }
+        instance.apply_enforcement_rules(enforcement_rule_configs)
+        self.assertFalse(instance.should_run_check(check_id='CKV_AWS_789', severity=Severities[BcSeverities.MEDIUM], report_type=CheckType.TERRAFORM))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,11 +1,12 @@
+import io
 import json
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 import pytest
 from lark import Tree
 
-from checkov.common.util.json_utils import CustomJSONEncoder
+from checkov.common.util.json_utils import CustomJSONEncoder, stream_json
 
 
 @pytest.mark.parametrize(
@@ -24,3 +25,36 @@ def test_custom_json_encoder(input_dict: Dict[str, Any]):
     # then
     # this assertion should never fail, but json.dumps() could
     assert isinstance(result, str)
+
+
+@pytest.mark.parametrize(
+    "input_obj",
+    [
+        ({"key": [1, "value", None, {"nested": {"v", "val"}}], "empty_dict": {}, "empty_list": []}),
+        ([{"key": datetime.now()}, [[]], "value"]),
+        ({1: True, None: 1.5, "key": ("value",)}),
+        ("value"),
+    ],
+    ids=["dict", "list", "non_str_keys", "str"],
+)
+@pytest.mark.parametrize("indent", [None, 0, 4])
+def test_stream_json(input_obj: Any, indent: Optional[int]):
+    # when
+    output = io.StringIO()
+    stream_json(input_obj, output, indent=indent)
+
+    # then
+    assert output.getvalue() == json.dumps(input_obj, indent=indent, cls=CustomJSONEncoder)
+
+
+@pytest.mark.parametrize("indent", [None, 0, 4])
+def test_stream_json_with_iterators(indent: Optional[int]):
+    # given
+    records = [{"check_id": "CKV_AWS_1", "code_block": [[1, "line"]]}, {"check_id": "CKV_AWS_2"}]
+
+    # when
+    output = io.StringIO()
+    stream_json({"records": iter(records), "no_records": iter([])}, output, indent=indent)
+
+    # then
+    assert output.getvalue() == json.dumps({"records": records, "no_records": []}, indent=indent)
@@ -0,0 +1,144 @@
+import json
+import os
+
+import pytest
+
+from checkov.common.parallelizer.parallel_runner import ParallelRunner
+from checkov.common.util.profiler import Profiler, profiler, profiled, PARSE, PYTHON_CHECK, RUNNER
+
+
+@pytest.fixture
+def enabled_profiler():
+    profiler.enable()
+    yield profiler
+    profiler.disable()
+    profiler.reset()
+
+
+def test_disabled_profiler_records_nothing():
+    disabled_profiler = Profiler()
+
+    with disabled_profiler.phase("parse", PARSE):
+        pass
+    with disabled_profiler.measure(PYTHON_CHECK, "CKV_AWS_1", "/main.tf"):
+        pass
+
+    profile = disabled_profiler.to_json()
+    assert profile["phases"] == []
+    assert profile["checks"] == []
+    assert profile["directories"] == []
+
+
+def test_phases_per_runner(enabled_profiler):
+    @profiled(PARSE)
+    def parse():
+        pass
+
+    with enabled_profiler.runner_scope("terraform"):
+        parse()
+    parse()
+
+    profile = enabled_profiler.to_json()
+
+    assert [(phase["name"], phase["category"], phase["runner"]) for phase in profile["phases"]] == [
+        ("terraform", RUNNER, "terraform"),
+        ("test_phases_per_runner.<locals>.parse", PARSE, "terraform"),
+        ("test_phases_per_runner.<locals>.parse", PARSE, ""),
+    ]
+    assert set(profile["summary"]) == {"terraform", ""}
+    assert set(profile["summary"]["terraform"]) == {RUNNER, PARSE}
+
+
+def test_measurements_are_aggregated(enabled_profiler):
+    with enabled_profiler.runner_scope("terraform"):
+        for file_path in ("/main.tf", "/main.tf", "/module/main.tf"):
+            with enabled_profiler.measure(PYTHON_CHECK, "CKV_AWS_1", file_path):
+                pass
+        with enabled_profiler.measure(PYTHON_CHECK, "CKV_AWS_2", "/main.tf"):
+            pass
+
+    profile = enabled_profiler.to_json()
+
+    assert {check["id"]: check["count"] for check in profile["checks"]} == {"CKV_AWS_1": 3, "CKV_AWS_2": 1}
+    assert {directory["directory"]: directory["count"] for directory in profile["directories"]} == {
+        "/": 3,
+        "/module": 1,
+    }
+    # only the phases are recorded as events
+    assert [phase["category"] for phase in profile["phases"]] == [RUNNER]
+
+
+def test_measurements_of_forked_processes_are_merged(enabled_profiler):
+    def run(check_id):
+        with enabled_profiler.measure(PYTHON_CHECK, check_id, "/main.tf"):
+            return os.getpid()
+
+    with enabled_profiler.runner_scope("terraform"):
+        pids = list(
+            ParallelRunner(workers_number=2).run_function(run, ["CKV_AWS_1", "CKV_AWS_2", "CKV_AWS_1"], group_size=1, run_multiprocess=True)
+        )
+
+    assert os.getpid() not in pids
+    profile = enabled_profiler.to_json()
+    assert {(check["runner"], check["id"]): check["count"] for check in profile["checks"]} == {
+        ("terraform", "CKV_AWS_1"): 2,
+        ("terraform", "CKV_AWS_2"): 1,
+    }
+    # the runner phase of the parent process isn't reported again by the forked ones
+    assert len(profile["phases"]) == 1
+
+
+def test_memory_tracking():
+    memory_profiler = Profiler()
+    memory_profiler.enable(track_memory=True)
+    try:
+        with memory_profiler.phase("parse", PARSE):
+            data = [str(i) for i in range(10000)]
+    finally:
+        memory_profiler.disable()
+
+    assert data
+    assert memory_profiler.to_json()["phases"][0]["allocated_bytes"] > 0
+
+
+@pytest.mark.parametrize("profile_format", ["json", "chrome"])
+def test_write(enabled_profiler, tmp_path, profile_format):
+    with enabled_profiler.runner_scope("terraform"):
+        with enabled_profiler.measure(PYTHON_CHECK, "CKV_AWS_1", "/main.tf"):
+            pass
+
+    file_path = tmp_path / "profile.json"
+    enabled_profiler.write(str(file_path), profile_format)
+
+    profile = json.loads(file_path.read_text())
+    if profile_format == "chrome":
+        assert [event["ph"] for event in profile["traceEvents"]] == ["X", "M"]
+        assert profile["traceEvents"][0]["cat"] == RUNNER
+        assert profile["otherData"]["checks"][0]["id"] == "CKV_AWS_1"
+    else:
+        assert profile["phases"][0]["runner"] == "terraform"
+        assert profile["checks"][0]["id"] == "CKV_AWS_1"
+
+
+def test_slowest_entities():
+    entity_profiler = Profiler()
+    entity_profiler.enable(slowest_entities=2)
+    entity_profiler.runner = "terraform"
+    for entity, duration_ns in (("a", 1_000_000), ("b", 3_000_000), ("c", 2_000_000)):
+        entity_profiler._add_measurement(PYTHON_CHECK, "CKV_AWS_1", "/main.tf", entity, "aws_s3_bucket", duration_ns, 0)
+    entity_profiler.add_timeout(PYTHON_CHECK, "CKV_AWS_1")
+
+    profile = entity_profiler.to_json()
+
+    assert [(entity["entity"], entity["duration_ms"]) for entity in profile["slowest_entities"]] == [
+        ("aws_s3_bucket.b", 3.0),
+        ("aws_s3_bucket.c", 2.0),
+    ]
+    assert profile["checks"][0]["timeouts"] == 1
+    assert entity_profiler.get_slowest_checks_output(5) == (
+        "Slowest checks (top 5):\n"
+        "\tCKV_AWS_1 (terraform python check): 6.0 ms total, 3 runs, 3.0 ms max, 1 timed out\n"
+        "Slowest checks per entity (top 5):\n"
+        "\tCKV_AWS_1 on aws_s3_bucket.b in /main.tf (terraform): 3.0 ms\n"
+        "\tCKV_AWS_1 on aws_s3_bucket.c in /main.tf (terraform): 2.0 ms\n"
+    )
@@ -1,10 +1,14 @@
 import os
 import subprocess
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 
 from checkov.common.bridgecrew.severities import Severities, BcSeverities
 from checkov.common.output.report import CheckType
 from checkov.runner_filter import RunnerFilter
+from checkov.helm.render_cache import RenderCache
 from checkov.helm.runner import Runner
 
 
@@ -16,6 +20,53 @@ def helm_exists() -> bool:
     return True
 
 
+HELM_TEMPLATE_OUTPUT = b"""---
+# Source: pwnchart/templates/clusterrole.yaml
+apiVersion: rbac.authorization.k8s.io/v1
+kind: ClusterRole
+metadata:
+  name: all-your-base
+rules:
+  - apiGroups: ["*"]
+    resources: ["*"]
+    verbs: ["*"]
+---
+# Source: pwnchart/templates/clusterrolebinding.yaml
+apiVersion: rbac.authorization.k8s.io/v1
+kind: ClusterRoleBinding
+metadata:
+  name: belong-to-us
+roleRef:
+  apiGroup: rbac.authorization.k8s.io
+  kind: ClusterRole
+  name: all-your-base
+subjects:
+  - kind: ServiceAccount
+    namespace: default
+    name: default
+---
+# Source: pwnchart/templates/clusterrole.yaml
+apiVersion: rbac.authorization.k8s.io/v1
+kind: ClusterRole
+metadata:
+  name: all-your-base-2
+rules: []
+"""
+
+
+def mock_helm_popen(args, **kwargs):
+    outputs = {"template": HELM_TEMPLATE_OUTPUT, "version": b'version.BuildInfo{Version:"v3.9.0"}'}
+    proc = mock.Mock(returncode=0)
+    proc.communicate.return_value = (outputs.get(args[1], b""), b"")
+    return proc
+
+
+def mock_failing_helm_template_popen(args, **kwargs):
+    if args[1] == "template":
+        raise Exception("helm template shouldn't run")
+    return mock_helm_popen(args, **kwargs)
+
+
 class TestRunnerValid(unittest.TestCase):
     @unittest.skipIf(not helm_exists(), "helm not installed")
     def test_record_relative_path_with_relative_dir(self):
@@ -63,6 +114,154 @@ class TestRunnerValid(unittest.TestCase):
         self.assertEqual(len(report.skipped_checks), 0)
         self.assertEqual(len(report.parsing_errors), 0)
 
+    def test_parse_output(self):
+        definitions, definitions_raw = Runner()._parse_output("/target/infrastructure/helm-tiller", HELM_TEMPLATE_OUTPUT)
+
+        cluster_role_path = "/target/infrastructure/helm-tiller/pwnchart/templates/clusterrole.yaml"
+        cluster_role_binding_path = "/target/infrastructure/helm-tiller/pwnchart/templates/clusterrolebinding.yaml"
+        self.assertEqual(set(definitions), {cluster_role_path, cluster_role_binding_path})
+        # the documents of the same source are collected in one file
+        self.assertEqual(
+            [definition["metadata"]["name"] for definition in definitions[cluster_role_path]],
+            ["all-your-base", "all-your-base-2"],
+        )
+        self.assertEqual(definitions[cluster_role_binding_path][0]["kind"], "ClusterRoleBinding")
+        self.assertEqual(definitions[cluster_role_binding_path][0]["__startline__"], 3)
+        self.assertEqual(
+            [line for _, line in definitions_raw[cluster_role_binding_path][:2]],
+            ["---\n", "# Source: pwnchart/templates/clusterrolebinding.yaml\n"],
+        )
+
+    def test_parse_output_skips_files(self):
+        output = HELM_TEMPLATE_OUTPUT + b"""---
+# Source: pwnchart/templates/package.json
+{"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": "package"}}
+---
+# Source: pwnchart/templates/.hidden/pod.yaml
+apiVersion: v1
+kind: Pod
+metadata:
+  name: hidden
+"""
+        runner = Runner()
+        runner.runner_filter = RunnerFilter(excluded_paths=["templates/clusterrolebinding"])
+
+        definitions, _ = runner._parse_output("/target/infrastructure/helm-tiller", output)
+
+        self.assertEqual(set(definitions), {"/target/infrastructure/helm-tiller/pwnchart/templates/clusterrole.yaml"})
+
+    @mock.patch("checkov.helm.runner.subprocess.Popen", side_effect=mock_helm_popen)
+    def test_run_rendered_chart_with_skip_path(self, _):
+        current_dir = os.path.dirname(os.path.realpath(__file__))
+        scan_dir_path = os.path.join(current_dir, "runner", "resources")
+
+        report = Runner().run(
+            root_folder=scan_dir_path,
+            runner_filter=RunnerFilter(
+                framework=["helm"], checks=["CKV_K8S_42"], excluded_paths=["pwnchart/templates/clusterrolebinding.yaml"]
+            ),
+        )
+
+        self.assertEqual(len(report.failed_checks), 0)
+        for resource in report.resources:
+            self.assertNotIn("clusterrolebinding.yaml", resource)
+
+    @mock.patch("checkov.helm.runner.subprocess.Popen", side_effect=mock_helm_popen)
+    def test_run_rendered_chart_in_memory(self, _):
+        current_dir = os.path.dirname(os.path.realpath(__file__))
+        scan_dir_path = os.path.join(current_dir, "runner", "resources")
+
+        runner = Runner()
+        report = runner.run(
+            root_folder=scan_dir_path, runner_filter=RunnerFilter(framework=["helm"], checks=["CKV_K8S_42"])
+        )
+
+        # nothing is written to the target folder
+        self.assertFalse(os.path.exists(runner.get_k8s_target_folder_path()))
+        self.assertEqual(report.check_type, CheckType.HELM)
+        self.assertEqual(len(report.passed_checks), 0)
+        self.assertEqual(len(report.failed_checks), 1)
+        record = report.failed_checks[0]
+        self.assertEqual(record.file_path, "/infrastructure/helm-tiller/pwnchart/templates/clusterrolebinding.yaml")
+        self.assertEqual(record.file_abs_path, "/infrastructure/helm-tiller/pwnchart/templates/clusterrolebinding.yaml")
+        for resource in report.resources:
+            self.assertIn("/infrastructure/helm-tiller/pwnchart/templates", resource)
+
+    @mock.patch("checkov.helm.runner.subprocess.Popen", side_effect=mock_helm_popen)
+    def test_run_twice_with_same_runner(self, _):
+        current_dir = os.path.dirname(os.path.realpath(__file__))
+        scan_dir_path = os.path.join(current_dir, "runner", "resources")
+        runner = Runner()
+
+        first_report = runner.run(root_folder=scan_dir_path, runner_filter=RunnerFilter(framework=["helm"]))
+        second_report = runner.run(root_folder=scan_dir_path, runner_filter=RunnerFilter(framework=["helm"]))
+
+        self.assertGreater(len(first_report.failed_checks), 0)
+        self.assertEqual(len(second_report.failed_checks), len(first_report.failed_checks))
+        self.assertEqual(len(second_report.passed_checks), len(first_report.passed_checks))
+        self.assertEqual(second_report.resources, first_report.resources)
+
+    def test_render_cache_key(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            chart_dir = Path(tmp_dir) / "chart"
+            (chart_dir / "templates").mkdir(parents=True)
+            (chart_dir / "Chart.yaml").write_text("name: chart")
+            (chart_dir / "templates" / "pod.yaml").write_text("kind: Pod")
+            values_file = Path(tmp_dir) / "values.yaml"
+            values_file.write_text("replicas: 1")
+            render_cache = RenderCache(tmp_dir)
+
+            key = render_cache.get_key(str(chart_dir), [str(values_file)], "v3.9.0")
+
+            self.assertEqual(key, render_cache.get_key(str(chart_dir), [str(values_file)], "v3.9.0"))
+            self.assertNotEqual(key, render_cache.get_key(str(chart_dir), [str(values_file)], "v3.10.0"))
+            self.assertNotEqual(key, render_cache.get_key(str(chart_dir), None, "v3.9.0"))
+            values_file.write_text("replicas: 2")
+            self.assertNotEqual(key, render_cache.get_key(str(chart_dir), [str(values_file)], "v3.9.0"))
+            (chart_dir / "Chart.lock").write_text("dependencies: []")
+            self.assertNotEqual(key, render_cache.get_key(str(chart_dir), None, "v3.9.0"))
+
+    def test_render_cache_key_with_local_dependency(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            chart_dir = Path(tmp_dir) / "chart"
+            chart_dir.mkdir()
+            (chart_dir / "Chart.yaml").write_text(
+                "name: chart\ndependencies:\n  - name: common\n    repository: file://../common\n"
+            )
+            common_dir = Path(tmp_dir) / "common"
+            (common_dir / "templates").mkdir(parents=True)
+            (common_dir / "Chart.yaml").write_text("name: common")
+            (common_dir / "templates" / "pod.yaml").write_text("kind: Pod")
+            render_cache = RenderCache(tmp_dir)
+
+            key = render_cache.get_key(str(chart_dir), None, "v3.9.0")
+
+            self.assertEqual(key, render_cache.get_key(str(chart_dir), None, "v3.9.0"))
+            # the sibling chart is repackaged by helm on every run
+            (common_dir / "templates" / "pod.yaml").write_text("kind: Deployment")
+            self.assertNotEqual(key, render_cache.get_key(str(chart_dir), None, "v3.9.0"))
+
+    def test_run_with_render_cache(self):
+        current_dir = os.path.dirname(os.path.realpath(__file__))
+        scan_dir_path = os.path.join(current_dir, "runner", "resources")
+        runner_filter = RunnerFilter(framework=["helm"], checks=["CKV_K8S_42"])
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with mock.patch("checkov.helm.runner.render_cache", RenderCache(cache_dir)):
+                with mock.patch("checkov.helm.runner.subprocess.Popen", side_effect=mock_helm_popen):
+                    report = Runner().run(root_folder=scan_dir_path, runner_filter=runner_filter)
+                self.assertEqual(len(list(Path(cache_dir).glob("*/*.yaml.gz"))), 1)
+
+                # the second run uses the cached output instead of running helm template
+                with mock.patch("checkov.helm.runner.subprocess.Popen", side_effect=mock_failing_helm_template_popen):
+                    cached_report = Runner().run(root_folder=scan_dir_path, runner_filter=runner_filter)
+
+        self.assertEqual(len(report.failed_checks), 1)
+        self.assertEqual(
+            [(record.check_id, record.file_path) for record in cached_report.failed_checks],
+            [(record.check_id, record.file_path) for record in report.failed_checks],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
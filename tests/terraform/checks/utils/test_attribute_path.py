@@ -0,0 +1,83 @@
+import dpath
+import pytest
+
+from checkov.terraform.checks.utils.attribute_path import (
+    filter_key_path,
+    find_attribute_values,
+    get_path_value,
+    parse_key_path,
+)
+
+CONF = {
+    "name": ["bucket"],
+    "versioning": [{"enabled": [True]}],
+    "logging": [],
+    "rule": [{"apply": [{"kms_key_id": ["key-1"]}]}, {"apply": [{"kms_key_id": ["key-2"]}]}],
+    "dynamic": [{"setting": {"content": [{"enabled": [False]}]}}],
+    "+skipped": ["value"],
+    "tags": [{"0": "zero", "kubernetes.io/role": "role"}],
+}
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "name",
+        "name/[0]",
+        "versioning/[0]/enabled",
+        "versioning/0/enabled/[0]",
+        "versioning/[1]/enabled",
+        "versioning/[0]/disabled",
+        "logging/[0]",
+        "rule/[1]/apply/[0]/kms_key_id",
+        "tags/[0]/[0]",
+        "tags/[0]/kubernetes.io",
+        "name/[0]/[0]",
+        "+skipped",
+        "versioning/*/enabled",
+    ],
+)
+def test_get_path_value_same_as_dpath(path):
+    # given
+    expected_found = dpath.search(CONF, path) != {}
+    expected_value = dpath.get(CONF, path) if expected_found else None
+
+    # when
+    found, value = get_path_value(CONF, path)
+
+    # then
+    assert found == expected_found
+    assert value == expected_value
+
+
+def test_parse_key_path():
+    assert parse_key_path("versioning/[0]/enabled") == (("versioning", None), ("0", 0), ("enabled", None))
+    assert parse_key_path("versioning/*/enabled") is None
+    assert parse_key_path("versioning/[10]/enabled") is None
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "rule/apply/kms_key_id",
+        "versioning/[0]/enabled",
+        "dynamic/setting/content/enabled",
+        "apply/kms_key_id",
+        "tags/kubernetes.io/role",
+    ],
+)
+def test_find_attribute_values_same_as_dpath(path):
+    # given
+    attributes = filter_key_path(path)
+    expected = [
+        value
+        for attribute in reversed(attributes)
+        for key, value in dpath.search(CONF, f"**/{attribute}", yielded=True)
+        if filter_key_path(key) == attributes
+    ]
+
+    # when
+    values = list(find_attribute_values(CONF, attributes))
+
+    # then
+    assert sorted(map(str, values)) == sorted(map(str, expected))
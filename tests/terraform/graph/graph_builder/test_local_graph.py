@@ -1,4 +1,6 @@
 import os
+import shutil
+import tempfile
 from pathlib import Path
 from unittest import TestCase
 
@@ -322,3 +324,56 @@ class TestLocalGraph(TestCase):
         # Check they point to 2 different modules
         self.assertEqual(2, len(module_variable_edges))
         self.assertNotEqual(local_graph.vertices[module_variable_edges[0].origin], local_graph.vertices[module_variable_edges[1].origin])
+
+    def test_build_graph_incrementally(self):
+        for resources in ("render_from_module_vpc", "render_local_from_variable"):
+            with self.subTest(resources=resources), tempfile.TemporaryDirectory() as tmp_dir:
+                resources_dir = os.path.join(os.path.realpath(tmp_dir), resources)
+                shutil.copytree(os.path.join(TEST_DIRNAME, '../resources/variable_rendering', resources), resources_dir)
+                graph_manager = TerraformGraphManager(NetworkxConnector())
+                previous_graph, _ = graph_manager.build_graph_from_source_directory(resources_dir)
+
+                # serialize the previous graph like a previous scan would do
+                graph_file = os.path.join(tmp_dir, "graph.pkl")
+                graph_manager.dump_local_graph(previous_graph, graph_file)
+                previous_graph = graph_manager.load_local_graph(graph_file)
+
+                changed_file = os.path.join(resources_dir, "main.tf")
+                with open(changed_file, "a") as f:
+                    f.write('\nresource "aws_s3_bucket" "incremental" {\n  bucket = "incremental"\n}\n')
+
+                incremental_graph, _ = TerraformGraphManager(NetworkxConnector()).build_graph_from_source_directory(
+                    resources_dir, previous_local_graph=previous_graph, changed_files=[changed_file]
+                )
+                full_graph, _ = TerraformGraphManager(NetworkxConnector()).build_graph_from_source_directory(resources_dir)
+
+                self.assertEqual(
+                    full_graph.get_vertices_hash_codes_to_attributes_map(),
+                    incremental_graph.get_vertices_hash_codes_to_attributes_map(),
+                )
+                self.assertEqual(
+                    {(e.origin, e.dest, e.label) for e in full_graph.edges},
+                    {(e.origin, e.dest, e.label) for e in incremental_graph.edges},
+                )
+
+    def test_build_graph_incrementally_changed_variable(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            resources_dir = os.path.join(os.path.realpath(tmp_dir), "render_local_from_variable")
+            shutil.copytree(
+                os.path.join(TEST_DIRNAME, '../resources/variable_rendering/render_local_from_variable'), resources_dir
+            )
+            graph_manager = TerraformGraphManager(NetworkxConnector())
+            previous_graph, _ = graph_manager.build_graph_from_source_directory(resources_dir)
+
+            changed_file = os.path.join(resources_dir, "variables.tf")
+            with open(changed_file, "w") as f:
+                f.write('variable "var_bucket_name" {\n  default = "changed_bucket_name"\n}\n')
+
+            local_graph, _ = TerraformGraphManager(NetworkxConnector()).build_graph_from_source_directory(
+                resources_dir, previous_local_graph=previous_graph, changed_files=[changed_file]
+            )
+
+            locals_vertex = next(
+                v for v in local_graph.vertices if v.block_type == BlockType.LOCALS and v.name == "bucket_name"
+            )
+            self.assertEqual(["changed_bucket_name"], locals_vertex.attributes["bucket_name"])
@@ -0,0 +1,75 @@
+variable "name" {
+  default = "bucket"
+}
+
+locals {
+  name_0 = var.name
+  name_1 = local.name_0
+  name_2 = local.name_1
+  name_3 = local.name_2
+  name_4 = local.name_3
+  name_5 = local.name_4
+  name_6 = local.name_5
+  name_7 = local.name_6
+  name_8 = local.name_7
+  name_9 = local.name_8
+  name_10 = local.name_9
+  name_11 = local.name_10
+  name_12 = local.name_11
+  name_13 = local.name_12
+  name_14 = local.name_13
+  name_15 = local.name_14
+  name_16 = local.name_15
+  name_17 = local.name_16
+  name_18 = local.name_17
+  name_19 = local.name_18
+  name_20 = local.name_19
+  name_21 = local.name_20
+  name_22 = local.name_21
+  name_23 = local.name_22
+  name_24 = local.name_23
+  name_25 = local.name_24
+  name_26 = local.name_25
+  name_27 = local.name_26
+  name_28 = local.name_27
+  name_29 = local.name_28
+  name_30 = local.name_29
+  name_31 = local.name_30
+  name_32 = local.name_31
+  name_33 = local.name_32
+  name_34 = local.name_33
+  name_35 = local.name_34
+  name_36 = local.name_35
+  name_37 = local.name_36
+  name_38 = local.name_37
+  name_39 = local.name_38
+  name_40 = local.name_39
+  name_41 = local.name_40
+  name_42 = local.name_41
+  name_43 = local.name_42
+  name_44 = local.name_43
+  name_45 = local.name_44
+  name_46 = local.name_45
+  name_47 = local.name_46
+  name_48 = local.name_47
+  name_49 = local.name_48
+  name_50 = local.name_49
+  name_51 = local.name_50
+  name_52 = local.name_51
+  name_53 = local.name_52
+  name_54 = local.name_53
+  name_55 = local.name_54
+  name_56 = local.name_55
+  name_57 = local.name_56
+  name_58 = local.name_57
+  name_59 = local.name_58
+
+  # references each other
+  cycle_a = local.cycle_b
+  cycle_b = local.cycle_a
+}
+
+resource "aws_s3_bucket" "bucket" {
+  bucket = local.name_59
+  acl    = local.cycle_a
+}
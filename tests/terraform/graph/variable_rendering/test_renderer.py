@@ -210,3 +210,14 @@ class TestRenderer(TestCase):
         self.assertIsNone(TerraformVariableRenderer.get_default_placeholder_value('${number}'))
         self.assertIsNone(TerraformVariableRenderer.get_default_placeholder_value(None))
         self.assertIsNone(TerraformVariableRenderer.get_default_placeholder_value(123))
+
+    def test_render_long_reference_chain(self):
+        resources_dir = os.path.join(TEST_DIRNAME, '../resources/variable_rendering/render_long_reference_chain')
+        graph_manager = TerraformGraphManager('m', ['m'])
+        local_graph, _ = graph_manager.build_graph_from_source_directory(resources_dir, render_variables=True)
+
+        # the chain is longer than the max number of loops of the previous rendering
+        self.compare_vertex_attributes(local_graph, {'name_59': 'bucket'}, BlockType.LOCALS, 'name_59')
+        self.compare_vertex_attributes(
+            local_graph, {'bucket': 'bucket', 'acl': 'local.cycle_a'}, BlockType.RESOURCE, 'aws_s3_bucket.bucket'
+        )
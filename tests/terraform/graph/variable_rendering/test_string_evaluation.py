@@ -447,3 +447,14 @@ class TestTerraformEvaluation(TestCase):
         input_str = 'formatdate("HH \'Hours and \'M \'Minute(s)\'", "2018-01-02T23:12:01Z")'
         expected = "11 Hours and 1 Minute(s)"
         self.assertEqual(expected, evaluate_terraform(input_str))
+
+    def test_replace_string_value_keeps_original_list(self):
+        nested = ["${var.other}"]
+        original = ["${var.name}-suffix", nested]
+
+        replaced = replace_string_value(original, "var.name", "bucket")
+
+        self.assertEqual(["bucket-suffix", ["${var.other}"]], replaced)
+        self.assertEqual(["${var.name}-suffix", ["${var.other}"]], original)
+        # the unchanged items are shared and not copied
+        self.assertIs(nested, replaced[1])
@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from checkov.common.util.parser_utils import eval_string
+from checkov.terraform.parse_cache import ParseCache
 from checkov.terraform.parser import _load_or_die_quietly
 
 
@@ -54,3 +55,50 @@ def test__load_or_die_quietly_without_bom():
             }
         ]
     }
+
+
+def test__load_or_die_quietly_with_parse_cache(tmp_path: Path, mocker):
+    # given
+    test_file = Path(__file__).parent / "resources/file_bom/without_bom.tf"
+    cache = ParseCache(cache_dir=str(tmp_path))
+    mocker.patch("checkov.terraform.parser.parse_cache", cache)
+    expected = {
+        "resource": [
+            {
+                "aws_s3_bucket": {
+                    "example": {"bucket": ["example"], "__start_line__": 1, "__end_line__": 3},
+                },
+            }
+        ]
+    }
+
+    # when
+    first_definition = _load_or_die_quietly(file=test_file, parsing_errors={})
+    hcl2_load_mock = mocker.patch("checkov.terraform.parser.hcl2.load")
+    second_definition = _load_or_die_quietly(file=test_file, parsing_errors={})
+
+    # then
+    assert first_definition == expected
+    assert second_definition == expected
+    hcl2_load_mock.assert_not_called()
+    assert len(list(tmp_path.glob("*/*.json.gz"))) == 1
+
+
+def test__load_or_die_quietly_with_parse_cache_per_loader(tmp_path: Path, mocker):
+    # given
+    cache = ParseCache(cache_dir=str(tmp_path / "cache"))
+    mocker.patch("checkov.terraform.parser.parse_cache", cache)
+    tf_file = tmp_path / "empty.tf"
+    tf_file.write_text("")
+    json_file = tmp_path / "empty.tf.json"
+    json_file.write_text("")
+    parsing_errors = {}
+
+    # when
+    tf_definition = _load_or_die_quietly(file=tf_file, parsing_errors=parsing_errors)
+    json_definition = _load_or_die_quietly(file=json_file, parsing_errors=parsing_errors)
+
+    # then
+    assert tf_definition == {}
+    assert json_definition is None
+    assert list(parsing_errors) == [str(json_file)]
@@ -1,6 +1,10 @@
 import os
+import tempfile
 import unittest
-from checkov.terraform.plan_parser import parse_tf_plan
+from pathlib import Path
+
+from checkov.terraform.plan_parser import parse_tf_plan, _parse_tf_plan_template
+from checkov.terraform.plan_reader import TfPlanReader
 from checkov.common.parsers.node import StrNode
 
 class TestPlanFileParser(unittest.TestCase):
@@ -48,5 +52,80 @@ class TestPlanFileParser(unittest.TestCase):
             self.assertEqual(list(tf_definition['resource'][0].keys())[0], "aws_s3_bucket")
 
 
+    def test_streamed_plan_matches_yaml_loader(self):
+        current_dir = Path(__file__).parent
+        plan_paths = [
+            current_dir / "resources/plan_tags/tfplan.json",
+            current_dir / "resources/plan_booleans/tfplan.json",
+            current_dir.parent / "runner/resources/plan_nested_child_modules/tfplan.json",
+            current_dir.parent / "runner/resources/plan_with_child_modules/tfplan.json",
+        ]
+
+        for plan_path in plan_paths:
+            tf_definition, template_lines = parse_tf_plan(str(plan_path), {})
+            expected_tf_definition, expected_template_lines = _parse_tf_plan_template(str(plan_path), {})
+
+            self.assertEqual(tf_definition, expected_tf_definition)
+            self.assertEqual(template_lines, expected_template_lines)
+
+    def test_reader_resource_order_and_marks(self):
+        content = """{
+  "terraform_version": "1.0.0",
+  "planned_values": {
+    "root_module": {
+      "child_modules": [
+        {
+          "resources": [{"address": "module.a.aws_s3_bucket.b", "values": {"bucket": "b"}}],
+          "address": "module.a",
+          "child_modules": [
+            {"address": "module.a.module.b", "resources": [{"address": "module.a.module.b.aws_s3_bucket.c"}]}
+          ]
+        }
+      ],
+      "resources": [{"address": "aws_s3_bucket.a"}]
+    }
+  },
+  "prior_state": {"values": {"root_module": {}}}
+}"""
+        reader = TfPlanReader(content)
+
+        self.assertTrue(reader.read_sections())
+        resources = list(reader.iter_planned_resources())
+
+        self.assertEqual(
+            [
+                ("", "aws_s3_bucket.a"),
+                ("module.a.module.b", "module.a.module.b.aws_s3_bucket.c"),
+                ("module.a", "module.a.aws_s3_bucket.b"),
+            ],
+            [(module_address, resource["address"]) for module_address, resource in resources],
+        )
+        values = resources[2][1]["values"]
+        self.assertEqual(6, values.start_mark.line)
+        self.assertEqual(6, values["__startline__"] - 1)
+        self.assertIsInstance(values["bucket"], StrNode)
+
+    def test_non_json_plan_falls_back_to_yaml_loader(self):
+        content = """terraform_version: 1.0.0
+planned_values:
+  root_module:
+    resources:
+      - address: aws_s3_bucket.b
+        mode: managed
+        type: aws_s3_bucket
+        name: b
+        values:
+          bucket: example
+"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            plan_path = os.path.join(temp_dir, "tfplan.json")
+            with open(plan_path, "w") as f:
+                f.write(content)
+
+            tf_definition, _ = parse_tf_plan(plan_path, {})
+
+        self.assertEqual(["example"], tf_definition["resource"][0]["aws_s3_bucket"]["b"]["bucket"])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,7 @@
 import inspect
 import os
 import shutil
+import tempfile
 import unittest
 import dis
 from collections import defaultdict
@@ -21,6 +22,7 @@ from checkov.common.util.consts import DEFAULT_EXTERNAL_MODULES_DIR
 from checkov.runner_filter import RunnerFilter
 from checkov.terraform.checks.resource.base_resource_check import BaseResourceCheck
 from checkov.terraform.context_parsers.registry import parser_registry
+from checkov.terraform.graph_builder.local_graph import TerraformLocalGraph
 from checkov.terraform.parser import Parser
 from checkov.terraform.runner import Runner
 from checkov.terraform.checks.resource.registry import resource_registry
@@ -1500,6 +1502,65 @@ class TestRunnerValid(unittest.TestCase):
         all_checks = report.failed_checks + report.passed_checks
         self.assertTrue(any(c.check_id == custom_check_id for c in all_checks))
 
+    def test_runner_with_tf_graph_dump_path(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root_folder = os.path.join(os.path.realpath(tmp_dir), "src")
+            os.makedirs(root_folder)
+            with open(os.path.join(root_folder, "main.tf"), "w") as f:
+                f.write(
+                    'resource "aws_s3_bucket" "bucket" {\n  bucket = local.bucket_name\n}\n\n'
+                    'locals {\n  bucket_name = var.bucket_name\n}\n'
+                )
+            variables_file = os.path.join(root_folder, "variables.tf")
+            with open(variables_file, "w") as f:
+                f.write('variable "bucket_name" {\n  default = "first"\n}\n')
+            dump_path = os.path.join(tmp_dir, "graph.pkl")
+            runner_filter = RunnerFilter(framework=["terraform"], tf_graph_dump_path=dump_path)
+
+            def run_with_spy(runner_filter):
+                runner = Runner()
+                with mock.patch.object(
+                    TerraformLocalGraph,
+                    "build_graph_incrementally",
+                    autospec=True,
+                    side_effect=TerraformLocalGraph.build_graph_incrementally,
+                ) as build_graph_incrementally:
+                    report = runner.run(root_folder=root_folder, runner_filter=runner_filter)
+                return runner, report, build_graph_incrementally
+
+            # the first scan builds the whole graph and dumps it
+            _, _, build_graph_incrementally = run_with_spy(runner_filter)
+            build_graph_incrementally.assert_not_called()
+            self.assertTrue(os.path.isfile(dump_path))
+
+            # the second scan reuses the graph and only rebuilds the changed file
+            with open(variables_file, "w") as f:
+                f.write('variable "bucket_name" {\n  default = "second"\n}\n')
+            runner, report, build_graph_incrementally = run_with_spy(runner_filter)
+            build_graph_incrementally.assert_called_once()
+            self.assertEqual([variables_file], build_graph_incrementally.call_args.kwargs["changed_files"])
+
+            full_runner = Runner()
+            full_report = full_runner.run(root_folder=root_folder, runner_filter=RunnerFilter(framework=["terraform"]))
+            self.assertEqual(full_runner.definitions, runner.definitions)
+            self.assertEqual(
+                sorted((r.check_id, r.check_result["result"]) for r in full_report.failed_checks + full_report.passed_checks),
+                sorted((r.check_id, r.check_result["result"]) for r in report.failed_checks + report.passed_checks),
+            )
+
+            # changed variables files are not linked to vertices, therefore the whole graph is built
+            with open(os.path.join(root_folder, "terraform.tfvars"), "w") as f:
+                f.write('bucket_name = "third"\n')
+            _, _, build_graph_incrementally = run_with_spy(runner_filter)
+            build_graph_incrementally.assert_not_called()
+
+            # an unreadable dump is ignored as well
+            with open(dump_path, "w") as f:
+                f.write("invalid")
+            _, report, build_graph_incrementally = run_with_spy(runner_filter)
+            build_graph_incrementally.assert_not_called()
+            self.assertEqual(len(full_report.failed_checks), len(report.failed_checks))
+
     def tearDown(self):
         parser_registry.context = {}
         resource_registry.checks = self.orig_checks